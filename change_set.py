@@ -0,0 +1,120 @@
+import pandas as pd
+
+from request_index import canonical_req_no
+
+# ==========================================
+# [ChangeSet] 로드/저장 후 바뀐 내용
+# ==========================================
+# 로드나 트랜잭션이 끝날 때마다 이전 Data/Memos 프레임과 새 프레임을 요청번호 기준으로 비교하여
+# 추가/삭제/수정된 요청과 바뀐 컬럼을 모은다. 뷰는 DataManager.subscribe()로 받아
+# 영향을 받은 요청의 카드/셀/행만 다시 그린다. (요청번호는 canonical_req_no로 정규화된 문자열)
+
+
+class ChangeSet:
+    def __init__(self, added=(), removed=(), modified=None, memos=(), sheets=(), full=False):
+        self.added = set(added)
+        self.removed = set(removed)
+        self.modified = {req_no: set(columns) for req_no, columns in (modified or {}).items()}  # 요청번호 → 바뀐 컬럼
+        self.memos = set(memos)      # 메모가 추가/삭제/수정된 요청번호 (미확인 메모 표시용)
+        self.sheets = set(sheets)    # 다시 읽거나 저장한 프레임 키 (df / memo / log / memo_log / serial)
+        self.full = full             # 비교 기준이 없음 → 전체 다시 그리기
+
+    @classmethod
+    def everything(cls, sheets=()):
+        return cls(sheets=sheets, full=True)
+
+    @property
+    def requests(self):
+        """추가/삭제/수정된 요청번호 전체"""
+        return self.added | self.removed | set(self.modified)
+
+    @property
+    def columns(self):
+        """수정된 요청에서 바뀐 컬럼 전체"""
+        changed = set()
+        for columns in self.modified.values():
+            changed |= columns
+        return changed
+
+    def __bool__(self):
+        return bool(self.full or self.added or self.removed or self.modified or self.memos or self.sheets)
+
+    def __repr__(self):
+        if self.full:
+            return f"ChangeSet(full, sheets={sorted(self.sheets)})"
+        return (f"ChangeSet(added={sorted(self.added)}, removed={sorted(self.removed)}, "
+                f"modified={ {k: sorted(v) for k, v in self.modified.items()} }, memos={sorted(self.memos)})")
+
+
+def _keyed(frame, key_column):
+    """(요청번호, 요청 내 순서) MultiIndex를 붙인 프레임"""
+    keys = frame[key_column].map(canonical_req_no)
+    ordinals = keys.groupby(keys.values).cumcount()
+    return frame.set_axis(pd.MultiIndex.from_arrays([keys.values, ordinals.values]), axis=0)
+
+
+def _comparable(frame):
+    """값 비교용 프레임 (범주형은 범주 목록이 달라도 비교할 수 있도록 일반 값으로, Int64는 빈 값을 NaN으로)"""
+    converted = {}
+    for column, dtype in frame.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            converted[column] = object
+        elif isinstance(dtype, pd.Int64Dtype):
+            converted[column] = "float64"
+    return frame.astype(converted) if converted else frame
+
+
+def diff_requests(old, new, key_column="번호"):
+    """(추가된 번호, 삭제된 번호, {수정된 번호: 바뀐 컬럼 집합})
+
+    같은 요청의 품목은 요청 내 순서끼리 비교하며, 품목 수가 달라진 요청은 모든 컬럼이 바뀐 것으로 본다.
+    """
+    if old is new or (old.shape == new.shape and list(old.columns) == list(new.columns) and old.equals(new)):
+        return set(), set(), {}
+    if key_column not in old.columns or key_column not in new.columns:
+        return set(), set(), {}
+
+    old_keyed = _keyed(old, key_column)
+    new_keyed = _keyed(new, key_column)
+    old_nos = set(old_keyed.index.get_level_values(0))
+    new_nos = set(new_keyed.index.get_level_values(0))
+    added = new_nos - old_nos
+    removed = old_nos - new_nos
+
+    columns = [c for c in new.columns if c in old.columns]
+    modified = {}
+
+    # 품목이 추가/삭제된 요청
+    for req_no, _ordinal in old_keyed.index.symmetric_difference(new_keyed.index):
+        if req_no in old_nos and req_no in new_nos:
+            modified[req_no] = set(columns)
+
+    common = old_keyed.index.intersection(new_keyed.index)
+    if len(common):
+        before = _comparable(old_keyed.loc[common, columns])
+        after = _comparable(new_keyed.loc[common, columns])
+        changed = (before != after) & ~(before.isna() & after.isna())
+        changed = changed[changed.any(axis=1)]
+        if not changed.empty:
+            for req_no, flags in changed.groupby(level=0).any().iterrows():
+                modified.setdefault(req_no, set()).update(c for c, flag in flags.items() if flag)
+    return added, removed, modified
+
+
+def compute_change_set(old_df, new_df, old_memo, new_memo, sheets=()):
+    """이전/새 Data·Memos 프레임으로 ChangeSet 생성 (이전 Data가 비어 있으면 전체 변경)
+
+    sheets: 다시 읽거나 저장한 지연 로드 시트 키 (log / memo_log / serial)
+    """
+    if old_df is None or old_df.empty:
+        return ChangeSet.everything(sheets)
+    added, removed, modified = diff_requests(old_df, new_df)
+    memo_added, memo_removed, memo_modified = diff_requests(old_memo, new_memo)
+    memos = memo_added | memo_removed | set(memo_modified)
+    # Data / Memos는 실제로 바뀐 경우에만 포함
+    changed_sheets = set(sheets) - {"df", "memo"}
+    if added or removed or modified:
+        changed_sheets.add("df")
+    if memos:
+        changed_sheets.add("memo")
+    return ChangeSet(added, removed, modified, memos, changed_sheets)
@@ -19,6 +19,8 @@ class Config:
             print(f"설정 폴더 생성 실패: {e}")
 
     CONFIG_FILENAME = os.path.join(APP_DIR, "config.json")
+    # [신규] 오프라인 작업 대기열 (APP_DIR 안, JSON Lines)
+    OFFLINE_JOURNAL_FILENAME = "offline_journal.jsonl"
     APP_VERSION = "1.3.9" # 버전 업 (Dev Mode 추가)
     
     # [보안] 개발자 모드 비밀번호 (실무에 맞게 변경하세요)
@@ -36,6 +38,27 @@ class Config:
         except OSError:
             pass 
 
+    # [신규] 저장소 백엔드 ("excel": 공유 xlsx 직접 사용 / "sqlite": 내장 DB + 엑셀 내보내기)
+    STORAGE_BACKENDS = ("excel", "sqlite")
+    DEFAULT_STORAGE_BACKEND = "excel"
+    # [수정] 기본은 DELETE (공유 폴더의 DB에서도 안전). WAL은 로컬 DB에서만 config.json으로 선택
+    DEFAULT_SQLITE_JOURNAL_MODE = "DELETE"
+    SQLITE_INDEX_COLUMNS = ["번호", "요청번호"]
+    DEFAULT_EXPORT_INTERVAL_MIN = 0  # SQLite 사용 시 엑셀 자동 내보내기 주기 (0 = 사용 안 함)
+    # [신규] 엑셀 저장 잠금 파일 (만료 시간 / 다른 사용자가 저장 중일 때 최대 대기 시간, 초)
+    WRITE_LEASE_TTL_SEC = 60
+    WRITE_LEASE_WAIT_SEC = 20
+    # [신규] 지연 저장: 드래그 등 연속 수정을 모아 한 번에 저장하기까지 대기 시간(초)
+    WRITE_BEHIND_SEC = 1.0
+    # [신규] 종료 시 남은 저장을 기다리는 시간(초) — 넘으면 계속 기다릴지 강제 종료할지 확인
+    EXIT_SAVE_WAIT_SEC = 30
+    EXIT_POLL_MS = 200
+
+    # [신규] 엑셀 읽기 엔진 ("auto": calamine → stream → openpyxl 순서로 사용 가능한 것 사용)
+    DEFAULT_EXCEL_READER = "auto"
+    # [신규] 병렬 로드 (워크북을 한 번 읽고 시트별로 작업 프로세스에서 파싱, 전체 시트를 한 번에 로드)
+    DEFAULT_PARALLEL_LOAD = False
+
     # ---------------------------------------------------------
     # [시트 및 컬럼 설정]
     # ---------------------------------------------------------
@@ -47,13 +70,39 @@ class Config:
     SHEET_MEMO_LOG = "Memo Log"
     SHEET_SERIAL = "Serial_Data" 
 
+    # [신규] 내부 프레임 키 → 시트 이름 (트랜잭션 dfs 키와 동일)
+    SHEET_KEYS = {
+        "df": SHEET_DATA,
+        "log": SHEET_LOG,
+        "memo": SHEET_MEMO,
+        "memo_log": SHEET_MEMO_LOG,
+        "serial": SHEET_SERIAL,
+    }
+
+    # [신규] 대시보드 '최근 활동'용으로 Memo Log 끝에서 읽어 둘 행 수 (Memo Log 전체는 필요할 때만 읽음)
+    MEMO_LOG_TAIL_ROWS = 50
+
+    # [신규] 요청번호 색인을 유지하는 프레임 키 → 요청번호 컬럼
+    REQ_NO_COLUMNS = {
+        "df": "번호",
+        "memo": "번호",
+        "serial": "요청번호",
+    }
+
     # 엑셀 헤더 정의 (Data 시트)
     COLUMNS = [
         "번호", "업체명", "모델명", "상세", "수량", 
         "기타요청사항", "업체별 특이사항", "출고요청일", 
         "출고예정일", "출고일", "시리얼번호", "렌즈업체", 
-        "생산팀 메모", "Status", "파일경로", "대기사유"
+        "생산팀 메모", "Status", "파일경로", "대기사유",
+        "버전"
     ]
+    # [신규] 행 버전 (수정될 때마다 1씩 증가, 다른 사용자와의 충돌 감지용)
+    VERSION_COLUMN = "버전"
+    # [신규] Data 시트 메모리 스키마 (frame_schema) — 범주형 / 날짜(datetime64) / 정수(Int64) 컬럼
+    CATEGORY_COLUMNS = ["Status", "업체명", "모델명", "렌즈업체"]
+    DATE_COLUMNS = ["출고요청일", "출고예정일", "출고일"]
+    INT_COLUMNS = ["수량"]
     
     # [신규] 시리얼 데이터 시트 헤더
     SERIAL_COLUMNS = ["요청번호", "순번", "모델명", "시리얼번호", "렌즈업체", "비고"]
@@ -63,6 +112,15 @@ class Config:
     MEMO_COLUMNS = ["번호", "일시", "작업자", "PC정보", "내용", "확인"]
     MEMO_LOG_COLUMNS = ["일시", "작업자", "구분", "요청번호", "내용"]
 
+    # [신규] 프레임 키 → 시트 헤더 (전체 저장 시 이 순서로 헤더를 씀)
+    SHEET_COLUMNS = {
+        "df": COLUMNS,
+        "log": LOG_COLUMNS,
+        "memo": MEMO_COLUMNS,
+        "memo_log": MEMO_LOG_COLUMNS,
+        "serial": SERIAL_COLUMNS,
+    }
+
     # 화면 표시 설정
     DISPLAY_COLUMNS = [
         "번호", "업체명", "모델명", "상세", "수량", 
@@ -3,113 +3,1203 @@ import json
 import os
 import platform
 import shutil
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 
 import pandas as pd
 
+from change_set import ChangeSet, compute_change_set, diff_requests
 from config import Config
+from frame_schema import apply_schema, coerce_value, contains, display_text, parse_date, storage_values, to_storage
+from io_executor import IOExecutor
+from request_index import RequestIndex, canonical_req_no
+from storage import (ExcelStorage, FrameDiff, JournalBusyError, OfflineJournal, SqliteStorage,
+                     StorageBusyError, WriteLease, diff_frames, load_snapshot,
+                     save_snapshot, write_excel_file)
 
 
-class DataManager:
+def _filter_rows(frame, rows, column, value):
+    """행 위치들 중 column 값이 value인 것만 (색인 조회 결과를 추가 조건으로 좁힐 때)"""
+    if not rows or column not in frame.columns:
+        return ()
+    values = frame[column]
+    return tuple(r for r in rows if values.iat[r] == value)
+
+
+def _max_version(rows):
+    """행들의 최대 버전 (버전이 없으면 0)"""
+    if rows.empty or Config.VERSION_COLUMN not in rows.columns:
+        return 0
+    versions = pd.to_numeric(rows[Config.VERSION_COLUMN], errors="coerce").dropna()
+    return int(versions.max()) if not versions.empty else 0
+
+
+def _as_text(series):
+    """컬럼 값 비교용 문자열 목록 (날짜 등은 저장소 값 기준 → 오프라인 대기열에 기록한 값과 비교 가능)"""
+    return [str(v).strip() for v in storage_values(series).fillna("-").tolist()]
+
+
+def _same_values(left, right):
+    """두 컬럼 값이 (문자열로 보아) 모두 같은지"""
+    return _as_text(left) == _as_text(right)
+
+
+def _fold(frame, buffer):
+    """append 전용 시트 프레임 + 추가 버퍼 행 (버퍼가 비어 있으면 프레임 그대로)"""
+    if not buffer:
+        return frame
+    return pd.concat([frame, pd.DataFrame(buffer, columns=frame.columns)], ignore_index=True)
+
+
+def _date_error(values):
+    """{컬럼: 값} 중 날짜 컬럼(Config.DATE_COLUMNS)에 날짜가 아닌 값이 있으면 오류 메시지, 없으면 None"""
+    for column, value in values.items():
+        if column in Config.DATE_COLUMNS:
+            try:
+                parse_date(value)
+            except ValueError as e:
+                return f"{column}: {e}"
+    return None
+
+
+def _remove_attachment(content):
+    """메모 내용의 '(경로: ...)' 줄에 적힌 첨부 파일 삭제"""
+    for line in content.split('\n'):
+        line = line.strip()
+        if line.startswith("(경로:") and line.endswith(")"):
+            file_path = line[5:-1].strip()
+            if file_path and os.path.exists(file_path):
+                os.remove(file_path)
+            break
+
+
+class _StorageUnavailable(Exception):
+    """오프라인 작업 반영 중 저장소에 다시 연결할 수 없거나 일시적으로 저장할 수 없게 된 경우 (남은 작업은 다음에 반영)"""
+
+
+class _MemoryState:
+    """메모리 상태 묶음 (Data / Memos / 지연 로드 시트 / 색인 / 데이터 버전)
+
+    게시된 상태(DataManager._state)는 제자리에서 고치지 않는다. 작업자 스레드는 _updating_state 구간에서
+    사본을 고친 뒤 참조 하나만 바꾸므로, UI 스레드는 참조를 한 번 읽어 서로 맞는 프레임과 색인을 함께 쓴다.
+    """
+
     def __init__(self):
         self.df = pd.DataFrame()
-        self.log_df = pd.DataFrame(columns=Config.LOG_COLUMNS) 
         self.memo_df = pd.DataFrame(columns=Config.MEMO_COLUMNS)
-        self.memo_log_df = pd.DataFrame(columns=Config.MEMO_LOG_COLUMNS)
-        self.serial_df = pd.DataFrame(columns=Config.SERIAL_COLUMNS)
+        # 마지막으로 파일과 일치했던 Data 프레임 (부분 저장 시 비교 기준)
+        self.persisted_df = self.df.copy()
+        # 요청번호 → 행 위치 색인 (Data / Memos / Serial_Data)
+        self.req_index = {}
+        # 지연 로드 시트 프레임 (None: 아직 읽지 않음) / Log·Memo Log 추가 버퍼
+        self.lazy_frames = {}
+        self.append_buffers = {}
+        # Memo Log 끝부분 (대시보드 '최근 활동'용, Memo Log 전체를 읽지 않은 경우 사용)
+        self.memo_log_tail = pd.DataFrame(columns=Config.MEMO_LOG_COLUMNS)
+        # 데이터 버전 (로드/저장으로 메모리 프레임이 바뀔 때마다 증가 → 파생 캐시 무효화)
+        self.data_version = 0
+
+    def copy(self):
+        """수정용 사본 (프레임은 교체만 되므로 참조 공유, 색인/프레임/버퍼 목록은 새로 만듦)"""
+        state = _MemoryState.__new__(_MemoryState)
+        state.__dict__.update(self.__dict__)
+        state.req_index = dict(self.req_index)
+        state.lazy_frames = dict(self.lazy_frames)
+        state.append_buffers = {key: list(rows) for key, rows in self.append_buffers.items()}
+        return state
+
+
+class _PendingWrite:
+    """지연 저장 대기 작업 (로직, 오프라인 대기열용 (메서드 이름, 인자), 완료 콜백)"""
+
+    def __init__(self, logic, journal, callback):
+        self.logic = logic
+        self.journal = journal
+        self.callback = callback
+
+
+class _TransactionFrames(dict):
+    """트랜잭션 작업용 프레임 묶음
+
+    Log / Memo Log / Serial_Data 프레임은 로직이 실제로 접근할 때만 준비하고,
+    새 로그는 appends 버퍼에 모아 시트 끝에 추가만 한다.
+    Data / Memos / Serial_Data는 요청번호 색인(indexes)을 함께 들고 다니며
+    행 삭제/추가는 drop_rows / append_rows로 해야 색인이 유지된다.
+    """
+
+    def __init__(self, loader, index_loader, **frames):
+        super().__init__(**frames)
+        self._loader = loader
+        self._index_loader = index_loader
+        self.indexes = {}
+        self.appends = {"log": [], "memo_log": []}
+        # [신규] 프레임 키 → 로직이 조회하거나 추가한 요청번호 (행 버전 갱신 / 충돌 확인 대상)
+        self.requests = {}
+        # [신규] {요청번호: 바뀐 컬럼} (로직 실행 후 _stamp_versions가 채움)
+        self.changes = {}
+        # [신규] 저장에 성공한 뒤에만 실행할 작업 (첨부 파일 삭제 등 되돌릴 수 없는 작업)
+        # 로직은 충돌 / 지연 저장 / 오프라인 반영 때 다시 실행되므로 로직 안에서 바로 실행하면 안 됨
+        self.after_commit = []
+
+    def __missing__(self, key):
+        frame = self._loader(key)
+        self[key] = frame
+        return frame
+
+    def index(self, key):
+        """요청번호 색인 (처음 사용할 때 프레임을 준비하고 현재 색인을 복사)"""
+        if key not in self.indexes:
+            self[key]
+            self.indexes[key] = self._index_loader(key)
+        return self.indexes[key]
+
+    def rows(self, key, req_no):
+        """요청번호의 행 위치 tuple"""
+        self.requests.setdefault(key, set()).add(canonical_req_no(req_no))
+        return self.index(key).rows(req_no)
+
+    def set_values(self, key, rows, values):
+        """행 위치들에 {컬럼: 값} 대입 (값은 컬럼 타입에 맞춰 변환, 범주형에 없는 값은 범주 추가)"""
+        frame = self[key]
+        for column, value in values.items():
+            series = frame[column]
+            value = coerce_value(series, value)
+            if isinstance(series.dtype, pd.CategoricalDtype) and not pd.isna(value) and value not in series.cat.categories:
+                frame[column] = series.cat.add_categories([value])
+            frame.iloc[list(rows), frame.columns.get_loc(column)] = value
+
+    def drop_rows(self, key, rows):
+        if not rows:
+            return
+        frame = self[key]
+        index = self.index(key)
+        self[key] = frame.drop(frame.index[list(rows)])
+        index.remove(rows)
+
+    def append_rows(self, key, records):
+        new_frame = pd.DataFrame(records)
+        index = self.index(key)
+        self[key] = pd.concat([self[key], new_frame], ignore_index=True)
+        column = Config.REQ_NO_COLUMNS[key]
+        values = new_frame[column].tolist() if column in new_frame.columns else [None] * len(new_frame)
+        index.append(values)
+        self.requests.setdefault(key, set()).update(canonical_req_no(v) for v in values)
+
+
+class DataManager:
+    # [신규] 오프라인 대기열에 기록하거나 일괄 처리(execute_batch)할 수 있는 작업 → 표시 이름
+    OPERATION_LABELS = {
+        "update_production_schedule": "일정 수립",
+        "update_status_to_hold": "중지 설정",
+        "update_status_to_waiting": "대기 설정",
+        "update_expected_date": "일정 변경",
+        "finalize_production": "생산 완료",
+        "update_status_resume": "생산 재개",
+        "add_memo": "메모 추가",
+        "update_memo_check": "메모 확인",
+        "delete_memo": "메모 삭제",
+        "update_serial_list": "시리얼 수정",
+    }
+    # [신규] append 전용 시트 (새 행은 버퍼에 모았다가 필요할 때만 프레임에 합침)
+    APPEND_ONLY_KEYS = ("log", "memo_log")
+    # [신규] 처음 접근할 때 읽는 시트 (Data / Memos만 load_data에서 바로 읽고, 나머지는 로드 후 작업자 스레드에서 미리 읽음)
+    LAZY_KEYS = ("log", "memo_log", "serial")
+
+    def __init__(self):
+        # [수정] 메모리 상태는 _MemoryState 하나로 묶어 참조 교체로만 갱신 (UI 스레드와 작업자 스레드 경합 방지)
+        self._state = _MemoryState()
+        self._staging = threading.local()  # 작업자 스레드가 고치는 중인 사본 (_updating_state)
+        with self._updating_state():
+            self.log_df = pd.DataFrame(columns=Config.LOG_COLUMNS)
+            self.memo_log_df = pd.DataFrame(columns=Config.MEMO_LOG_COLUMNS)
+            self.serial_df = pd.DataFrame(columns=Config.SERIAL_COLUMNS)
+            self._rebuild_indexes()
+        self._memo_count_cache = (None, {})
         
         self.current_excel_path = Config.DEFAULT_EXCEL_PATH
         self.current_theme = "Dark"  
         self.attachment_dir = Config.DEFAULT_ATTACHMENT_DIR 
         
         self.is_dev_mode = False
+
+        # [신규] 저장소 백엔드 설정 (config.json에서 선택)
+        self.storage_backend = Config.DEFAULT_STORAGE_BACKEND
+        self.sqlite_path = ""
+        self.sqlite_journal_mode = Config.DEFAULT_SQLITE_JOURNAL_MODE
+        self.export_interval_min = Config.DEFAULT_EXPORT_INTERVAL_MIN
+        self.excel_reader = Config.DEFAULT_EXCEL_READER
+        self.parallel_load = Config.DEFAULT_PARALLEL_LOAD
+        self.last_export_time = None
+        self.last_export_signature = None
         
-        # [신규] 파일 변경 감지를 위한 타임스탬프 저장 변수
-        self.last_file_timestamp = 0.0
+        # [신규] 파일 변경 감지를 위한 시그니처 (엑셀: (mtime, size) / SQLite: (리비전,))
+        self.last_file_signature = None
+        # [신규] 마지막으로 읽은 시점의 시트별 지문 (저장소 경로, {프레임 키: 지문})
+        self._sheet_fingerprints = None
+        # [신규] 변경 내용(ChangeSet) 구독자
+        self._observers = []
+        # [신규] 지연 저장 (작업자 스레드에서만 접근)
+        self._pending_writes = []   # 메모리에만 반영하고 아직 저장하지 않은 작업 (_PendingWrite)
+        self._committed = None      # 그 작업들을 반영하기 전 상태 (_memory_state)
+        self._deferred = None       # write_behind 실행 중 붙잡은 (로직, journal) 목록
+        self._collected = None      # execute_batch 실행 중 붙잡은 (로직, journal) 목록 (메모리 반영 없음)
+        self._flush_timer = None
+        self._preload_scheduled = False  # 지연 로드 시트 미리 읽기 작업을 제출했는지 (작업자 스레드에서만 접근)
+        # [신규] 오프라인 작업 대기열 / 반영 상태 (None: 일반, "replay": 반영 중, "reapply": 화면에 임시 반영)
+        self.journal = OfflineJournal(os.path.join(Config.APP_DIR, Config.OFFLINE_JOURNAL_FILENAME))
+        self._journal_mode = None
+        self._replay_read = None
+        self.on_journal_change = None  # (대기 작업 수, 반영 결과 보고) — UI 스레드에서 호출
         
         self.load_config()
 
+        # [신규] 파일 I/O 전용 작업자 (UI 스레드가 네트워크 드라이브를 기다리지 않도록)
+        self.io = IOExecutor()
+
     def set_dev_mode(self, enabled: bool):
         self.is_dev_mode = enabled
 
     # ---------------------------------------------------------
-    # [핵심] 트랜잭션 처리 (동시성 제어)
+    # [신규] 변경 알림 (로드/트랜잭션마다 ChangeSet 전달)
     # ---------------------------------------------------------
-    def _execute_transaction(self, update_logic_func):
-        if not os.path.exists(self.current_excel_path):
-            return False, "엑셀 파일이 존재하지 않습니다."
+    def subscribe(self, observer):
+        """observer(change_set)를 등록 (UI 스레드에서 호출됨)"""
+        if observer not in self._observers:
+            self._observers.append(observer)
+        return observer
+
+    def unsubscribe(self, observer):
+        if observer in self._observers:
+            self._observers.remove(observer)
 
+    def _publish(self, change_set):
+        if not change_set:
+            return
+        for observer in list(self._observers):
+            self.io.call_soon(observer, change_set)
+
+    def _publish_changes(self, before, sheets=()):
+        """before: 변경 전 (Data, Memos) 프레임 — 현재 프레임과 비교하여 ChangeSet 전달"""
+        if not self._observers:
+            return
         try:
-            # 1. 최신 상태 읽기
-            with pd.ExcelFile(self.current_excel_path) as xls:
-                # Data 시트
-                if Config.SHEET_DATA in xls.sheet_names:
-                    temp_df = pd.read_excel(xls, Config.SHEET_DATA)
-                else:
-                    temp_df = pd.read_excel(xls, 0)
-                
-                # Log 시트
-                if Config.SHEET_LOG in xls.sheet_names:
-                    temp_log = pd.read_excel(xls, Config.SHEET_LOG)
-                else:
-                    temp_log = pd.DataFrame(columns=Config.LOG_COLUMNS)
-                
-                # Memo 시트
-                if Config.SHEET_MEMO in xls.sheet_names:
-                    temp_memo = pd.read_excel(xls, Config.SHEET_MEMO)
-                else:
-                    temp_memo = pd.DataFrame(columns=Config.MEMO_COLUMNS)
-                
-                # Memo Log 시트
-                if Config.SHEET_MEMO_LOG in xls.sheet_names:
-                    temp_memo_log = pd.read_excel(xls, Config.SHEET_MEMO_LOG)
-                else:
-                    temp_memo_log = pd.DataFrame(columns=Config.MEMO_LOG_COLUMNS)
-                
-                # Serial 시트
-                if Config.SHEET_SERIAL in xls.sheet_names:
-                    temp_serial = pd.read_excel(xls, Config.SHEET_SERIAL)
-                    if not temp_serial.empty:
-                        temp_serial["요청번호"] = temp_serial["요청번호"].astype(str)
-                else:
-                    temp_serial = pd.DataFrame(columns=Config.SERIAL_COLUMNS)
+            change_set = compute_change_set(before[0], self.df, before[1], self.memo_df, sheets)
+        except Exception as e:
+            print(f"변경 내용 계산 실패, 전체 갱신: {e}")
+            change_set = ChangeSet.everything(sheets)
+        self._publish(change_set)
 
-            # 전처리
-            for col in Config.COLUMNS:
-                if col not in temp_df.columns: temp_df[col] = '-'
-            temp_df = temp_df.fillna('-')
-            
-            # 2. 수정 로직 실행
-            dfs = {
-                "df": temp_df, 
-                "log": temp_log, 
-                "memo": temp_memo, 
-                "memo_log": temp_memo_log, 
-                "serial": temp_serial
-            }
-            
-            success, msg = update_logic_func(dfs)
-            
-            if not success:
+    def _frames_before_change(self):
+        """변경 전 비교 기준 (화면에서 df를 직접 고친 경우도 있으므로 Data는 마지막 저장/로드 상태 사용)"""
+        return self._persisted_df, self.memo_df
+
+    # ---------------------------------------------------------
+    # [신규] 메모리 상태 (_MemoryState) 접근 / 교체
+    # ---------------------------------------------------------
+    # 아래 속성은 현재 스레드가 고치는 중인 사본이 있으면 그 사본을, 없으면 게시된 상태를 가리킨다.
+    # 여러 값을 함께 바꾸는 곳(로드 / 저장 결과 채택 등)은 _updating_state 구간 안에서 바꾸고 끝에 한 번에 교체한다.
+    def _current(self):
+        staged = getattr(self._staging, "state", None)
+        return staged if staged is not None else self._state
+
+    @contextmanager
+    def _updating_state(self):
+        """메모리 상태 변경 구간: 사본을 고친 뒤 끝날 때 참조 하나로 교체 (예외가 나면 버림, 중첩 시 바깥 구간에서 교체)"""
+        if getattr(self._staging, "state", None) is not None:
+            yield
+            return
+        self._staging.state = self._state.copy()
+        try:
+            yield
+            self._state = self._staging.state
+        finally:
+            self._staging.state = None
+
+    def _assign_state(self, name, value):
+        staged = getattr(self._staging, "state", None)
+        if staged is not None:
+            setattr(staged, name, value)
+            return
+        state = self._state.copy()
+        setattr(state, name, value)
+        self._state = state
+
+    @property
+    def df(self):
+        return self._current().df
+
+    @df.setter
+    def df(self, frame):
+        self._assign_state("df", frame)
+
+    @property
+    def memo_df(self):
+        return self._current().memo_df
+
+    @memo_df.setter
+    def memo_df(self, frame):
+        self._assign_state("memo_df", frame)
+
+    @property
+    def _persisted_df(self):
+        return self._current().persisted_df
+
+    @_persisted_df.setter
+    def _persisted_df(self, frame):
+        self._assign_state("persisted_df", frame)
+
+    @property
+    def _memo_log_tail(self):
+        return self._current().memo_log_tail
+
+    @_memo_log_tail.setter
+    def _memo_log_tail(self, frame):
+        self._assign_state("memo_log_tail", frame)
+
+    @property
+    def data_version(self):
+        return self._current().data_version
+
+    @data_version.setter
+    def data_version(self, version):
+        self._assign_state("data_version", version)
+
+    # 색인 / 지연 로드 프레임 / 추가 버퍼는 제자리에서 고치므로 _updating_state 구간 안에서만 수정
+    @property
+    def req_index(self):
+        return self._current().req_index
+
+    @property
+    def _lazy_frames(self):
+        return self._current().lazy_frames
+
+    @property
+    def _append_buffers(self):
+        return self._current().append_buffers
+
+    # ---------------------------------------------------------
+    # [신규] 지연 로드 시트 (Log / Memo Log / Serial_Data)
+    # Log / Memo Log 버퍼는 파일에는 이미 기록됨, 메모리 프레임에는 조회 시 합침
+    # [수정] 저장소 읽기는 IOExecutor 작업자 스레드에서만 (로드 후 preload_lazy_sheets로 미리 읽고,
+    #        UI에서 필요한 조회(get_serial_list 등)는 run_async로 실행)
+    # ---------------------------------------------------------
+    @property
+    def serial_df(self):
+        return self._lazy_frame("serial")
+
+    @serial_df.setter
+    def serial_df(self, frame):
+        with self._updating_state():
+            self._lazy_frames["serial"] = frame
+
+    @property
+    def log_df(self):
+        return self._folded_frame("log")
+
+    @log_df.setter
+    def log_df(self, frame):
+        self._set_append_only_frame("log", frame)
+
+    @property
+    def memo_log_df(self):
+        return self._folded_frame("memo_log")
+
+    @memo_log_df.setter
+    def memo_log_df(self, frame):
+        self._set_append_only_frame("memo_log", frame)
+
+    def _set_append_only_frame(self, key, frame):
+        with self._updating_state():
+            self._lazy_frames[key] = frame
+            self._append_buffers[key] = []
+
+    def _folded_frame(self, key):
+        """프레임 + 추가 버퍼를 합친 사본 ([수정] 메모리 상태는 바꾸지 않음 → UI 스레드에서도 호출 가능)"""
+        state = self._current()
+        frame = state.lazy_frames.get(key)
+        if frame is None:
+            frame = self._lazy_frame(key)
+            state = self._current()
+        return _fold(frame, state.append_buffers[key])
+
+    def _lazy_frame(self, key):
+        """지연 로드 시트 프레임 (아직 읽지 않았으면 저장소에서 읽음 → 작업자 스레드에서만 호출)"""
+        frame = self._lazy_frames[key]
+        if frame is None:
+            sheet = self.storage.read_sheet(Config.SHEET_KEYS[key]) if self.storage.exists() else None
+            frame = self._install_lazy_frame(key, sheet)
+        return frame
+
+    def _install_lazy_frame(self, key, sheet):
+        """저장소에서 읽은 시트를 지연 로드 프레임으로 채택 (프레임과 색인을 함께 교체)"""
+        frame = self._prepare_lazy_frame(key, sheet)
+        index = RequestIndex.from_frame(frame, Config.REQ_NO_COLUMNS[key]) if key in Config.REQ_NO_COLUMNS else None
+        with self._updating_state():
+            self._lazy_frames[key] = frame
+            # 파일에서 새로 읽었으므로 이미 기록된 추가 행은 프레임에 포함됨
+            if key in self.APPEND_ONLY_KEYS:
+                self._append_buffers[key] = []
+            if index is not None:
+                self.req_index[key] = index
+        return frame
+
+    def _prepare_lazy_frame(self, key, frame):
+        """지연 로드 시트 전처리 (시트가 없거나 비어 있으면 기본 컬럼의 빈 프레임)"""
+        columns = Config.SHEET_COLUMNS[key]
+        if frame is None or (frame.empty and key != "log"):
+            return pd.DataFrame(columns=columns)
+        if key == "serial":
+            frame["요청번호"] = frame["요청번호"].astype(str)
+            frame = frame.fillna("-")
+        return frame
+
+    def _schedule_preload(self):
+        """아직 읽지 않은 지연 로드 시트가 있으면 미리 읽기 작업을 작업자 스레드에 제출 (현재 작업 다음에 실행)"""
+        if self._preload_scheduled or all(self._lazy_frames[key] is not None for key in self.LAZY_KEYS):
+            return
+        self._preload_scheduled = True
+        self.io.submit(self.preload_lazy_sheets, label="")
+
+    def preload_lazy_sheets(self):
+        """읽지 않은 지연 로드 시트를 읽어 둠 (UI 스레드의 조회가 저장소를 기다리지 않도록)"""
+        self._preload_scheduled = False
+        if not self.storage.exists():
+            return False, ""
+        try:
+            for key in self.LAZY_KEYS:
+                if self._lazy_frames[key] is None:
+                    self._lazy_frame(key)
+        except Exception as e:
+            print(f"지연 로드 시트 읽기 실패: {e}")
+            return False, str(e)
+        return True, ""
+
+    def _unload_lazy_frames(self):
+        """지연 로드 시트를 '읽지 않음' 상태로 (다시 로드할 때)"""
+        with self._updating_state():
+            for key in self.LAZY_KEYS:
+                self._unload_lazy_frame(key)
+
+    def _unload_lazy_frame(self, key):
+        with self._updating_state():
+            self._lazy_frames[key] = None
+            self.req_index.pop(key, None)
+            if key in self.APPEND_ONLY_KEYS:
+                self._append_buffers[key] = []
+
+    def _append_layout(self, key):
+        """(컬럼, 파일에 기록된 행 수) — 시트를 읽지 않았으면 저장소에서 헤더/행 수만 확인"""
+        frame = self._lazy_frames[key]
+        if frame is not None:
+            return frame.columns, len(frame) + len(self._append_buffers[key])
+        layout = self.storage.sheet_layout(Config.SHEET_KEYS[key])
+        if not layout or not layout[0]:
+            return self._prepare_lazy_frame(key, None).columns, layout[1] if layout else 0
+        return layout
+
+    def _append_log(self, dfs, action, details):
+        """Log 시트 끝에 추가할 항목 등록"""
+        dfs.appends["log"].append(self._create_log_entry(action, details))
+
+    def _append_memo_log(self, dfs, action, req_no, content, timestamp=None, user=None):
+        """Memo Log 시트 끝에 추가할 항목 등록"""
+        if user is None:
+            try: user = getpass.getuser()
+            except: user = "Unknown"
+        dfs.appends["memo_log"].append({
+            "일시": timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "작업자": user,
+            "구분": action,
+            "요청번호": str(req_no),
+            "내용": content
+        })
+
+    # ---------------------------------------------------------
+    # [핵심] 트랜잭션 처리 (동시성 제어)
+    # ---------------------------------------------------------
+    def _execute_transaction(self, update_logic_func, journal=None, base=None):
+        """update_logic_func(dfs)를 최신 데이터에 적용하여 저장
+
+        journal: (메서드 이름, 인자 목록) — 지정하면 공유 폴더에 연결할 수 없을 때
+                 메모리에만 반영하고 오프라인 대기열에 기록한 뒤 연결되면 다시 실행한다.
+        base: 로직을 실행할 기준 상태 (지연 저장 반영 시 화면에만 반영된 변경을 제외한 상태)
+        """
+        # [신규] 일괄 처리 / 지연 저장(write_behind) 중: 로직만 모아서 나중에 한 번에 저장
+        if self._collected is not None:
+            self._collected.append((update_logic_func, journal))
+            return True, ""
+        if self._deferred is not None:
+            return self._apply_deferred(update_logic_func, journal)
+        if self._pending_writes:
+            self.flush_writes()
+
+        # [신규] 오프라인 대기열 처리 (대기 중인 작업보다 먼저 저장되지 않도록 순서 유지)
+        if self._journal_mode == "reapply":
+            return self._apply_offline(update_logic_func, None)
+        if self._journal_mode is None and self.journal.pending(self.storage.path):
+            if journal:
+                return self._apply_offline(update_logic_func, journal)
+            self.replay_journal()
+            if self.journal.pending(self.storage.path):
+                return False, "오프라인 상태에서 한 작업이 아직 반영되지 않았습니다.\n네트워크 연결이 복구된 뒤 다시 시도해주세요."
+
+        if not self.storage.exists():
+            return self._storage_unavailable(update_logic_func, journal)
+
+        try:
+            # 1. 수정 로직 실행 (메모리 프레임의 사본 위에서 실행, 바뀐 요청의 행 버전 +1)
+            base = base or self._memory_state()
+            base_df, base_index = base["df"], base["indexes"].get("df")
+            dfs, msg = self._run_logic(update_logic_func, base)
+            if dfs is None:
                 return False, msg
 
-            # 3. 파일 저장
-            with pd.ExcelWriter(self.current_excel_path, engine="openpyxl") as writer:
-                dfs["df"].to_excel(writer, sheet_name=Config.SHEET_DATA, index=False)
-                dfs["log"].to_excel(writer, sheet_name=Config.SHEET_LOG, index=False)
-                dfs["memo"].to_excel(writer, sheet_name=Config.SHEET_MEMO, index=False)
-                dfs["memo_log"].to_excel(writer, sheet_name=Config.SHEET_MEMO_LOG, index=False)
-                dfs["serial"].to_excel(writer, sheet_name=Config.SHEET_SERIAL, index=False)
+            # [수정] 저장소 쓰기 구간 — 다른 클라이언트는 끝날 때까지 대기
+            # (엑셀: 잠금 파일 / SQLite: BEGIN IMMEDIATE 잠금, 최신 확인 → 저장 동안만 잡음)
+            with self.storage.begin():
+                # 2. [수정] 마지막 로드 이후 다른 사용자가 저장했으면 바뀐 시트만 다시 읽고
+                #    내가 바꾼 필드를 상대도 다른 값으로 바꾼 경우에만 충돌로 처리, 아니면 최신 데이터 위에서 다시 실행
+                if self._get_file_signature() != self.last_file_signature:
+                    success, msg = self.reload_changed_sheets()
+                    if not success:
+                        if not self.storage.exists() or self._journal_mode == "replay":
+                            return self._storage_unavailable(update_logic_func, journal)
+                        return False, f"최신 데이터를 읽지 못했습니다: {msg}"
+                    conflicts = self._find_conflicts(base_df, base_index, dfs)
+                    if conflicts:
+                        return False, self._conflict_message(conflicts)
+                    base = self._memory_state()
+                    dfs, msg = self._run_logic(update_logic_func, base)
+                    if dfs is None:
+                        return False, msg
+
+                # [신규] 오프라인 작업 반영 시: 기록할 때 읽었던 값과 비교
+                if self._journal_mode == "replay":
+                    conflicts = self._find_replay_conflicts(dfs)
+                    if conflicts:
+                        return False, self._conflict_message(conflicts)
 
-            # 4. 내 메모리 갱신 (여기서 timestamp도 최신화됨)
-            self.load_data() 
+                # 3. 저장
+                self._write_workbook(dfs, base)
+                new_signature = self._get_file_signature()
+                new_fingerprints = self._get_sheet_fingerprints()
+
+            # 4. 내 메모리 갱신 (다시 읽지 않고 방금 저장한 프레임을 그대로 채택)
+            before = self._frames_before_change()
+            self._adopt_frames(dfs)
+            self.last_file_signature = new_signature
+            self._sheet_fingerprints = new_fingerprints
+            self._publish_changes(before, self._touched_lazy_keys(dfs))
+            self._run_after_commit(dfs)
             return True, "저장되었습니다."
 
-        except PermissionError:
+        # [수정] 오프라인 작업 반영 중의 일시적인 저장 실패(파일 열림 / 다른 사용자 저장 중 / 입출력 오류)는
+        #        작업을 버리지 않고 대기열에 남겨 다음에 다시 반영
+        except PermissionError as e:
+            if self._journal_mode == "replay":
+                raise _StorageUnavailable(str(e))
             return False, "엑셀 파일이 현재 열려있어 저장할 수 없습니다.\n파일을 닫거나 잠시 후 다시 시도해주세요."
+        except StorageBusyError as e:
+            if self._journal_mode == "replay":
+                raise _StorageUnavailable(str(e))
+            return False, f"다른 사용자가 저장 중입니다. ({e})\n잠시 후 다시 시도해주세요."
+        except OSError as e:
+            # 저장 도중 공유 폴더 연결이 끊긴 경우
+            if not self.storage.exists() or self._journal_mode == "replay":
+                return self._storage_unavailable(update_logic_func, journal)
+            return False, f"트랜잭션 저장 중 오류 발생: {e}"
         except Exception as e:
             return False, f"트랜잭션 저장 중 오류 발생: {e}"
 
+    def _run_after_commit(self, dfs):
+        for action in dfs.after_commit:
+            try:
+                action()
+            except Exception as e:
+                print(f"저장 후 작업 실패: {e}")
+
+    def _storage_unavailable(self, update_logic_func, journal):
+        """저장소에 연결할 수 없을 때: 대기열 대상 작업은 오프라인으로 처리"""
+        if self._journal_mode == "replay":
+            raise _StorageUnavailable(self.storage.path)
+        if journal and self.last_file_signature is not None:
+            return self._apply_offline(update_logic_func, journal)
+        return False, "데이터 파일이 존재하지 않습니다."
+
+    def _run_logic(self, update_logic_func, base=None):
+        """현재 메모리 프레임(base: _memory_state 기준 상태) 사본에 로직 실행 → (dfs, "") 또는 (None, 실패 메시지)"""
+        base = base or self._memory_state()
+        dfs = self._new_transaction_frames(base)
+        success, msg = update_logic_func(dfs)
+        if not success:
+            return None, msg
+        dfs.changes = self._stamp_versions(dfs, base)
+        return dfs, ""
+
+    # ---------------------------------------------------------
+    # [신규] 낙관적 동시성 (행 버전)
+    # ---------------------------------------------------------
+    # Data 행마다 버전(Config.VERSION_COLUMN)을 두고, 트랜잭션에서 바뀐 요청의 행은 버전을 1 올린다.
+    # 저장 직전에 저장소가 바뀌어 있으면, 내가 읽은 버전과 최신 버전이 다른 요청만 필드 단위로 비교한다.
+    # (버전을 남기지 않는 이전 버전 프로그램의 저장은 충돌 없이 최신 데이터 위에서 다시 실행됨)
+    def _request_frame(self, frame, index, req_no):
+        """요청번호의 Data 행들 (색인 기준)"""
+        rows = index.rows(req_no) if index is not None else ()
+        return frame.iloc[list(rows)]
+
+    def _stamp_versions(self, dfs, base):
+        """로직이 바꾼 요청의 행 버전을 올리고 {요청번호: 바뀐 컬럼} 반환 (추가/삭제된 요청은 전체 컬럼)"""
+        req_nos = dfs.requests.get("df")
+        if not req_nos:
+            return {}
+        base_df, base_index = base["df"], base["indexes"].get("df")
+        new_index = dfs.index("df")
+        before = pd.concat([self._request_frame(base_df, base_index, r) for r in req_nos])
+        after = pd.concat([self._request_frame(dfs["df"], new_index, r) for r in req_nos])
+        added, removed, modified = diff_requests(before, after)
+
+        changes = dict(modified)
+        for req_no in added | removed:
+            changes[req_no] = set(Config.COLUMNS)
+        for req_no in added | set(modified):
+            rows = new_index.rows(req_no)
+            version = max(_max_version(self._request_frame(base_df, base_index, req_no)), _max_version(dfs["df"].iloc[list(rows)]))
+            dfs.set_values("df", rows, {Config.VERSION_COLUMN: version + 1})
+        return changes
+
+    def _find_conflicts(self, base_df, base_index, dfs):
+        """{요청번호: 충돌 컬럼} — 내가 읽은 뒤 다른 사용자가 같은 필드를 다른 값으로 바꾼 요청"""
+        conflicts = {}
+        fresh_index = self.req_index.get("df")
+        our_index = dfs.index("df")
+        for req_no, columns in dfs.changes.items():
+            base = self._request_frame(base_df, base_index, req_no)
+            fresh = self._request_frame(self.df, fresh_index, req_no)
+            if len(base) == len(fresh) and _max_version(base) == _max_version(fresh):
+                continue
+            if base.empty or fresh.empty:
+                # 한쪽에서 새로 추가했거나 삭제한 요청
+                conflicts[req_no] = {"번호"}
+                continue
+            _, _, theirs = diff_requests(base, fresh)
+            overlap = (columns & theirs.get(req_no, set())) - {Config.VERSION_COLUMN}
+            if not overlap:
+                continue
+            ours = self._request_frame(dfs["df"], our_index, req_no)
+            if len(ours) != len(fresh):
+                conflicts[req_no] = overlap
+                continue
+            # 상대도 같은 값으로 바꿨다면 충돌 아님
+            differs = {c for c in overlap if not _same_values(ours[c], fresh[c])}
+            if differs:
+                conflicts[req_no] = differs
+        return conflicts
+
+    def _conflict_message(self, conflicts):
+        lines = [f"번호[{req_no}] {', '.join(sorted(columns))}" for req_no, columns in sorted(conflicts.items())]
+        return ("다른 사용자가 같은 항목을 먼저 수정했습니다.\n" + "\n".join(lines)
+                + "\n\n최신 데이터를 불러왔으니 확인 후 다시 시도해주세요.")
+
+    # ---------------------------------------------------------
+    # [신규] 오프라인 작업 대기열
+    # ---------------------------------------------------------
+    # 공유 폴더에 연결할 수 없으면 작업을 메모리 프레임에만 반영하고(Data / Memos / Serial_Data, 로그 제외)
+    # (메서드 이름, 인자, 그때 읽은 값)을 로컬 대기열에 기록한다. 연결이 돌아오면 replay_journal이
+    # 저장소를 다시 읽고 기록 순서대로 같은 메서드를 트랜잭션으로 다시 실행한다.
+    # 기록할 때 읽은 값을 다른 사용자가 다른 값으로 바꿨으면 그 작업은 충돌로 알리고 버린다.
+    def _apply_offline(self, update_logic_func, journal):
+        try:
+            dfs, msg = self._run_logic(update_logic_func)
+        except Exception as e:
+            # 아직 읽지 않은 시트가 필요한 작업 등
+            return False, f"네트워크에 연결할 수 없어 처리하지 못했습니다: {e}"
+        if dfs is None:
+            return False, msg
+
+        if journal:
+            op, args = journal
+            self.journal.append(self.storage.path, op, args, read=self._read_values(dfs), label=self._operation_label(op, args))
+
+        self._adopt_unsaved(dfs)
+        if self._journal_mode is None:
+            self._notify_journal()
+            # 연결은 되어 있고 앞선 작업만 남아 있는 경우 → 바로 반영
+            if self.storage.exists():
+                success, msg = self.replay_journal()
+                if not self.journal.pending(self.storage.path):
+                    return success, msg or "저장되었습니다."
+        return True, "네트워크에 연결할 수 없어 이 PC에 임시 저장했습니다.\n연결되면 자동으로 반영됩니다."
+
+    def _adopt_unsaved(self, dfs):
+        """저장하지 않은 작업 결과를 메모리에만 반영하고 변경 알림 (_persisted_df는 저장소 기준 그대로 유지)"""
+        before = self._frames_before_change()
+
+        def as_reloaded(frame):
+            return frame.mask(frame == "").reset_index(drop=True)
+
+        with self._updating_state():
+            self.df = as_reloaded(dfs["df"])
+            self.memo_df = as_reloaded(dfs["memo"])
+            if "serial" in dfs:
+                self.serial_df = self._prepare_lazy_frame("serial", as_reloaded(dfs["serial"]))
+            self._preprocess_data()
+            self._adopt_indexes(dfs.indexes)
+            self.data_version += 1
+        self._publish_changes(before, [key for key in self._touched_lazy_keys(dfs) if key in dfs])
+
+    def _read_values(self, dfs):
+        """{요청번호: {컬럼: [값]}} — 작업이 바꾼 필드의 (작업 전) 현재 값"""
+        read = {}
+        index = self.req_index.get("df")
+        for req_no, columns in dfs.changes.items():
+            rows = self._request_frame(self.df, index, req_no)
+            read[req_no] = {c: _as_text(rows[c]) for c in columns if c in rows.columns and c != Config.VERSION_COLUMN}
+        return read
+
+    def _find_replay_conflicts(self, dfs):
+        """오프라인 작업 반영 시 충돌: 기록할 때 읽은 값이 바뀌었고 내 값과도 다른 필드"""
+        conflicts = {}
+        fresh_index = self.req_index.get("df")
+        our_index = dfs.index("df")
+        for req_no, columns in dfs.changes.items():
+            read = self._replay_read.get(req_no)
+            if not read:
+                continue
+            fresh = self._request_frame(self.df, fresh_index, req_no)
+            ours = self._request_frame(dfs["df"], our_index, req_no)
+            differs = {
+                c for c in columns & set(read)
+                if _as_text(fresh[c]) != read[c] and _as_text(ours[c]) != _as_text(fresh[c])
+            }
+            if differs:
+                conflicts[req_no] = differs
+        return conflicts
+
+    def _operation_label(self, op, args):
+        return f"{self.OPERATION_LABELS.get(op, op)} - 번호[{args[0] if args else ''}]"
+
+    def _notify_journal(self, report=""):
+        """대기 작업 수 / 반영 결과를 UI에 전달 (on_journal_change(대기 수, 보고 문자열))"""
+        if self.on_journal_change:
+            self.io.call_soon(self.on_journal_change, self.journal.pending(self.storage.path), report)
+
+    def pending_journal_count(self):
+        return self.journal.pending(self.storage.path)
+
+    def replay_journal(self):
+        """대기 중인 오프라인 작업을 기록 순서대로 저장소에 반영
+
+        (True, "") 모두 반영 / (False, 보고) 일부 작업 충돌·실패 / (False, "") 아직 연결되지 않음
+        """
+        if not self.journal.pending(self.storage.path):
+            return True, ""
+        if not self.storage.exists():
+            return False, ""
+        # [수정] 같은 PC의 다른 프로그램과 같은 작업을 두 번 반영하지 않도록 반영하는 동안 대기열 독점
+        try:
+            with self.journal.exclusive(wait=0):
+                return self._replay_entries(self.journal.entries(self.storage.path))
+        except JournalBusyError:
+            print("다른 프로그램에서 오프라인 작업을 반영 중입니다.")
+            return False, ""
+
+    def _replay_entries(self, entries):
+        if not entries:
+            # 다른 프로그램이 먼저 반영함 → 화면에만 반영해 둔 내용 대신 저장된 데이터를 다시 읽음
+            success, _ = self.load_data()
+            self._notify_journal()
+            return success, ""
+
+        # 메모리의 임시 반영분은 버리고 저장소 기준으로 다시 실행
+        success, msg = self.load_data()
+        if not success:
+            return False, ""
+        print(f"오프라인 작업 {len(entries)}건 반영 시작")
+
+        failures = []
+        remaining = []
+        self._journal_mode = "replay"
+        try:
+            for i, entry in enumerate(entries):
+                self._replay_read = entry.get("read") or {}
+                try:
+                    ok, msg = getattr(self, entry["op"])(*entry["args"])
+                except _StorageUnavailable as e:
+                    # 다시 연결이 끊겼거나 파일이 열려 있음 / 다른 사용자가 저장 중 → 이 작업부터 다음 기회에
+                    print(f"오프라인 작업 반영 보류 ({len(entries) - i}건): {e}")
+                    remaining = entries[i:]
+                    break
+                except Exception as e:
+                    ok, msg = False, str(e)
+                # 로직 실패 / 필드 충돌만 보고 후 대기열에서 제거
+                if not ok:
+                    failures.append(f"• {entry.get('label', entry['op'])} ({entry.get('time', '')})\n  {msg}")
+                self.journal.remove(entry["id"])
+        finally:
+            self._journal_mode = None
+            self._replay_read = None
+
+        # 반영하지 못한 작업은 화면에 다시 임시 반영
+        if remaining:
+            self._journal_mode = "reapply"
+            try:
+                for entry in remaining:
+                    try:
+                        getattr(self, entry["op"])(*entry["args"])
+                    except Exception as e:
+                        print(f"오프라인 작업 임시 반영 실패: {e}")
+            finally:
+                self._journal_mode = None
+
+        report = ""
+        if failures:
+            report = "오프라인 상태에서 한 작업 중 일부를 반영하지 못했습니다.\n\n" + "\n".join(failures)
+        self._notify_journal(report)
+        if failures:
+            return False, report
+        return (not remaining), ""
+
+    # ---------------------------------------------------------
+    # [신규] 지연 저장 (write-behind)
+    # ---------------------------------------------------------
+    # 드래그처럼 짧은 시간에 이어지는 수정은 하나씩 저장하지 않고 메모리(화면)에 먼저 반영한 뒤
+    # Config.WRITE_BEHIND_SEC 동안 모아서 한 번의 트랜잭션으로 저장한다.
+    # - 반영 / 저장 모두 작업자 스레드(IOExecutor)에서 순서대로 실행되므로 메모리 상태를 바꾸는 곳은 하나뿐이다
+    # - 저장할 때는 모아 둔 작업을 반영하기 전 상태(_committed) 위에서 로직을 다시 실행하므로
+    #   최신 확인 / 충돌 검사 / 행 버전은 일반 저장과 같다
+    # - 결과는 작업마다 callback(success, msg)으로 UI 스레드에 전달, 저장에 실패하면 화면도 되돌린다
+    def write_behind(self, func, *args, callback=None):
+        """트랜잭션 메서드 func(*args)를 메모리에 바로 반영하고 저장은 모아서 나중에 실행"""
+        self.io.submit(self._defer, func, args, callback, label="")
+
+    def request_flush(self):
+        """모아 둔 작업을 바로 저장하도록 예약 (종료 시 등)"""
+        self.io.submit(self.flush_writes, label="저장 중...")
+
+    def _defer(self, func, args, callback):
+        self._deferred = []
+        try:
+            success, msg = func(*args)
+        except Exception as e:
+            success, msg = False, f"작업 중 오류 발생: {e}"
+        finally:
+            captured, self._deferred = self._deferred, None
+
+        if not success or not captured:
+            self._deliver(callback, success, msg)
+            return
+        for i, (logic, journal) in enumerate(captured):
+            self._pending_writes.append(_PendingWrite(logic, journal, callback if i == len(captured) - 1 else None))
+        if self._flush_timer is None:
+            # 타이머 스레드 → UI 스레드 → 작업자 큐 순서로 넘겨 저장 예약
+            self._flush_timer = threading.Timer(Config.WRITE_BEHIND_SEC, self.io.call_soon, args=(self.request_flush,))
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _deliver(self, callback, success, msg):
+        if callback is not None:
+            self.io.call_soon(callback, success, msg)
+
+    def _apply_deferred(self, update_logic_func, journal):
+        """write_behind 중 트랜잭션 대신: 메모리에만 반영하고 로직을 보관"""
+        dfs, msg = self._run_logic(update_logic_func)
+        if dfs is None:
+            return False, msg
+
+        current = self._memory_state()
+        if self._committed is None:
+            self._committed = current
+        else:
+            # 이번 로직이 처음 읽은 Serial_Data는 아직 반영 전 상태이므로 기준 상태에 추가
+            for key in self.LAZY_KEYS:
+                if key in current and key not in self._committed:
+                    self._committed[key] = current[key]
+                    self._committed["indexes"][key] = current["indexes"].get(key)
+
+        self._deferred.append((update_logic_func, journal))
+        self._adopt_unsaved(dfs)
+        return True, ""
+
+    def _restore_state(self, state):
+        """메모리를 _memory_state 상태로 되돌림"""
+        with self._updating_state():
+            self.df, self.memo_df = state["df"], state["memo"]
+            for key in self.LAZY_KEYS:
+                if key in state:
+                    self._lazy_frames[key] = state[key]
+            self.req_index.update(state["indexes"])
+            self.data_version += 1
+
+    def flush_writes(self, keep_on_failure=False):
+        """모아 둔 작업을 한 번의 트랜잭션으로 저장
+
+        keep_on_failure: [신규] 저장에 실패하면 작업을 버리지 않고 다시 대기시킴 (완료 콜백은 호출하지 않음)
+                         → 종료 시 사용자가 다시 시도하거나 저장하지 않고 종료를 고를 수 있도록
+        """
+        timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+        batch, self._pending_writes = self._pending_writes, []
+        base, self._committed = self._committed, None
+        if not batch:
+            return True, ""
+
+        results, success, msg = self._save_writes(batch, base)
+        if not success and keep_on_failure:
+            # 화면은 저장 전 상태(또는 다시 읽은 최신 상태)로 되돌아갔으므로 다음 시도는 현재 메모리 기준으로 실행
+            self._pending_writes = batch + self._pending_writes
+            return False, msg
+        for write, (ok, write_msg) in zip(batch, results):
+            self._deliver(write.callback, ok, write_msg)
+        return success, msg
+
+    def _save_writes(self, batch, base=None):
+        """여러 작업 로직을 한 번의 트랜잭션으로 저장 → (작업별 (성공, 메시지), 전체 성공, 메시지)
+
+        base: 작업을 화면에만 먼저 반영했으면 그 전 상태 (저장에 실패하면 이 상태로 되돌림)
+        """
+        if self.storage.exists() and not self.journal.pending(self.storage.path):
+            results = [None] * len(batch)
+
+            def logic(dfs):
+                # 작업별 결과를 기록 (최신 데이터 위에서 다시 실행되면 덮어씀)
+                for i, write in enumerate(batch):
+                    results[i] = write.logic(dfs)
+                failed = [msg for ok, msg in results if not ok]
+                return (False, failed[0]) if len(failed) == len(batch) else (True, "")
+
+            unsaved = (self.df, self.memo_df)
+            success, msg = self._execute_transaction(logic, base=base)
+            if success:
+                return [(ok, write_msg if not ok else msg) for ok, write_msg in results], True, msg
+            if self.storage.exists():
+                # 저장 실패 → 화면에만 반영했던 변경을 되돌림 (저장소를 다시 읽었으면 그 상태 유지)
+                if base is not None:
+                    if self.df is unsaved[0]:
+                        self._restore_state(base)
+                    self._publish_changes(unsaved, self._touched_lazy_keys(base))
+                return [(False, msg)] * len(batch), False, msg
+
+        # 공유 폴더에 연결할 수 없음 → 작업마다 오프라인 대기열로 처리
+        if base is not None:
+            self._restore_state(base)
+        results = [self._execute_transaction(write.logic, write.journal) for write in batch]
+        return results, all(ok for ok, _ in results), ""
+
+    # ---------------------------------------------------------
+    # [신규] 일괄 처리
+    # ---------------------------------------------------------
+    # 여러 요청에 대한 작업(OPERATION_LABELS의 메서드)을 한 번의 트랜잭션으로 저장한다.
+    # 로그는 작업마다 한 줄씩 남고, 찾을 수 없는 요청 등 일부 작업이 실패해도 나머지는 저장된다.
+    def execute_batch(self, operations):
+        """operations: [(메서드 이름, 인자 목록)] → (모두 성공했는지, 결과 메시지)"""
+        if not operations:
+            return False, "처리할 항목이 없습니다."
+        writes, labels = [], []
+        for op, args in operations:
+            if op not in self.OPERATION_LABELS:
+                return False, f"일괄 처리할 수 없는 작업입니다: {op}"
+            self._collected = []
+            try:
+                getattr(self, op)(*args)
+            finally:
+                collected, self._collected = self._collected, None
+            for logic, journal in collected:
+                writes.append(_PendingWrite(logic, journal, None))
+                labels.append(self._operation_label(op, args))
+
+        results, success, msg = self._save_writes(writes)
+        failures = [f"• {label}: {write_msg}" for label, (ok, write_msg) in zip(labels, results) if not ok]
+        if not failures:
+            # 오프라인이면 작업별 메시지(임시 저장 안내) 사용
+            return True, f"{len(writes)}건 저장되었습니다." if msg else results[-1][1]
+        if len(failures) == len(writes):
+            return False, msg or "\n".join(failures)
+        return False, f"{len(writes)}건 중 {len(failures)}건을 처리하지 못했습니다. (나머지는 저장됨)\n\n" + "\n".join(failures)
+
+    def hold_requests(self, req_nos):
+        return self.execute_batch([("update_status_to_hold", [r]) for r in req_nos])
+
+    def set_requests_waiting(self, req_nos, reason):
+        return self.execute_batch([("update_status_to_waiting", [r, reason]) for r in req_nos])
+
+    def shift_expected_dates(self, req_nos, days):
+        """출고예정일을 days일 미룸 (음수면 앞당김, 예정일이 없는 요청은 제외)"""
+        operations = []
+        for req_no in req_nos:
+            rows = self.get_request_rows(req_no)
+            dates = rows["출고예정일"].dropna()
+            if len(dates):
+                new_date = (dates.iloc[0] + timedelta(days=days)).strftime("%Y-%m-%d")
+                operations.append(("update_expected_date", [req_no, new_date]))
+        if not operations:
+            return False, "출고예정일이 있는 항목이 없습니다."
+        return self.execute_batch(operations)
+
+    def _new_transaction_frames(self, base):
+        def load(key):
+            return base[key].copy() if key in base else self._transaction_frame(key)
+
+        def load_index(key):
+            return (base["indexes"].get(key) or self.req_index[key]).copy()
+
+        return _TransactionFrames(load, load_index, df=base["df"].copy(), memo=base["memo"].copy())
+
+    def _memory_state(self):
+        """트랜잭션 기준 상태 {df, memo, 읽어 둔 Serial_Data, indexes}
+
+        메모리 프레임은 교체만 되고 제자리에서 수정되지 않으므로 참조만 보관해도 된다.
+        """
+        current = self._current()
+        state = {"df": current.df, "memo": current.memo_df, "indexes": dict(current.req_index)}
+        for key in self.LAZY_KEYS:
+            if key not in self.APPEND_ONLY_KEYS and current.lazy_frames.get(key) is not None:
+                state[key] = current.lazy_frames[key]
+        return state
+
+    def _transaction_frame(self, key):
+        """트랜잭션에서 처음 접근한 지연 로드 시트 (로그 시트는 추가만 하므로 사본 불필요)"""
+        if key in self.APPEND_ONLY_KEYS:
+            return self._folded_frame(key)
+        return self._lazy_frame(key).copy()
+
+    def _get_file_signature(self):
+        """저장소 변경 여부 판단용 시그니처. 저장소가 없으면 None"""
+        return self.storage.signature()
+
+    # [신규] 파일 변경 감시 대상 (FileWatcher가 감시 스레드에서 호출)
+    def watch_paths(self):
+        return self.storage.watch_paths()
+
+    def _sheet_diffs(self, dfs, base):
+        """시트별 FrameDiff 계산 (로그 시트는 버퍼에 쌓인 행만 추가, 접근하지 않은 지연 로드 시트는 제외)
+
+        base: 로직을 실행한 기준 상태 (Data는 항상 마지막으로 저장/로드한 _persisted_df 기준)
+        """
+        appends = getattr(dfs, "appends", {})
+        diffs = {}
+        for key, sheet_name in Config.SHEET_KEYS.items():
+            if key in self.APPEND_ONLY_KEYS:
+                rows = appends.get(key, [])
+                if key in dfs:
+                    diff = diff_frames(self._folded_frame(key), dfs[key])
+                elif rows:
+                    columns, row_count = self._append_layout(key)
+                    diff = FrameDiff(columns, append_at=row_count)
+                else:
+                    continue
+                diff.add_rows([[row.get(c) for c in diff.columns] for row in rows])
+            elif key == "df":
+                # [수정] 메모리 스키마(범주형/날짜 타입) → 저장소 값으로 바꿔 비교
+                diff = diff_frames(to_storage(self._persisted_df), to_storage(dfs[key]))
+            elif key in dfs:
+                diff = diff_frames(base[key] if key in base else self._frame_for(key), dfs[key])
+            else:
+                continue
+            diffs[sheet_name] = diff
+        return diffs
+
+    def _write_workbook(self, dfs, base):
+        """변경된 시트의 변경된 셀/추가된 행만 저장소에 반영 (엑셀에서 불가능하면 전체 저장)"""
+        self.storage.write(self._sheet_diffs(dfs, base), lambda: self._full_frames(dfs))
+
+    def _final_frame(self, dfs, key):
+        """트랜잭션 결과 프레임 (로그 시트는 추가 버퍼까지 합친 결과)"""
+        frame = dfs[key]
+        rows = getattr(dfs, "appends", {}).get(key)
+        if rows:
+            frame = pd.concat([frame, pd.DataFrame(rows, columns=frame.columns)], ignore_index=True)
+        return frame
+
+    def _full_frames(self, dfs):
+        frames = {key: self._conform_columns(key, self._final_frame(dfs, key)) for key in Config.SHEET_KEYS}
+        frames["df"] = to_storage(frames["df"])
+        return {Config.SHEET_KEYS[key]: frame for key, frame in frames.items()}
+
+    def _conform_columns(self, key, frame):
+        """전체 저장용으로 헤더를 Config 컬럼 순서에 맞춤 (없는 컬럼은 빈 값, 그 밖의 컬럼은 뒤에 유지)"""
+        columns = list(Config.SHEET_COLUMNS[key])
+        if list(frame.columns) == columns:
+            return frame
+        return frame.reindex(columns=columns + [c for c in frame.columns if c not in columns])
+
+    def _touched_lazy_keys(self, dfs):
+        """트랜잭션에서 수정하거나 행을 추가한 지연 로드 시트 키"""
+        appends = getattr(dfs, "appends", {})
+        return [key for key in self.LAZY_KEYS if key in dfs or appends.get(key)]
+
+    def _adopt_frames(self, dfs):
+        """저장에 사용한 프레임을 메모리 상태로 채택 (load_data와 동일한 전처리 적용)"""
+        # 엑셀에 빈 문자열을 쓰면 다시 읽을 때 빈 셀(NaN)이 되므로 동일하게 맞춤
+        def as_reloaded(frame):
+            return frame.mask(frame == "").reset_index(drop=True)
+
+        # [수정] 프레임 / 색인 / 버퍼를 사본에서 바꾼 뒤 한 번에 교체 (UI 스레드는 바뀌는 도중의 상태를 보지 않음)
+        with self._updating_state():
+            self.df = as_reloaded(dfs["df"])
+            self.memo_df = as_reloaded(dfs["memo"])
+            if "serial" in dfs:
+                self.serial_df = self._prepare_lazy_frame("serial", as_reloaded(dfs["serial"]))
+
+            appends = getattr(dfs, "appends", {})
+            for key in self.APPEND_ONLY_KEYS:
+                if key in dfs:
+                    self._set_append_only_frame(key, self._prepare_lazy_frame(key, as_reloaded(dfs[key])))
+                rows = [{k: (None if v == "" else v) for k, v in row.items()} for row in appends.get(key, [])]
+                self._append_buffers[key].extend(rows)
+                if key == "memo_log" and rows:
+                    self._memo_log_tail = pd.concat(
+                        [self._memo_log_tail, pd.DataFrame(rows, columns=self._memo_log_tail.columns)], ignore_index=True
+                    ).tail(Config.MEMO_LOG_TAIL_ROWS)
+
+            self._preprocess_data()
+            self._persisted_df = self.df.copy()
+            self._adopt_indexes(dfs.indexes)
+            self.data_version += 1
+
+    # ---------------------------------------------------------
+    # [신규] 요청번호 색인
+    # ---------------------------------------------------------
+    def _frame_for(self, key):
+        """메모리 프레임 (지연 로드 시트를 아직 읽지 않았으면 None)"""
+        if key in self.LAZY_KEYS:
+            return self._lazy_frames[key]
+        return {"df": self.df, "memo": self.memo_df}[key]
+
+    def _rebuild_indexes(self):
+        with self._updating_state():
+            for key, column in Config.REQ_NO_COLUMNS.items():
+                frame = self._frame_for(key)
+                if frame is None:
+                    self.req_index.pop(key, None)
+                else:
+                    self.req_index[key] = RequestIndex.from_frame(frame, column)
+
+    def _adopt_indexes(self, indexes):
+        """트랜잭션에서 갱신한 색인 채택 (행 수가 맞지 않으면 안전하게 다시 만듦)"""
+        with self._updating_state():
+            for key, column in Config.REQ_NO_COLUMNS.items():
+                frame = self._frame_for(key)
+                if frame is None:
+                    continue
+                index = indexes.get(key, self.req_index.get(key))
+                if index is None or index.size != len(frame):
+                    index = RequestIndex.from_frame(frame, column)
+                self.req_index[key] = index
+
+    def find_rows(self, req_no, key="df"):
+        """요청번호의 행 위치 tuple (key: df / memo / serial — serial은 읽지 않았으면 저장소에서 읽으므로 작업자 스레드에서)"""
+        if key in self.LAZY_KEYS:
+            self._lazy_frame(key)
+        return self.req_index[key].rows(req_no)
+
+    def get_request_rows(self, req_no):
+        """요청번호에 해당하는 Data 행들 (DataFrame)"""
+        # [수정] 같은 상태의 색인과 프레임을 함께 사용 (UI 스레드에서 호출)
+        state = self._current()
+        return state.df.iloc[list(state.req_index["df"].rows(req_no))]
+
     def _create_log_entry(self, action, details):
         try: user = getpass.getuser()
         except: user = "Unknown"
@@ -131,102 +1221,303 @@ class DataManager:
                     self.current_excel_path = data.get("excel_path", Config.DEFAULT_EXCEL_PATH)
                     self.current_theme = data.get("theme", "Dark") 
                     self.attachment_dir = data.get("attachment_dir", Config.DEFAULT_ATTACHMENT_DIR)
+                    self.storage_backend = data.get("storage_backend", Config.DEFAULT_STORAGE_BACKEND)
+                    self.sqlite_path = data.get("sqlite_path", "")
+                    self.sqlite_journal_mode = data.get("sqlite_journal_mode", Config.DEFAULT_SQLITE_JOURNAL_MODE)
+                    self.export_interval_min = data.get("export_interval_min", Config.DEFAULT_EXPORT_INTERVAL_MIN)
+                    self.excel_reader = data.get("excel_reader", Config.DEFAULT_EXCEL_READER)
+                    self.parallel_load = data.get("parallel_load", Config.DEFAULT_PARALLEL_LOAD)
             except Exception as e:
                 print(f"설정 로드 실패: {e}")
+        self.storage = self._create_storage()
 
-    def save_config(self, new_path=None, new_theme=None, new_attachment_dir=None):
+    def save_config(self, new_path=None, new_theme=None, new_attachment_dir=None, new_excel_reader=None, new_parallel_load=None):
         if new_path: self.current_excel_path = new_path
         if new_theme: self.current_theme = new_theme
         if new_attachment_dir: self.attachment_dir = new_attachment_dir
+        if new_excel_reader: self.excel_reader = new_excel_reader
+        if new_parallel_load is not None: self.parallel_load = new_parallel_load
         
         data = {
             "excel_path": self.current_excel_path,
             "theme": self.current_theme,
-            "attachment_dir": self.attachment_dir 
+            "attachment_dir": self.attachment_dir,
+            "storage_backend": self.storage_backend,
+            "sqlite_path": self.sqlite_path,
+            "sqlite_journal_mode": self.sqlite_journal_mode,
+            "export_interval_min": self.export_interval_min,
+            "excel_reader": self.excel_reader,
+            "parallel_load": self.parallel_load
         }
         try:
             with open(Config.CONFIG_FILENAME, "w", encoding="utf-8") as f:
                 json.dump(data, f, ensure_ascii=False, indent=4)
         except Exception as e:
             print(f"설정 저장 실패: {e}")
+        self.storage = self._create_storage()
+
+    # [신규] 저장소 백엔드 생성
+    def _create_storage(self):
+        if self.storage_backend == "sqlite":
+            # 경로 미지정 시 엑셀 파일 옆에 같은 이름의 .db 사용
+            db_path = self.sqlite_path or os.path.splitext(self.current_excel_path)[0] + ".db"
+            return SqliteStorage(db_path, index_columns=Config.SQLITE_INDEX_COLUMNS, journal_mode=self.sqlite_journal_mode)
+        if self.storage_backend not in Config.STORAGE_BACKENDS:
+            print(f"알 수 없는 저장소 백엔드: {self.storage_backend} → excel 사용")
+        return ExcelStorage(self.current_excel_path, reader=self.excel_reader, parallel=self.parallel_load,
+                            lease_ttl=Config.WRITE_LEASE_TTL_SEC, lease_wait=Config.WRITE_LEASE_WAIT_SEC)
 
     def load_data(self):
-        """엑셀 파일 로드 (읽기 전용)"""
-        if os.path.exists(self.current_excel_path):
+        """저장소(엑셀 파일 또는 SQLite DB) 로드 (읽기 전용)"""
+        # [신규] 다시 읽으면 화면에만 반영된 지연 저장 작업이 사라지므로 먼저 저장
+        if self._pending_writes:
+            self.flush_writes()
+
+        # [신규] SQLite 최초 사용 시 기존 엑셀 워크북을 한 번 가져옴
+        if self.storage.name == "sqlite" and not self.storage.exists() and os.path.exists(self.current_excel_path):
+            success, msg = self.import_from_excel()
+            if not success:
+                return False, msg
+
+        if self.storage.exists():
             try:
-                # [신규] 파일이 존재하면 타임스탬프 갱신
-                current_mtime = os.path.getmtime(self.current_excel_path)
+                # [신규] 읽기 전에 시그니처를 먼저 기록 (읽는 도중 변경되면 다음 체크에서 다시 로드됨)
+                current_signature = self._get_file_signature()
+                current_fingerprints = self._get_sheet_fingerprints()
+                before = self._frames_before_change()
                 
-                with pd.ExcelFile(self.current_excel_path) as xls:
-                    # 1. Data
-                    if Config.SHEET_DATA in xls.sheet_names:
-                        self.df = pd.read_excel(xls, Config.SHEET_DATA)
-                    else:
-                        self.df = pd.read_excel(xls, 0)
+                # [수정] 화면에 바로 필요한 Data / Memos만 읽음
+                # (Log / Memo Log / Serial_Data는 처음 접근할 때 읽음, Memo Log는 최근 활동용 끝부분만)
+                # [신규] 병렬 로드 시에는 시트별로 다른 코어에서 파싱하므로 전체 시트를 한 번에 읽음
+                eager = getattr(self.storage, "parallel", False)
+                sheet_names = [Config.SHEET_DATA, Config.SHEET_MEMO]
+                if eager:
+                    sheet_names += [Config.SHEET_KEYS[key] for key in self.LAZY_KEYS]
+                sheets = self.storage.read_sheets(sheet_names)
+                if not eager:
+                    memo_log_tail = self.storage.read_sheet_tail(Config.SHEET_MEMO_LOG, Config.MEMO_LOG_TAIL_ROWS)
 
-                    # 2. Log
-                    if Config.SHEET_LOG in xls.sheet_names:
-                        self.log_df = pd.read_excel(xls, Config.SHEET_LOG)
-                    else:
-                        self.log_df = pd.DataFrame(columns=Config.LOG_COLUMNS)
-                        
-                    # 3. Memo
-                    if Config.SHEET_MEMO in xls.sheet_names:
-                        self.memo_df = pd.read_excel(xls, Config.SHEET_MEMO)
-                    else:
-                        self.memo_df = pd.DataFrame(columns=Config.MEMO_COLUMNS)
+                # [수정] 읽은 시트를 사본 상태에 채택한 뒤 한 번에 교체
+                with self._updating_state():
+                    # 1. Data (컬럼 정리 포함)
+                    self._set_data_sheet(sheets.get(Config.SHEET_DATA))
+                    
+                    # 2. Memo
+                    self.memo_df = sheets.get(Config.SHEET_MEMO, pd.DataFrame(columns=Config.MEMO_COLUMNS))
 
-                    # 4. Memo Log
-                    if Config.SHEET_MEMO_LOG in xls.sheet_names:
-                        self.memo_log_df = pd.read_excel(xls, Config.SHEET_MEMO_LOG)
+                    # 3. Log / Memo Log / Serial Data (지연 로드)
+                    self._unload_lazy_frames()
+                    if eager:
+                        for key in self.LAZY_KEYS:
+                            self._install_lazy_frame(key, sheets.get(Config.SHEET_KEYS[key]))
+                        self._memo_log_tail = self._lazy_frames["memo_log"].tail(Config.MEMO_LOG_TAIL_ROWS).reset_index(drop=True)
                     else:
-                        self.memo_log_df = pd.DataFrame(columns=Config.MEMO_LOG_COLUMNS)
+                        self._memo_log_tail = self._prepare_lazy_frame("memo_log", memo_log_tail)
 
-                    # 5. Serial Data
-                    if Config.SHEET_SERIAL in xls.sheet_names:
-                        self.serial_df = pd.read_excel(xls, Config.SHEET_SERIAL)
-                        if not self.serial_df.empty:
-                            self.serial_df["요청번호"] = self.serial_df["요청번호"].astype(str)
-                    else:
-                        self.serial_df = pd.DataFrame(columns=Config.SERIAL_COLUMNS)
-
-                # 컬럼 정리
-                current_cols_len = len(self.df.columns)
-                config_cols_len = len(Config.COLUMNS)
-                if current_cols_len >= config_cols_len:
-                    self.df.columns = list(Config.COLUMNS) + list(self.df.columns[config_cols_len:])
-                    self.df = self.df.iloc[:, :config_cols_len]
-                else:
-                    self.df.columns = Config.COLUMNS[:current_cols_len]
+                    self._preprocess_data()
+                    self._persisted_df = self.df.copy()
+                    self._rebuild_indexes()
+                    self.data_version += 1
                 
-                self._preprocess_data()
+                # [신규] 로드 성공 시 시그니처 업데이트
+                self.last_file_signature = current_signature
+                self._sheet_fingerprints = current_fingerprints
+                self._publish_changes(before, self.LAZY_KEYS)
+                self._schedule_preload()
                 
-                # [신규] 로드 성공 시 타임스탬프 업데이트
-                self.last_file_timestamp = current_mtime
-                
-                return True, os.path.basename(self.current_excel_path)
+                return True, os.path.basename(self.storage.path)
             
             except Exception as e:
                 print(f"파일 로드 중 오류: {e}")
                 return False, str(e)
         else:
-            return False, self.current_excel_path
+            return False, self.storage.path
+
+    def _set_data_sheet(self, frame):
+        """Data 시트 채택 (컬럼을 헤더 이름으로 찾아 Config.COLUMNS 순서로 정리)"""
+        df = frame if frame is not None else pd.DataFrame(columns=Config.COLUMNS)
+        # [수정] 위치가 아니라 헤더 이름으로 매핑 (사용자가 덧붙인 열이 '버전'으로 바뀌지 않도록)
+        base_columns = [c for c in Config.COLUMNS if c != Config.VERSION_COLUMN]
+        names = [str(c).strip() for c in df.columns]
+        if not set(base_columns) <= set(names):
+            # 헤더 이름이 다른 이전 형식 파일: 기본 컬럼만 위치로 이름을 붙이고 그 뒤 열은 헤더 이름 그대로
+            count = min(len(names), len(base_columns))
+            names = base_columns[:count] + names[count:]
+        df = df.set_axis(names, axis=1)
+        df = df.loc[:, ~df.columns.duplicated()]
+        # '버전' 헤더가 없으면 여기서는 빼 두고 _preprocess_data에서 새로 추가
+        self.df = df[[c for c in Config.COLUMNS if c in df.columns]]
+
+    # ---------------------------------------------------------
+    # [신규] 시트별 지문 (바뀐 시트만 다시 읽기)
+    # ---------------------------------------------------------
+    def _get_sheet_fingerprints(self):
+        """(저장소 경로, {프레임 키: 지문}). 저장소가 시트별 비교를 지원하지 않으면 None"""
+        try:
+            fingerprints = self.storage.sheet_fingerprints(list(Config.SHEET_KEYS.values()))
+        except Exception as e:
+            print(f"시트 지문 확인 실패: {e}")
+            return None
+        # Data 시트가 없으면 첫 시트를 대신 읽으므로 시트별로 비교할 수 없음
+        if fingerprints.get(Config.SHEET_DATA) is None:
+            return None
+        return self.storage.path, {key: fingerprints.get(name) for key, name in Config.SHEET_KEYS.items()}
+
+    def _changed_sheet_keys(self, fingerprints):
+        """마지막 로드 이후 지문이 바뀐 프레임 키 목록. 비교할 수 없으면 None (→ 전체 로드)"""
+        previous = self._sheet_fingerprints
+        if previous is None or fingerprints is None or previous[0] != fingerprints[0]:
+            return None
+        changed = [key for key in Config.SHEET_KEYS if fingerprints[1][key] != previous[1].get(key)]
+        # 시그니처는 바뀌었는데 지문이 모두 같으면 (지문을 남기지 않는 이전 버전의 저장 등) 안전하게 전체 로드
+        return changed or None
+
+    def reload_changed_sheets(self):
+        """바뀐 시트만 다시 읽기 (비교할 수 없으면 load_data로 전체 로드)
+
+        - Data / Memos: 바뀌었으면 다시 읽음
+        - Log / Memo Log / Serial_Data: 이미 읽어 둔 시트만 다시 읽고, 읽지 않은 시트는 그대로 지연 로드
+        """
+        if self.last_file_signature is None or not self.storage.exists():
+            return self.load_data()
+        try:
+            current_signature = self._get_file_signature()
+            current_fingerprints = self._get_sheet_fingerprints()
+            changed = self._changed_sheet_keys(current_fingerprints)
+            if changed is None:
+                return self.load_data()
+
+            before = self._frames_before_change()
+            eager = getattr(self.storage, "parallel", False)
+            reread = [key for key in changed if key not in self.LAZY_KEYS or eager or self._lazy_frames[key] is not None]
+            names = [Config.SHEET_KEYS[key] for key in reread]
+            if "df" in reread:
+                sheets = self.storage.read_sheets(names)
+            else:
+                # read_sheets는 첫 시트가 없으면 워크북 첫 시트로 대체하므로 Data 이외에는 시트별로 읽음
+                sheets = {name: self.storage.read_sheet(name) for name in names}
+            print(f"변경된 시트만 다시 읽기: {', '.join(Config.SHEET_KEYS[key] for key in changed)}")
+
+            with self._updating_state():
+                if "df" in changed:
+                    self._set_data_sheet(sheets.get(Config.SHEET_DATA))
+                if "memo" in changed:
+                    self.memo_df = sheets.get(Config.SHEET_MEMO, pd.DataFrame(columns=Config.MEMO_COLUMNS))
+                for key in self.LAZY_KEYS:
+                    if key not in changed:
+                        continue
+                    if key in reread:
+                        self._install_lazy_frame(key, sheets.get(Config.SHEET_KEYS[key]))
+                    else:
+                        self._unload_lazy_frame(key)
+                if "memo_log" in changed:
+                    if self._lazy_frames["memo_log"] is not None:
+                        self._memo_log_tail = self._lazy_frames["memo_log"].tail(Config.MEMO_LOG_TAIL_ROWS).reset_index(drop=True)
+                    else:
+                        tail = self.storage.read_sheet_tail(Config.SHEET_MEMO_LOG, Config.MEMO_LOG_TAIL_ROWS)
+                        self._memo_log_tail = self._prepare_lazy_frame("memo_log", tail)
+
+                if "df" in changed:
+                    self._preprocess_data()
+                    self._persisted_df = self.df.copy()
+                elif "memo" in changed:
+                    self._preprocess_memo()
+                self._rebuild_indexes()
+                self.data_version += 1
+
+            self.last_file_signature = current_signature
+            self._sheet_fingerprints = current_fingerprints
+            self._publish_changes(before, [key for key in changed if key in self.LAZY_KEYS])
+            self._schedule_preload()
+            return True, os.path.basename(self.storage.path)
+
+        except Exception as e:
+            print(f"파일 로드 중 오류: {e}")
+            return False, str(e)
+
+    # [신규] 백그라운드 실행 (결과는 UI 스레드에서 callback(success, msg)로 전달)
+    def run_async(self, func, *args, callback=None, label="저장 중..."):
+        self.io.submit(func, *args, callback=callback, label=label)
+
+    def reload_if_changed(self):
+        """외부 변경이 있을 때만 다시 로드 (다시 로드했으면 True). 아직 한 번도 읽지 않았으면 무조건 로드"""
+        # [신규] 화면에만 반영된 지연 저장 작업이 있으면 먼저 저장 (저장하면서 최신 데이터도 반영됨)
+        if self._pending_writes:
+            self.flush_writes()
+        # [신규] 오프라인 작업이 남아 있으면 연결 확인 겸 반영 시도 (반영하면서 최신 데이터도 다시 읽음)
+        if self.journal.pending(self.storage.path):
+            success, msg = self.replay_journal()
+            if success:
+                self.save_snapshot()
+            return success, msg
+        if self.last_file_signature is not None and not self.check_for_external_changes():
+            # 스냅샷에 없던 지연 로드 시트는 변경이 없어도 읽어 둠
+            self._schedule_preload()
+            return False, ""
+        success, msg = self.reload_changed_sheets()
+        if success:
+            self.save_snapshot()
+        return success, msg
+
+    # ---------------------------------------------------------
+    # [신규] 로컬 스냅샷 (시작 시 네트워크 드라이브를 읽기 전에 바로 표시)
+    # ---------------------------------------------------------
+    def save_snapshot(self):
+        if self.last_file_signature is None:
+            return False, "저장할 데이터가 없습니다."
+        # [신규] 저장하지 않은 지연 저장 작업이 화면에 반영된 상태는 보관하지 않음
+        # (시그니처는 저장소 기준이므로 다음 실행 시 저장된 것처럼 보이게 됨)
+        if self._pending_writes or self._committed is not None:
+            return False, "저장하지 않은 작업이 있습니다."
+        # 지연 로드 시트는 이미 읽은 것만 보관 (나머지는 필요할 때 저장소에서 읽음)
+        frames = {"df": self.df, "memo": self.memo_df, "memo_log_tail": self._memo_log_tail}
+        for key in self.LAZY_KEYS:
+            if self._lazy_frames[key] is not None:
+                frames[key] = self._folded_frame(key) if key in self.APPEND_ONLY_KEYS else self._lazy_frames[key]
+        try:
+            save_snapshot(Config.APP_DIR, self.storage.path, self.last_file_signature, frames, self._sheet_fingerprints)
+            return True, ""
+        except Exception as e:
+            print(f"스냅샷 저장 실패: {e}")
+            return False, str(e)
+
+    def load_snapshot(self):
+        """마지막 스냅샷으로 메모리 상태 복원 (시그니처도 함께 복원 → 이후 변경 확인 시 비교 기준)"""
+        cached = load_snapshot(Config.APP_DIR, self.storage.path)
+        if cached is None:
+            return False, "스냅샷이 없습니다."
+        signature, frames, fingerprints = cached
+        missing = [key for key in ("df", "memo") if key not in frames]
+        if missing:
+            return False, f"스냅샷 형식 오류: {missing[0]!r}"
+        with self._updating_state():
+            self.df = frames["df"]
+            self.memo_df = frames["memo"]
+            # [신규] 메모리 스키마 적용 전에 저장한 스냅샷도 같은 타입으로
+            self._preprocess_data()
+
+            self._unload_lazy_frames()
+            for key in self.LAZY_KEYS:
+                if key in frames:
+                    self._lazy_frames[key] = frames[key]
+            self._memo_log_tail = frames.get("memo_log_tail", pd.DataFrame(columns=Config.MEMO_LOG_COLUMNS))
+
+            self._persisted_df = self.df.copy()
+            self._rebuild_indexes()
+            self.data_version += 1
+        self.last_file_signature = signature
+        self._sheet_fingerprints = fingerprints
+        self._publish(ChangeSet.everything(Config.SHEET_KEYS))
+        return True, os.path.basename(self.storage.path)
 
     # [신규] 외부 변경 감지 메서드
     def check_for_external_changes(self):
         """파일이 외부에서 변경되었는지 확인"""
-        if not os.path.exists(self.current_excel_path):
+        current_signature = self._get_file_signature()
+        if current_signature is None:
             return False
-        
-        try:
-            current_mtime = os.path.getmtime(self.current_excel_path)
-            # 마지막 로드한 시간보다 현재 파일 시간이 더 크면 변경된 것임
-            # (미세한 차이 방지를 위해 아주 작은 값 비교는 생략하고 단순 대소 비교)
-            if current_mtime > self.last_file_timestamp:
-                return True
-        except OSError:
-            pass
-        return False
+        # 마지막 로드(또는 내가 저장한) 시점의 mtime/size와 다르면 변경된 것임
+        return current_signature != self.last_file_signature
 
     def _preprocess_data(self):
         if self.df.empty: return
@@ -234,68 +1525,110 @@ class DataManager:
         for col in Config.COLUMNS:
             if col not in self.df.columns: self.df[col] = '-'
 
-        for date_col in ["출고요청일", "출고예정일", "출고일"]:
-            if date_col in self.df.columns:
-                 self.df[date_col] = pd.to_datetime(self.df[date_col], errors='coerce', format='mixed').dt.strftime('%Y-%m-%d')
+        # [수정] 날짜를 문자열로 되돌리지 않고 타입을 유지 (범주형 / datetime64 / Int64, 표시 형식은 화면에서)
+        self.df = apply_schema(self.df)
+        self._preprocess_memo()
 
-        self.df = self.df.fillna('-')
-        
+    def _preprocess_memo(self):
         if self.memo_df.empty: self.memo_df = pd.DataFrame(columns=Config.MEMO_COLUMNS)
         else:
             if "확인" not in self.memo_df.columns: self.memo_df["확인"] = "N"
-            
-        if self.memo_log_df.empty: self.memo_log_df = pd.DataFrame(columns=Config.MEMO_LOG_COLUMNS)
-        
-        if self.serial_df.empty:
-            self.serial_df = pd.DataFrame(columns=Config.SERIAL_COLUMNS)
-        else:
-            self.serial_df = self.serial_df.fillna("-")
-
-    def save_to_excel(self):
-        # 단순 저장 (트랜잭션 없이 로컬 메모리 저장용)
-        # 중요: 가능하면 _execute_transaction 사용 권장
-        existing_cols = [c for c in Config.COLUMNS if c in self.df.columns]
-        output_df = self.df[existing_cols]
-
-        try:
-            with pd.ExcelWriter(self.current_excel_path, engine="openpyxl") as writer:
-                output_df.to_excel(writer, sheet_name=Config.SHEET_DATA, index=False)
-                self.log_df.to_excel(writer, sheet_name=Config.SHEET_LOG, index=False)
-                self.memo_df.to_excel(writer, sheet_name=Config.SHEET_MEMO, index=False)
-                self.memo_log_df.to_excel(writer, sheet_name=Config.SHEET_MEMO_LOG, index=False)
-                self.serial_df.to_excel(writer, sheet_name=Config.SHEET_SERIAL, index=False)
-            
-            self.load_data()
-            return True, "저장되었습니다."
-
-        except PermissionError:
-            return False, "엑셀 파일이 현재 열려있어 저장할 수 없습니다."
-        except Exception as e:
-            return False, f"저장 중 오류 발생: {e}"
 
     # ---------------------------------------------------------
     # [개발자 모드 및 유지보수]
     # ---------------------------------------------------------
     def create_backup(self):
-        if not os.path.exists(self.current_excel_path):
+        if not self.storage.exists():
             return False, "원본 파일이 없습니다."
         try:
-            base_dir = os.path.dirname(self.current_excel_path)
+            base_dir = os.path.dirname(self.storage.path)
             backup_dir = os.path.join(base_dir, "backup")
             if not os.path.exists(backup_dir):
                 os.makedirs(backup_dir)
                 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = os.path.basename(self.current_excel_path)
+            filename = os.path.basename(self.storage.path)
             name, ext = os.path.splitext(filename)
             backup_filename = f"{name}_backup_{timestamp}{ext}"
             backup_path = os.path.join(backup_dir, backup_filename)
             
-            shutil.copy2(self.current_excel_path, backup_path)
+            self.storage.backup(backup_path)
             return True, f"백업 완료:\n{backup_path}"
         except Exception as e:
             return False, f"백업 실패: {e}"
 
+    # [신규] 직전 저장본으로 되돌리기 (엑셀 저장소: 저장할 때마다 교체 전 원본을 .prev로 보관)
+    def restore_previous_save(self):
+        if not hasattr(self.storage, "restore_previous"):
+            return False, "엑셀 저장소에서만 사용할 수 있습니다."
+        if not self.storage.has_previous():
+            return False, "직전 저장본이 없습니다."
+        try:
+            self.storage.restore_previous()
+        except StorageBusyError as e:
+            return False, f"다른 사용자가 저장 중입니다. ({e})\n잠시 후 다시 시도해주세요."
+        except PermissionError:
+            return False, "엑셀 파일이 현재 열려있어 되돌릴 수 없습니다."
+        except Exception as e:
+            return False, f"되돌리기 실패: {e}"
+        success, msg = self.load_data()
+        if not success:
+            return False, msg
+        return True, f"직전 저장본으로 되돌렸습니다.\n(되돌리기 전 파일: {self.storage.previous_path})"
+
+    # [신규] 엑셀 → SQLite 최초 이관
+    def import_from_excel(self, excel_path=None):
+        if self.storage.name != "sqlite":
+            return False, "SQLite 저장소를 사용 중이 아닙니다."
+        source_path = excel_path or self.current_excel_path
+        if not os.path.exists(source_path):
+            return False, f"가져올 엑셀 파일이 없습니다: {source_path}"
+        try:
+            sheets = ExcelStorage(source_path, reader=self.excel_reader).read_sheets(list(Config.SHEET_KEYS.values()))
+            self.storage.import_frames(sheets)
+            return True, f"가져오기 완료 ({len(sheets)}개 시트):\n{self.storage.path}"
+        except StorageBusyError:
+            return False, "다른 사용자가 저장 중입니다. 잠시 후 다시 시도해주세요."
+        except Exception as e:
+            return False, f"가져오기 실패: {e}"
+
+    # [신규] SQLite → 엑셀 내보내기 (기존과 동일한 5개 시트 구성)
+    def export_to_excel(self, export_path=None):
+        if self.storage.name != "sqlite":
+            return False, "SQLite 저장소를 사용 중이 아닙니다."
+        target_path = export_path or self.current_excel_path
+        try:
+            signature = self._get_file_signature()
+            sheets = self.storage.read_sheets(list(Config.SHEET_KEYS.values()))
+            sheets = {
+                sheet_name: self._conform_columns(key, sheets.get(sheet_name, pd.DataFrame(columns=Config.SHEET_COLUMNS[key])))
+                for key, sheet_name in Config.SHEET_KEYS.items()
+            }
+
+            # 임시 파일에 쓰고 검증한 뒤 교체 (엑셀을 열어둔 사용자가 있으면 PermissionError)
+            # [신규] 엑셀 저장소를 쓰는 다른 클라이언트와 같은 잠금 파일로 교체 구간 직렬화
+            lease = WriteLease(target_path, ttl=Config.WRITE_LEASE_TTL_SEC, wait=Config.WRITE_LEASE_WAIT_SEC)
+            write_excel_file(target_path, sheets, guard=lease.hold)
+
+            self.last_export_time = datetime.now()
+            self.last_export_signature = signature
+            return True, f"내보내기 완료:\n{target_path}"
+        except PermissionError:
+            return False, "엑셀 파일이 현재 열려있어 내보낼 수 없습니다."
+        except Exception as e:
+            return False, f"내보내기 실패: {e}"
+
+    def export_if_due(self):
+        """설정된 주기(export_interval_min)가 지났고 변경이 있으면 엑셀로 내보내기"""
+        if self.storage.name != "sqlite" or not self.export_interval_min:
+            return False, ""
+        if self.last_export_time and datetime.now() - self.last_export_time < timedelta(minutes=self.export_interval_min):
+            return False, ""
+        if self._get_file_signature() == self.last_export_signature:
+            self.last_export_time = datetime.now()
+            return False, ""
+        return self.export_to_excel()
+
     def clean_old_logs(self, months=3):
         def logic(dfs):
             try:
@@ -322,20 +1655,61 @@ class DataManager:
         if not self.is_dev_mode: return False, "개발자 모드가 아닙니다."
 
         def logic(dfs):
-            mask_data = dfs["df"]["번호"].astype(str) == str(req_no)
-            if not mask_data.any(): return False, "데이터를 찾을 수 없습니다."
-            dfs["df"] = dfs["df"][~mask_data]
-            
-            if not dfs["serial"].empty:
-                s_mask = dfs["serial"]["요청번호"].astype(str) == str(req_no)
-                dfs["serial"] = dfs["serial"][~s_mask]
-            
-            if not dfs["memo"].empty:
-                m_mask = dfs["memo"]["번호"].astype(str) == str(req_no)
-                dfs["memo"] = dfs["memo"][~m_mask]
+            rows = dfs.rows("df", req_no)
+            if not rows: return False, "데이터를 찾을 수 없습니다."
+            dfs.drop_rows("df", rows)
+            dfs.drop_rows("serial", dfs.rows("serial", req_no))
+            dfs.drop_rows("memo", dfs.rows("memo", req_no))
 
-            new_log = self._create_log_entry("강제 삭제", f"[Dev] 번호[{req_no}] 및 연관 데이터 영구 삭제")
-            dfs["log"] = pd.concat([dfs["log"], pd.DataFrame([new_log])], ignore_index=True)
+            self._append_log(dfs, "강제 삭제", f"[Dev] 번호[{req_no}] 및 연관 데이터 영구 삭제")
+            return True, ""
+
+        return self._execute_transaction(logic)
+
+    # [수정] 정보 수정 팝업 저장 (메모리 프레임 전체를 덮어쓰던 save_to_excel 대체)
+    def update_request_fields(self, req_no, read_rows, common_values, item_values):
+        """사용자가 바꾼 필드만 저장
+
+        read_rows: 수정 화면을 열 때 읽은 행들 (DataFrame, 품목 순서)
+        common_values: {컬럼: 값} — 모든 품목에 적용
+        item_values: [{컬럼: 값}] — 품목 순서대로
+        읽은 뒤 다른 사용자가 같은 필드를 다른 값으로 바꿨으면 저장하지 않고 충돌로 알린다.
+        """
+        if not self.is_dev_mode: return False, "개발자 모드가 아닙니다."
+        # [신규] 잘못된 날짜는 빈 날짜로 저장하지 않고 입력 단계에서 거부
+        for values in [common_values, *item_values]:
+            error = _date_error(values)
+            if error: return False, error
+
+        def logic(dfs):
+            rows = dfs.rows("df", req_no)
+            if not rows: return False, "데이터를 찾을 수 없습니다."
+            if len(rows) != len(read_rows):
+                return False, "다른 사용자가 품목 구성을 변경했습니다.\n창을 다시 열어 확인해주세요."
+
+            frame = dfs["df"]
+            changed, conflicts = set(), set()
+            for i, row in enumerate(rows):
+                values = dict(common_values)
+                if i < len(item_values): values.update(item_values[i])
+                updates = {}
+                for column, new_value in values.items():
+                    read_value = display_text(read_rows[column].iat[i]).strip()
+                    if str(new_value).strip() == read_value:
+                        continue  # 바꾸지 않은 필드는 현재 값 유지
+                    current = display_text(frame[column].iat[row]).strip()
+                    if current != read_value and current != str(new_value).strip():
+                        conflicts.add(column)
+                        continue
+                    updates[column] = new_value
+                if updates:
+                    dfs.set_values("df", (row,), updates)
+                    changed.update(updates)
+
+            if conflicts:
+                return False, self._conflict_message({canonical_req_no(req_no): conflicts})
+            if changed:
+                self._append_log(dfs, "정보 수정", f"[Dev] 번호[{req_no}] 수정 ({', '.join(sorted(changed))})")
             return True, ""
 
         return self._execute_transaction(logic)
@@ -344,158 +1718,145 @@ class DataManager:
     # [비즈니스 로직 - 트랜잭션 적용]
     # ---------------------------------------------------------
     def update_production_schedule(self, req_no, date_str):
+        error = _date_error({"출고예정일": date_str})
+        if error: return False, error
+
         def logic(dfs):
-            mask = dfs["df"]["번호"].astype(str) == str(req_no)
-            if mask.any():
-                dfs["df"].loc[mask, "출고예정일"] = date_str
-                dfs["df"].loc[mask, "Status"] = "생산중"
+            rows = dfs.rows("df", req_no)
+            if rows:
+                dfs.set_values("df", rows, {"출고예정일": date_str, "Status": "생산중"})
                 
-                new_log = self._create_log_entry("일정 수립", f"번호[{req_no}] 예정일({date_str}) 등록 및 생산시작")
-                dfs["log"] = pd.concat([dfs["log"], pd.DataFrame([new_log])], ignore_index=True)
+                self._append_log(dfs, "일정 수립", f"번호[{req_no}] 예정일({date_str}) 등록 및 생산시작")
                 return True, ""
             return False, "데이터를 찾을 수 없습니다."
-        return self._execute_transaction(logic)
+        return self._execute_transaction(logic, journal=("update_production_schedule", [req_no, date_str]))
 
     def update_status_to_hold(self, req_no):
         def logic(dfs):
-            mask = dfs["df"]["번호"].astype(str) == str(req_no)
-            if mask.any():
-                old_status = dfs["df"].loc[mask, "Status"].iloc[0]
-                dfs["df"].loc[mask, "Status"] = "중지"
-                dfs["df"].loc[mask, "출고예정일"] = pd.NaT 
+            rows = dfs.rows("df", req_no)
+            if rows:
+                old_status = dfs["df"]["Status"].iat[rows[0]]
+                dfs.set_values("df", rows, {"Status": "중지", "출고예정일": pd.NaT})
                 
-                new_log = self._create_log_entry("중지 설정", f"번호[{req_no}] 상태 변경 ({old_status} -> 중지)")
-                dfs["log"] = pd.concat([dfs["log"], pd.DataFrame([new_log])], ignore_index=True)
+                self._append_log(dfs, "중지 설정", f"번호[{req_no}] 상태 변경 ({old_status} -> 중지)")
                 return True, ""
             return False, "데이터를 찾을 수 없습니다."
-        return self._execute_transaction(logic)
+        return self._execute_transaction(logic, journal=("update_status_to_hold", [req_no]))
 
     def update_status_to_waiting(self, req_no, reason="달력에서 이동"):
         def logic(dfs):
-            mask = dfs["df"]["번호"].astype(str) == str(req_no)
-            if mask.any():
-                old_status = dfs["df"].loc[mask, "Status"].iloc[0]
-                dfs["df"].loc[mask, "Status"] = "대기"
-                dfs["df"].loc[mask, "대기사유"] = reason
-                dfs["df"].loc[mask, "출고예정일"] = pd.NaT
+            rows = dfs.rows("df", req_no)
+            if rows:
+                old_status = dfs["df"]["Status"].iat[rows[0]]
+                dfs.set_values("df", rows, {"Status": "대기", "대기사유": reason, "출고예정일": pd.NaT})
                 
-                new_log = self._create_log_entry("대기 설정", f"번호[{req_no}] 상태 변경 ({old_status} -> 대기) / 사유: {reason}")
-                dfs["log"] = pd.concat([dfs["log"], pd.DataFrame([new_log])], ignore_index=True)
+                self._append_log(dfs, "대기 설정", f"번호[{req_no}] 상태 변경 ({old_status} -> 대기) / 사유: {reason}")
                 return True, ""
             return False, "데이터를 찾을 수 없습니다."
-        return self._execute_transaction(logic)
+        return self._execute_transaction(logic, journal=("update_status_to_waiting", [req_no, reason]))
 
     def update_expected_date(self, req_no, new_date):
+        error = _date_error({"출고예정일": new_date})
+        if error: return False, error
+
         def logic(dfs):
-            mask = dfs["df"]["번호"].astype(str) == str(req_no)
-            if mask.any():
-                old_date = dfs["df"].loc[mask, "출고예정일"].iloc[0]
-                dfs["df"].loc[mask, "출고예정일"] = new_date
-                new_log = self._create_log_entry("일정 변경", f"번호[{req_no}] 예정일 변경 ({old_date} -> {new_date})")
-                dfs["log"] = pd.concat([dfs["log"], pd.DataFrame([new_log])], ignore_index=True)
+            rows = dfs.rows("df", req_no)
+            if rows:
+                old_date = display_text(dfs["df"]["출고예정일"].iat[rows[0]])
+                dfs.set_values("df", rows, {"출고예정일": new_date})
+                self._append_log(dfs, "일정 변경", f"번호[{req_no}] 예정일 변경 ({old_date} -> {new_date})")
                 return True, ""
             return False, "데이터를 찾을 수 없습니다."
-        return self._execute_transaction(logic)
+        return self._execute_transaction(logic, journal=("update_expected_date", [req_no, new_date]))
 
     def finalize_production(self, req_no, out_date):
+        error = _date_error({"출고일": out_date})
+        if error: return False, error
+
         def logic(dfs):
-            mask = dfs["df"]["번호"].astype(str) == str(req_no)
-            if mask.any():
-                dfs["df"].loc[mask, "출고일"] = out_date
-                dfs["df"].loc[mask, "Status"] = "완료"
-                new_log = self._create_log_entry("생산 완료", f"번호[{req_no}] 출고일({out_date}) 처리 완료.")
-                dfs["log"] = pd.concat([dfs["log"], pd.DataFrame([new_log])], ignore_index=True)
+            rows = dfs.rows("df", req_no)
+            if rows:
+                dfs.set_values("df", rows, {"출고일": out_date, "Status": "완료"})
+                self._append_log(dfs, "생산 완료", f"번호[{req_no}] 출고일({out_date}) 처리 완료.")
                 return True, ""
             return False, "데이터를 찾을 수 없습니다."
-        return self._execute_transaction(logic)
+        return self._execute_transaction(logic, journal=("finalize_production", [req_no, out_date]))
 
     def update_status_resume(self, req_no, new_date):
+        error = _date_error({"출고예정일": new_date})
+        if error: return False, error
+
         def logic(dfs):
-            mask = dfs["df"]["번호"].astype(str) == str(req_no)
-            if mask.any():
-                dfs["df"].loc[mask, "Status"] = "생산중"
-                dfs["df"].loc[mask, "출고예정일"] = new_date
-                new_log = self._create_log_entry("생산 재개", f"번호[{req_no}] 중지 -> 생산중 변경, 예정일({new_date}) 설정")
-                dfs["log"] = pd.concat([dfs["log"], pd.DataFrame([new_log])], ignore_index=True)
+            rows = dfs.rows("df", req_no)
+            if rows:
+                dfs.set_values("df", rows, {"Status": "생산중", "출고예정일": new_date})
+                self._append_log(dfs, "생산 재개", f"번호[{req_no}] 중지 -> 생산중 변경, 예정일({new_date}) 설정")
                 return True, ""
             return False, "데이터를 찾을 수 없습니다."
-        return self._execute_transaction(logic)
+        return self._execute_transaction(logic, journal=("update_status_resume", [req_no, new_date]))
 
     def delete_request(self, req_no):
         def logic(dfs):
-            mask = dfs["df"]["번호"].astype(str) == str(req_no)
-            if mask.any():
-                dfs["df"] = dfs["df"][~mask]
-                
-                if not dfs["serial"].empty:
-                    s_mask = dfs["serial"]["요청번호"].astype(str) == str(req_no)
-                    dfs["serial"] = dfs["serial"][~s_mask]
-                
-                if not dfs["memo"].empty:
-                    m_mask = dfs["memo"]["번호"].astype(str) == str(req_no)
-                    dfs["memo"] = dfs["memo"][~m_mask]
+            rows = dfs.rows("df", req_no)
+            if rows:
+                dfs.drop_rows("df", rows)
+                dfs.drop_rows("serial", dfs.rows("serial", req_no))
+                dfs.drop_rows("memo", dfs.rows("memo", req_no))
 
-                new_log = self._create_log_entry("데이터 삭제", f"번호[{req_no}] 데이터 삭제")
-                dfs["log"] = pd.concat([dfs["log"], pd.DataFrame([new_log])], ignore_index=True)
+                self._append_log(dfs, "데이터 삭제", f"번호[{req_no}] 데이터 삭제")
                 return True, ""
             return False, "삭제할 데이터를 찾을 수 없습니다."
         return self._execute_transaction(logic)
 
-    def add_memo(self, req_no, content):
+    def add_memo(self, req_no, content, timestamp=None):
+        """timestamp: 오프라인 작업 반영 시 처음 작성한 시각 유지"""
+        try: user = getpass.getuser()
+        except: user = "Unknown"
+        try: pc_info = platform.node()
+        except: pc_info = "Unknown"
+        timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
         def logic(dfs):
-            try: user = getpass.getuser()
-            except: user = "Unknown"
-            try: pc_info = platform.node()
-            except: pc_info = "Unknown"
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
             new_memo = {"번호": str(req_no), "일시": timestamp, "작업자": user, "PC정보": pc_info, "내용": content, "확인": "N"}
-            dfs["memo"] = pd.concat([dfs["memo"], pd.DataFrame([new_memo])], ignore_index=True)
+            dfs.append_rows("memo", [new_memo])
             
-            new_log = {"일시": timestamp, "작업자": user, "구분": "추가", "요청번호": str(req_no), "내용": content}
-            dfs["memo_log"] = pd.concat([dfs["memo_log"], pd.DataFrame([new_log])], ignore_index=True)
+            self._append_memo_log(dfs, "추가", req_no, content, timestamp=timestamp, user=user)
             return True, ""
-        return self._execute_transaction(logic)
+        return self._execute_transaction(logic, journal=("add_memo", [req_no, content, timestamp]))
+
+    def _find_memo_rows(self, dfs, req_no, timestamp, content):
+        memo = dfs["memo"]
+        return _filter_rows(memo, _filter_rows(memo, dfs.rows("memo", req_no), "일시", timestamp), "내용", content)
 
     def update_memo_check(self, req_no, timestamp, content, new_status):
         def logic(dfs):
-            mask = ((dfs["memo"]["번호"].astype(str) == str(req_no)) & (dfs["memo"]["일시"] == timestamp) & (dfs["memo"]["내용"] == content))
-            if mask.any():
-                dfs["memo"].loc[mask, "확인"] = new_status
+            rows = self._find_memo_rows(dfs, req_no, timestamp, content)
+            if rows:
+                dfs.set_values("memo", rows, {"확인": new_status})
                 return True, ""
             return False, "메모를 찾을 수 없습니다."
-        return self._execute_transaction(logic)
+        return self._execute_transaction(logic, journal=("update_memo_check", [req_no, timestamp, content, new_status]))
 
     def delete_memo(self, req_no, timestamp, content):
         def logic(dfs):
-            mask = ((dfs["memo"]["번호"].astype(str) == str(req_no)) & (dfs["memo"]["일시"] == timestamp) & (dfs["memo"]["내용"] == content))
-            if mask.any():
+            rows = self._find_memo_rows(dfs, req_no, timestamp, content)
+            if rows:
+                # [수정] 첨부 파일은 메모 삭제가 저장된 뒤에 삭제
                 if "[파일첨부]" in content and "(경로:" in content:
-                    try:
-                        for line in content.split('\n'):
-                            line = line.strip()
-                            if line.startswith("(경로:") and line.endswith(")"):
-                                file_path = line[5:-1].strip()
-                                if file_path and os.path.exists(file_path): os.remove(file_path)
-                                break
-                    except: pass
+                    dfs.after_commit.append(lambda: _remove_attachment(content))
                 
-                dfs["memo"] = dfs["memo"][~mask]
-                new_log = {"일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "작업자": getpass.getuser(), "구분": "삭제", "요청번호": str(req_no), "내용": content}
-                dfs["memo_log"] = pd.concat([dfs["memo_log"], pd.DataFrame([new_log])], ignore_index=True)
+                dfs.drop_rows("memo", rows)
+                self._append_memo_log(dfs, "삭제", req_no, content)
                 return True, ""
             return False, "삭제할 메모를 찾을 수 없습니다."
-        return self._execute_transaction(logic)
+        return self._execute_transaction(logic, journal=("delete_memo", [req_no, timestamp, content]))
 
     def update_serial_list(self, req_no, model_name, new_data_list):
         def logic(dfs):
-            if not dfs["serial"].empty:
-                mask = (dfs["serial"]["요청번호"].astype(str) == str(req_no)) & (dfs["serial"]["모델명"] == model_name)
-                dfs["serial"] = dfs["serial"][~mask]
+            dfs.drop_rows("serial", _filter_rows(dfs["serial"], dfs.rows("serial", req_no), "모델명", model_name))
             
             if new_data_list:
-                new_rows_df = pd.DataFrame(new_data_list)
-                dfs["serial"] = pd.concat([dfs["serial"], new_rows_df], ignore_index=True)
+                dfs.append_rows("serial", new_data_list)
             
             serial_list = [str(item.get("시리얼번호", "")).strip() for item in new_data_list if item.get("시리얼번호") and str(item.get("시리얼번호")).strip() not in ["", "-"]]
             joined_serials = ", ".join(serial_list)
@@ -504,28 +1865,30 @@ class DataManager:
             unique_lenses = sorted(list(set(lens_list)))
             joined_lenses = ", ".join(unique_lenses)
             
-            mask_main = (dfs["df"]["번호"].astype(str) == str(req_no)) & (dfs["df"]["모델명"] == model_name)
-            if mask_main.any():
-                dfs["df"].loc[mask_main, "시리얼번호"] = joined_serials
-                dfs["df"].loc[mask_main, "렌즈업체"] = joined_lenses
+            main_rows = _filter_rows(dfs["df"], dfs.rows("df", req_no), "모델명", model_name)
+            if main_rows:
+                dfs.set_values("df", main_rows, {"시리얼번호": joined_serials, "렌즈업체": joined_lenses})
                 
             return True, ""
-        return self._execute_transaction(logic)
+        return self._execute_transaction(logic, journal=("update_serial_list", [req_no, model_name, new_data_list]))
 
     def get_status_list(self):
-        if "Status" in self.df.columns: return sorted(self.df["Status"].astype(str).unique().tolist())
+        if "Status" in self.df.columns: return sorted(str(s) for s in self.df["Status"].unique())
         return []
 
     def get_status_by_req_no(self, req_no):
-        if self.df.empty or "번호" not in self.df.columns: return None
-        mask = self.df["번호"].astype(str) == str(req_no)
-        if mask.any(): return self.df.loc[mask, "Status"].iloc[0]
+        state = self._current()
+        if "Status" not in state.df.columns: return None
+        rows = state.req_index["df"].rows(req_no)
+        if rows: return state.df["Status"].iat[rows[0]]
         return None
 
     def get_serial_list(self, req_no, model_name):
-        if self.serial_df.empty: return []
-        mask = (self.serial_df["요청번호"].astype(str) == str(req_no)) & (self.serial_df["모델명"] == model_name)
-        target_data = self.serial_df[mask].copy()
+        """[수정] Serial_Data를 읽지 않았으면 저장소에서 읽으므로 UI에서는 run_async로 호출"""
+        serial_df = self._lazy_frame("serial")
+        rows = _filter_rows(serial_df, self.find_rows(req_no, "serial"), "모델명", model_name)
+        if not rows: return []
+        target_data = serial_df.iloc[list(rows)].copy()
         try:
             target_data["_sort"] = pd.to_numeric(target_data["순번"])
             target_data = target_data.sort_values("_sort")
@@ -534,31 +1897,55 @@ class DataManager:
         return target_data.to_dict('records')
 
     def get_memos(self, req_no):
-        if self.memo_df.empty: return []
-        mask = self.memo_df["번호"].astype(str) == str(req_no)
-        target_memos = self.memo_df[mask].copy()
-        if target_memos.empty: return []
+        state = self._current()
+        rows = state.req_index["memo"].rows(req_no)
+        if not rows: return []
+        target_memos = state.memo_df.iloc[list(rows)]
         target_memos = target_memos.sort_values(by="일시", ascending=False)
         return target_memos.to_dict('records')
 
+    def get_recent_memo_logs(self, limit=10):
+        """최근 메모 활동 (일시 내림차순). Memo Log 전체를 읽지 않았으면 로드 시 읽어 둔 끝부분 사용"""
+        state = self._current()
+        frame = state.lazy_frames["memo_log"]
+        logs = _fold(frame, state.append_buffers["memo_log"]) if frame is not None else state.memo_log_tail
+        if logs.empty or "일시" not in logs.columns:
+            return logs.iloc[0:0]
+        # 일시가 같으면 나중에 추가된 행이 먼저 오도록 뒤집은 뒤 안정 정렬
+        recent = logs.tail(Config.MEMO_LOG_TAIL_ROWS).iloc[::-1]
+        return recent.sort_values(by="일시", ascending=False, kind="stable").head(limit)
+
+    def get_unchecked_memo_counts(self):
+        """요청번호별 미확인 메모 수 {정규화된 번호: 개수} (데이터 버전마다 groupby 한 번)"""
+        state = self._current()
+        memo_df = state.memo_df
+        version, counts = self._memo_count_cache
+        if version != state.data_version:
+            counts = {}
+            if not memo_df.empty and "번호" in memo_df.columns:
+                checked = memo_df["확인"].astype(str) if "확인" in memo_df.columns else pd.Series("N", index=memo_df.index)
+                unchecked = memo_df.loc[checked != "Y", "번호"]
+                counts = unchecked.map(canonical_req_no).value_counts().to_dict()
+            self._memo_count_cache = (state.data_version, counts)
+        return counts
+
     def get_unchecked_memo_count(self, req_no):
-        if self.memo_df.empty: return 0
-        mask = (self.memo_df["번호"].astype(str) == str(req_no)) & (self.memo_df["확인"] == "N")
-        return len(self.memo_df[mask])
+        return self.get_unchecked_memo_counts().get(canonical_req_no(req_no), 0)
 
     def get_filtered_data(self, status_filter_list=None, search_keyword="", sort_by=None, ascending=True):
-        if self.df.empty: return self.df
-        filtered_df = self.df.copy()
+        df = self.df
+        if df.empty: return df
+        filtered_df = df.copy()
         if not search_keyword:
             if status_filter_list is not None and len(status_filter_list) > 0:
-                filtered_df = filtered_df[filtered_df["Status"].astype(str).isin(status_filter_list)]
+                filtered_df = filtered_df[filtered_df["Status"].isin(status_filter_list)]
             elif status_filter_list is not None and len(status_filter_list) == 0:
                 return filtered_df.iloc[0:0]
         if search_keyword:
             search_cols = [col for col in Config.SEARCH_TARGET_COLS if col in filtered_df.columns]
             if search_cols:
                 mask = pd.Series(False, index=filtered_df.index)
-                for col in search_cols: mask |= filtered_df[col].astype(str).str.contains(search_keyword, case=False, na=False)
+                for col in search_cols: mask |= contains(filtered_df[col], search_keyword)
                 filtered_df = filtered_df[mask]
         if sort_by and sort_by in filtered_df.columns:
             if sort_by == "번호":
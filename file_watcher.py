@@ -0,0 +1,228 @@
+import os
+import threading
+import time
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# ==========================================
+# [FileWatcher] 저장소 파일 변경 감지
+# ==========================================
+# 공유 워크북(또는 SQLite DB)이 바뀌면 백그라운드 스레드에서 알아채고,
+# 짧은 시간 안에 이어지는 이벤트는 하나로 묶어(debounce) on_change를 한 번만 호출한다.
+# - watchdog이 설치되어 있으면 OS 변경 알림을 사용 (거의 즉시 감지)
+# - 없거나 알림을 걸 수 없으면 os.stat 폴링으로 대체
+# - 네트워크 드라이브는 알림이 누락될 수 있으므로 알림을 쓰는 중에도 느린 주기로 폴링을 병행
+# on_change는 감시 스레드에서 호출되므로 UI 작업은 IOExecutor.call_soon 등으로 넘겨야 한다.
+
+
+def _stat_signature(path):
+    try:
+        stat = os.stat(path)
+        return (stat.st_mtime, stat.st_size)
+    except OSError:
+        return None
+
+
+if WATCHDOG_AVAILABLE:
+    class _EventHandler(FileSystemEventHandler):
+        def __init__(self, watcher):
+            super().__init__()
+            self.watcher = watcher
+
+        def on_any_event(self, event):
+            if event.is_directory:
+                return
+            paths = [getattr(event, "src_path", ""), getattr(event, "dest_path", "")]
+            if any(self.watcher.is_watched(p) for p in paths if p):
+                self.watcher.notify()
+
+
+class FileWatcher:
+    DEBOUNCE_SEC = 0.5          # 이벤트 묶음 대기 시간
+    POLL_INTERVAL_SEC = 2.0     # 알림을 못 쓸 때 폴링 주기
+    SAFETY_POLL_SEC = 30.0      # 알림을 쓰는 중 누락 대비 폴링 주기
+
+    def __init__(self, paths_func):
+        """paths_func(): 감시할 파일 경로 목록 (설정 변경에 따라 달라질 수 있으므로 매 주기 다시 확인)"""
+        self.paths_func = paths_func
+        self._on_change = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._deadline = None
+        self._paths = ()
+        self._signatures = {}
+        self._observer = None
+        self._thread = None
+        # [신규] 폴링 주기 조절 (RefreshScheduler) / 상태 표시용
+        self._interval = self.POLL_INTERVAL_SEC
+        self._paused = False
+        self._poll_requested = False
+        self.poll_count = 0         # 폴링 횟수
+        self.change_count = 0       # 감지한 변경 신호 횟수
+        self.last_check = None      # 마지막 폴링 시각 (time.time())
+
+    # ---------------------------------------------------------
+    # 시작 / 중지
+    # ---------------------------------------------------------
+    def start(self, on_change):
+        """감시 시작 — 파일이 바뀌면 (debounce 후) on_change() 호출"""
+        if self._thread is not None:
+            return
+        self._on_change = on_change
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="FileWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        self._stopped.set()
+        self._wake.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+
+    @property
+    def uses_notifications(self):
+        return self._observer is not None
+
+    # ---------------------------------------------------------
+    # 폴링 주기 조절
+    # ---------------------------------------------------------
+    @property
+    def poll_interval(self):
+        """현재 폴링 주기(초) — 알림을 쓰는 중에는 SAFETY_POLL_SEC보다 짧아지지 않음"""
+        if self._observer is not None:
+            return max(self._interval, self.SAFETY_POLL_SEC)
+        return self._interval
+
+    @property
+    def paused(self):
+        return self._paused
+
+    def set_interval(self, seconds):
+        if seconds == self._interval:
+            return
+        self._interval = seconds
+        self._wake.set()
+
+    def pause(self):
+        """폴링 중지 (변경 알림은 계속 받음)"""
+        self._paused = True
+
+    def resume(self, poll_now=False):
+        self._paused = False
+        if poll_now:
+            self._poll_requested = True
+        self._wake.set()
+
+    # ---------------------------------------------------------
+    # 이벤트
+    # ---------------------------------------------------------
+    def is_watched(self, path):
+        norm = os.path.normcase(os.path.abspath(path))
+        return any(norm == os.path.normcase(os.path.abspath(p)) for p in self._paths)
+
+    def notify(self):
+        """변경 신호 (DEBOUNCE_SEC 동안 추가 신호가 없으면 on_change 호출)"""
+        with self._lock:
+            self._deadline = time.monotonic() + self.DEBOUNCE_SEC
+            self.change_count += 1
+        self._wake.set()
+
+    def _run(self):
+        last_poll = None
+        while not self._stopped.is_set():
+            now = time.monotonic()
+
+            due = last_poll is None or now >= last_poll + self.poll_interval
+            if self._poll_requested or (due and not self._paused):
+                self._poll_requested = False
+                self._refresh_paths()
+                self._poll()
+                last_poll = now
+
+            fire = False
+            with self._lock:
+                if self._deadline is not None and now >= self._deadline:
+                    self._deadline = None
+                    fire = True
+                deadline = self._deadline
+            if fire:
+                self._fire()
+
+            # 다음 폴링 또는 debounce 만료까지 대기 (일시 중지 중이면 신호가 올 때까지)
+            timeouts = []
+            if not self._paused:
+                timeouts.append(last_poll + self.poll_interval - time.monotonic())
+            if deadline is not None:
+                timeouts.append(deadline - time.monotonic())
+            self._wake.wait(max(min(timeouts), 0.0) if timeouts else None)
+            self._wake.clear()
+        self._stop_observer()
+
+    def _fire(self):
+        if self._on_change is None:
+            return
+        try:
+            self._on_change()
+        except Exception as e:
+            print(f"파일 변경 처리 오류: {e}")
+
+    # ---------------------------------------------------------
+    # 폴링 / 알림 등록
+    # ---------------------------------------------------------
+    def _poll(self):
+        changed = False
+        for path in self._paths:
+            signature = _stat_signature(path)
+            if path in self._signatures and self._signatures[path] != signature:
+                changed = True
+            self._signatures[path] = signature
+        self.poll_count += 1
+        self.last_check = time.time()
+        if changed:
+            self.notify()
+
+    def _refresh_paths(self):
+        try:
+            paths = tuple(p for p in self.paths_func() if p)
+        except Exception as e:
+            print(f"감시 경로 확인 오류: {e}")
+            return
+        if paths == self._paths:
+            return
+        self._paths = paths
+        self._signatures = {p: _stat_signature(p) for p in paths}
+        self._start_observer()
+
+    def _start_observer(self):
+        self._stop_observer()
+        if not WATCHDOG_AVAILABLE or not self._paths:
+            return
+        try:
+            observer = Observer()
+            handler = _EventHandler(self)
+            for directory in {os.path.dirname(os.path.abspath(p)) for p in self._paths}:
+                observer.schedule(handler, directory, recursive=False)
+            observer.daemon = True
+            observer.start()
+            self._observer = observer
+        except Exception as e:
+            # 알림을 지원하지 않는 경로(일부 네트워크 드라이브 등) → 폴링만 사용
+            print(f"파일 변경 알림 사용 불가, 폴링으로 감시: {e}")
+            self._observer = None
+
+    def _stop_observer(self):
+        observer, self._observer = self._observer, None
+        if observer is None:
+            return
+        try:
+            observer.stop()
+            observer.join(timeout=2)
+        except Exception as e:
+            print(f"파일 변경 알림 종료 오류: {e}")
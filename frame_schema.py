@@ -0,0 +1,143 @@
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
+
+from config import Config
+from request_index import canonical_req_no
+
+# ==========================================
+# [Frame Schema] Data 시트 메모리 스키마
+# ==========================================
+# 저장소에서 읽은 Data 프레임을 컬럼별 타입으로 바꿔 메모리에 둔다.
+# - 범주형(Config.CATEGORY_COLUMNS): Status / 업체명 등 값 종류가 적은 컬럼 (앞뒤 공백 제거) → 메모리 절약, 비교/필터가 범주 코드로 처리됨
+# - 날짜(Config.DATE_COLUMNS): datetime64 (빈 값은 NaT) → 뷰에서 매번 to_datetime으로 다시 파싱하지 않음
+# - 정수(Config.INT_COLUMNS): Int64 (빈 값은 <NA>). 숫자가 아닌 값이 섞여 있으면 원래 값을 지키기 위해 문자열 그대로 둠
+# - 번호: canonical_req_no로 정규화한 문자열
+# - 그 밖의 컬럼: 빈 값은 '-'
+# 화면에 보여줄 때만 display_text로 문자열을 만들고, 저장할 때는 to_storage로 저장소 값(날짜 문자열 등)으로 되돌린다.
+
+MISSING_TEXT = "-"
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def _sorted_categories(series):
+    """범주형 컬럼 정리 (쓰지 않는 범주 제거 + 범주 순서를 값 순서로 → 정렬 결과가 문자열 정렬과 같음)"""
+    series = series.cat.remove_unused_categories()
+    categories = list(series.cat.categories)
+    ordered = sorted(categories, key=str)
+    if categories != ordered:
+        series = series.cat.reorder_categories(ordered)
+    return series
+
+
+def _as_category(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        if series.isna().any():
+            if MISSING_TEXT not in series.cat.categories:
+                series = series.cat.add_categories([MISSING_TEXT])
+            series = series.fillna(MISSING_TEXT)
+        return _sorted_categories(series)
+    return _sorted_categories(series.fillna(MISSING_TEXT).astype(str).str.strip().astype("category"))
+
+
+def _as_dates(series):
+    if is_datetime64_any_dtype(series.dtype):
+        return series
+    return pd.to_datetime(series.mask(series == MISSING_TEXT), errors="coerce", format="mixed")
+
+
+def _as_int(series):
+    if isinstance(series.dtype, pd.Int64Dtype):
+        return series
+    values = series.mask(series == MISSING_TEXT)
+    numbers = pd.to_numeric(values, errors="coerce")
+    # 숫자가 아니거나 정수가 아닌 값이 있으면 변환하지 않음 (전체 저장 시 원래 값이 사라지지 않도록)
+    if (numbers.isna() & values.notna()).any() or (numbers.dropna() % 1 != 0).any():
+        return series.fillna(MISSING_TEXT)
+    return numbers.astype("Int64")
+
+
+def apply_schema(df):
+    """Data 프레임을 메모리 스키마로 변환 (이미 변환된 프레임에 다시 적용해도 같은 결과)"""
+    key_column = Config.REQ_NO_COLUMNS["df"]
+    typed = set(Config.CATEGORY_COLUMNS) | set(Config.DATE_COLUMNS) | set(Config.INT_COLUMNS) | {key_column}
+    df = df.copy()
+    for column in df.columns:
+        if column in typed:
+            continue
+        if df[column].isna().any():
+            df[column] = df[column].fillna(MISSING_TEXT)
+    for column in Config.CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = _as_category(df[column])
+    for column in Config.DATE_COLUMNS:
+        if column in df.columns:
+            df[column] = _as_dates(df[column])
+    for column in Config.INT_COLUMNS:
+        if column in df.columns:
+            df[column] = _as_int(df[column])
+    if key_column in df.columns:
+        df[key_column] = df[key_column].fillna(MISSING_TEXT).map(canonical_req_no).astype(object)
+    return df
+
+
+def parse_date(value):
+    """날짜 입력값 → Timestamp (빈 값 / '-'는 NaT). 날짜로 해석할 수 없으면 ValueError"""
+    if isinstance(value, str):
+        value = value.strip()
+    if value is None or value is pd.NaT or value in ("", MISSING_TEXT):
+        return pd.NaT
+    timestamp = pd.to_datetime(value, errors="coerce")
+    if pd.isna(timestamp):
+        raise ValueError(f"날짜 형식이 올바르지 않습니다: {value} (예: 2025-01-31)")
+    return timestamp
+
+
+def coerce_value(series, value):
+    """컬럼에 대입할 값을 컬럼 타입에 맞춤 (날짜 문자열 → Timestamp 등)
+
+    [수정] 잘못된 날짜는 빈 날짜로 바꾸지 않고 ValueError (입력 단계에서 parse_date로 먼저 확인)
+    """
+    if is_datetime64_any_dtype(series.dtype):
+        return parse_date(value)
+    if isinstance(series.dtype, pd.Int64Dtype):
+        number = pd.to_numeric(value, errors="coerce")
+        return pd.NA if pd.isna(number) else int(number)
+    return value
+
+
+def storage_values(series):
+    """컬럼 값 → 저장소에 쓸 값 (날짜는 'YYYY-MM-DD' 문자열, 빈 날짜/숫자는 None, 숫자 번호는 정수)"""
+    if is_datetime64_any_dtype(series.dtype):
+        return series.dt.strftime(DATE_FORMAT).astype(object).where(series.notna(), None)
+    if isinstance(series.dtype, pd.Int64Dtype):
+        return series.astype(object).where(series.notna(), None)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.astype(object)
+    if series.name == Config.REQ_NO_COLUMNS["df"]:
+        return series.map(lambda v: int(v) if isinstance(v, str) and v.isdigit() and str(int(v)) == v else v)
+    return series
+
+
+def to_storage(df):
+    """메모리 스키마 프레임 → 저장소 값 프레임 (저장 / 변경 셀 비교용)"""
+    return pd.DataFrame({column: storage_values(df[column]) for column in df.columns}, index=df.index)
+
+
+def display_text(value):
+    """셀 값 → 화면 표시 문자열 (날짜는 'YYYY-MM-DD', 빈 값은 '-')"""
+    if value is None or value is pd.NaT or (not isinstance(value, str) and pd.isna(value)):
+        return MISSING_TEXT
+    if isinstance(value, pd.Timestamp):
+        return value.strftime(DATE_FORMAT)
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def contains(series, keyword):
+    """문자열 포함 검색 (대소문자 무시). 범주형은 범주 목록만 검사"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        matched = categories[categories.astype(str).str.contains(keyword, case=False, na=False, regex=False)]
+        return series.isin(matched)
+    return series.astype(str).str.contains(keyword, case=False, na=False, regex=False)
@@ -0,0 +1,135 @@
+import queue
+import threading
+
+# ==========================================
+# [IOExecutor] 백그라운드 I/O 작업자
+# ==========================================
+# 파일 읽기/저장처럼 네트워크 드라이브를 기다리는 작업을 UI 스레드 밖에서 실행한다.
+# - 작업자 스레드는 하나뿐이므로 작업은 제출 순서대로 하나씩 실행된다 (쓰기 직렬화)
+# - 결과는 큐에 쌓이고, UI 스레드가 after()로 큐를 비우면서 콜백을 호출한다
+#   (tkinter 위젯은 작업자 스레드에서 건드리지 않음)
+
+
+class IOExecutor:
+    POLL_INTERVAL_MS = 50
+
+    def __init__(self):
+        self._tasks = queue.Queue()
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = []  # 대기/실행 중인 작업 라벨
+        self._widget = None
+        self._on_busy_change = None
+        self._thread = threading.Thread(target=self._worker, name="IOExecutor", daemon=True)
+        self._thread.start()
+
+    # ---------------------------------------------------------
+    # UI 연결
+    # ---------------------------------------------------------
+    def attach(self, widget, on_busy_change=None):
+        """UI 루트 위젯에 연결 (연결 전에는 submit이 호출 스레드에서 바로 실행됨)
+
+        on_busy_change(busy, label): 진행 중 표시 갱신용 콜백 (UI 스레드에서 호출)
+        """
+        self._widget = widget
+        self._on_busy_change = on_busy_change
+        self._poll()
+
+    def detach(self):
+        self._widget = None
+
+    def wait_idle(self, timeout=None):
+        """대기 중인 작업(특히 저장)이 모두 끝날 때까지 대기 (프로그램 종료 시)"""
+        with self._lock:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
+
+    @property
+    def busy(self):
+        with self._lock:
+            return bool(self._pending)
+
+    @property
+    def current_label(self):
+        with self._lock:
+            return self._pending[0] if self._pending else ""
+
+    # ---------------------------------------------------------
+    # 작업 제출 / 실행
+    # ---------------------------------------------------------
+    def submit(self, func, *args, callback=None, label="처리 중"):
+        """func(*args)를 작업자 스레드에서 실행하고 결과를 callback(*result)으로 전달"""
+        if self._widget is None:
+            self._deliver(callback, self._call(func, args))
+            return
+
+        with self._lock:
+            self._pending.append(label)
+        self._notify_busy()
+        self._tasks.put((func, args, callback))
+
+    def call_soon(self, func, *args):
+        """func(*args)를 UI 스레드에서 실행 (작업자 스레드에서 호출 가능, 연결 전이면 바로 실행)
+
+        실행 중인 작업의 callback보다 먼저 전달된다.
+        """
+        if self._widget is None:
+            self._deliver(func, args)
+            return
+        self._results.put((func, args))
+
+    def _call(self, func, args):
+        try:
+            return func(*args)
+        except Exception as e:
+            print(f"백그라운드 작업 오류: {e}")
+            return False, f"작업 중 오류 발생: {e}"
+
+    def _worker(self):
+        while True:
+            func, args, callback = self._tasks.get()
+            result = self._call(func, args)
+            self._results.put((callback, result))
+            with self._lock:
+                if self._pending: self._pending.pop(0)
+                if not self._pending: self._idle.notify_all()
+
+    def _poll(self):
+        if self._widget is None:
+            return
+        try:
+            if not self._widget.winfo_exists():
+                return
+        except Exception:
+            return
+
+        delivered = False
+        while True:
+            try:
+                callback, result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            delivered = True
+            self._deliver(callback, result)
+
+        if delivered:
+            self._notify_busy()
+        self._widget.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def _deliver(self, callback, result):
+        if callback is None:
+            return
+        try:
+            if isinstance(result, tuple):
+                callback(*result)
+            else:
+                callback(result)
+        except Exception as e:
+            print(f"작업 완료 처리 중 오류: {e}")
+
+    def _notify_busy(self):
+        if self._on_busy_change and self._widget is not None:
+            try:
+                self._on_busy_change(self.busy, self.current_label)
+            except Exception as e:
+                print(f"진행 표시 갱신 오류: {e}")
@@ -1,4 +1,7 @@
+import multiprocessing
+import time
 import tkinter as tk
+from datetime import datetime
 from tkinter import messagebox
 
 import customtkinter as ctk
@@ -12,7 +15,9 @@ except ImportError:
 
 from config import Config
 from data_manager import DataManager
+from file_watcher import FileWatcher
 from popup_manager import PopupManager
+from storage import shutdown_pool
 from styles import COLORS, FONT_FAMILY, FONTS
 from views.calendar_view import CalendarView
 from views.dashboard import DashboardView
@@ -29,6 +34,111 @@ else:
     class BaseApp(ctk.CTk):
         pass
 
+# ==========================================
+# [RefreshScheduler] 외부 변경 확인(폴링) 주기 조절
+# ==========================================
+# 변경이 없으면 폴링 주기를 두 배씩 늘리고(최대 MAX_INTERVAL_SEC), 창이 최소화되었거나
+# 사용자 입력이 IDLE_PAUSE_SEC 동안 없으면 폴링을 멈춘다. 창이 포커스를 잃었거나
+# 모달 팝업이 떠 있으면 UNFOCUSED_MIN_SEC보다 자주 확인하지 않는다.
+# 사용자 입력, 데이터 변경(내 저장 포함)이 있으면 다시 가장 짧은 주기로 돌아간다.
+# 폴링 자체는 FileWatcher 스레드에서 하며, 여기서는 1초마다 상태만 확인한다 (파일 접근 없음).
+class RefreshScheduler:
+    MIN_INTERVAL_SEC = 2.0
+    MAX_INTERVAL_SEC = 60.0
+    UNFOCUSED_MIN_SEC = 15.0
+    IDLE_PAUSE_SEC = 300
+    TICK_MS = 1000
+
+    def __init__(self, app, watcher, on_tick=None):
+        self.app = app
+        self.watcher = watcher
+        self.on_tick = on_tick
+        self.interval = self.MIN_INTERVAL_SEC
+        self.paused = False
+        self.last_activity = time.monotonic()
+        self._poll_count = watcher.poll_count
+        self._change_count = watcher.change_count
+        self._timer = None
+
+    def start(self):
+        for sequence in ("<KeyPress>", "<ButtonPress>", "<MouseWheel>", "<FocusIn>"):
+            self.app.bind_all(sequence, self.on_activity, add="+")
+        self._tick()
+
+    def stop(self):
+        if self._timer:
+            self.app.after_cancel(self._timer)
+            self._timer = None
+
+    def on_activity(self, event=None):
+        self.last_activity = time.monotonic()
+        if self.paused or self.interval > self.MIN_INTERVAL_SEC:
+            self.reset()
+
+    def reset(self):
+        """가장 짧은 주기로 복귀 (일시 중지 중이면 바로 한 번 확인)"""
+        self.interval = self.MIN_INTERVAL_SEC
+        self._apply()
+
+    def _is_focused(self):
+        try:
+            return self.app.focus_displayof() is not None and self.app.grab_current() is None
+        except Exception:
+            return True
+
+    def _tick(self):
+        try:
+            if not self.app.winfo_exists():
+                return
+        except Exception:
+            return
+
+        # 확인했는데 변경이 없었으면 주기를 늘리고, 변경이 있었으면 다시 짧게
+        if self.watcher.change_count != self._change_count:
+            self.interval = self.MIN_INTERVAL_SEC
+        elif self.watcher.poll_count != self._poll_count:
+            self.interval = min(self.interval * 2, self.MAX_INTERVAL_SEC)
+        self._change_count = self.watcher.change_count
+        self._poll_count = self.watcher.poll_count
+
+        self._apply()
+        if self.on_tick:
+            self.on_tick(self)
+        self._timer = self.app.after(self.TICK_MS, self._tick)
+
+    def _apply(self):
+        try:
+            iconified = self.app.state() == "iconic"
+        except Exception:
+            iconified = False
+        idle = time.monotonic() - self.last_activity > self.IDLE_PAUSE_SEC
+        paused = iconified or idle
+
+        interval = self.interval
+        if not self._is_focused():
+            interval = max(interval, self.UNFOCUSED_MIN_SEC)
+        self.watcher.set_interval(interval)
+
+        if paused and not self.paused:
+            self.watcher.pause()
+        elif not paused and self.paused:
+            # 멈춘 동안의 변경을 바로 확인
+            self.watcher.resume(poll_now=True)
+        self.paused = paused
+
+    def status_text(self):
+        """개발자 모드 표시용: 현재 폴링 주기 / 마지막 확인 시각"""
+        last = self.watcher.last_check
+        last_text = datetime.fromtimestamp(last).strftime("%H:%M:%S") if last else "-"
+        if self.paused:
+            rate = "일시 중지"
+        else:
+            rate = f"{self.watcher.poll_interval:.0f}초"
+            if self.watcher.uses_notifications:
+                rate += " (+알림)"
+        return f"폴링 {rate} · 확인 {last_text}"
+
+
 class COXProductionManager(BaseApp):
     def __init__(self):
         super().__init__()
@@ -44,10 +154,15 @@ class COXProductionManager(BaseApp):
         # 종료 이벤트 프로토콜 설정
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
-        self.pm = PopupManager(self, self.dm, self.refresh_ui)
+        # [수정] 데이터 변경 후 화면 갱신은 변경 이벤트(on_data_changed)로 처리하므로
+        # 팝업 완료 시에는 사이드바 상태만 갱신 (설정 팝업은 전체 갱신)
+        self.pm = PopupManager(self, self.dm, self.refresh_ui, change_callback=self.update_sidebar_theme)
 
         self.current_view = None
         self.refresh_timer = None # [수정] 타이머 ID 저장을 위한 변수
+        self._closing = False  # [신규] 종료 처리 중 (남은 저장을 기다리는 동안)
+        # [신규] 저장소 파일 변경 감시 (백그라운드 스레드, UI 스레드는 파일에 접근하지 않음)
+        self.watcher = FileWatcher(self.dm.watch_paths)
 
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -57,30 +172,52 @@ class COXProductionManager(BaseApp):
         
         self.bind("<Button-1>", self.handle_global_click)
 
+        # [신규] 백그라운드 I/O 결과를 UI 스레드에서 받도록 연결
+        self.dm.io.attach(self, on_busy_change=self.update_io_indicator)
+        # [신규] 로드/저장으로 바뀐 요청만 현재 화면에 반영
+        self.dm.subscribe(self.on_data_changed)
+        # [신규] 오프라인 작업 대기열 상태 (대기 건수 표시 / 반영 실패 알림)
+        self.dm.on_journal_change = self.on_journal_change
+
         self.load_data_initial()
+        self.on_journal_change(self.dm.pending_journal_count(), "")
         self.show_dashboard_view()
         
-        # [신규] 자동 새로고침 루프 시작 (5초마다 체크)
-        self.start_auto_refresh_loop()
+        # [수정] 5초 폴링 대신 파일 변경 알림으로 다시 로드
+        self.watcher.start(self.on_external_change)
+        # [신규] 폴링 주기 자동 조절 (변경이 없으면 점점 느리게, 최소화/유휴 시 중지)
+        self.scheduler = RefreshScheduler(self, self.watcher, on_tick=self.update_poll_status)
+        self.scheduler.start()
+        # SQLite 저장소 사용 시 주기적으로 엑셀 내보내기
+        self.start_export_loop()
 
-    # [신규] 외부 데이터 변경 감지 루프
-    def start_auto_refresh_loop(self):
+    # [신규] 외부 데이터 변경 감지 (감시 스레드에서 호출 → UI 스레드로 넘겨서 로드 예약)
+    def on_external_change(self):
+        self.dm.io.call_soon(self._reload_external)
+
+    def _reload_external(self):
         try:
-            # 창이 이미 닫혔다면 루프 중단
             if not self.winfo_exists():
                 return
-
-            # 외부에서 파일이 변경되었는지 확인
-            if self.dm.check_for_external_changes():
-                # 변경되었다면 조용히 데이터 로드 및 UI 갱신
-                success, _ = self.dm.load_data()
-                if success:
-                    self.refresh_ui()
+            # 실제 변경 여부(내가 저장한 것인지 포함)는 작업자 스레드에서 시그니처로 확인
+            self.dm.run_async(self.dm.reload_if_changed, label="")
         except Exception as e:
             print(f"Auto-refresh error: {e}")
-            
-        # [핵심 수정] 5000ms(5초) 후에 다시 실행하며 타이머 ID 저장
-        self.refresh_timer = self.after(5000, self.start_auto_refresh_loop)
+
+    # [수정] 내보내기 주기 확인 (분 단위 설정이므로 1분마다)
+    def start_export_loop(self):
+        try:
+            if not self.winfo_exists():
+                return
+            if not self.dm.io.busy:
+                self.dm.run_async(self.dm.export_if_due, label="")
+                # [신규] 오프라인 작업이 남아 있으면 연결 복구 여부를 주기적으로 확인
+                if self.dm.pending_journal_count():
+                    self.dm.run_async(self.dm.reload_if_changed, label="")
+        except Exception as e:
+            print(f"Auto-export error: {e}")
+
+        self.refresh_timer = self.after(60000, self.start_export_loop)
 
     def create_sidebar(self):
         self.sidebar_frame = ctk.CTkFrame(self, width=220, corner_radius=0, fg_color=COLORS["bg_dark"])
@@ -113,9 +250,50 @@ class COXProductionManager(BaseApp):
             self.nav_buttons[text] = btn
 
         ctk.CTkFrame(self.sidebar_frame, height=1, fg_color=COLORS["border"]).pack(fill="x", pady=20, padx=10, side="bottom")
+        # [신규] 백그라운드 저장/로드 진행 표시
+        self.io_status_label = ctk.CTkLabel(self.sidebar_frame, text="", font=FONTS["main"], text_color=COLORS["warning"])
+        self.io_status_label.pack(fill="x", padx=20, side="bottom")
+        # [신규] 오프라인 대기 작업 수
+        self.offline_status_label = ctk.CTkLabel(self.sidebar_frame, text="", font=FONTS["main"], text_color=COLORS["danger"])
+        self.offline_status_label.pack(fill="x", padx=20, side="bottom")
+        # [신규] 개발자 모드: 외부 변경 확인 주기 / 마지막 확인 시각
+        self.poll_status_label = ctk.CTkLabel(self.sidebar_frame, text="", font=FONTS["small"], text_color=COLORS["text_dim"])
+        self.poll_status_label.pack(fill="x", padx=20, side="bottom")
         ctk.CTkButton(self.sidebar_frame, text="⚙️  설정", command=self.pm.open_settings, height=40, anchor="w", fg_color="transparent", text_color=COLORS["text_dim"], hover_color=COLORS["bg_medium"], font=FONTS["header"]).pack(fill="x", padx=10, pady=5, side="bottom")
         ctk.CTkButton(self.sidebar_frame, text="🔄  데이터 로드", command=self.reload_all_data, height=40, anchor="w", fg_color=COLORS["bg_medium"], text_color=COLORS["text"], hover_color=COLORS["bg_light"], font=FONTS["header"]).pack(fill="x", padx=10, pady=10, side="bottom")
 
+    # [신규] 변경 이벤트 → 현재 화면에 반영 (다른 화면은 전환 시 refresh_data로 다시 그림)
+    def on_data_changed(self, change_set):
+        # [신규] 저장/로드 직후에는 다른 사용자의 후속 변경도 빨리 확인
+        if getattr(self, "scheduler", None):
+            self.scheduler.reset()
+        view = self.current_view
+        if view is None:
+            return
+        if hasattr(view, "apply_changes"):
+            view.apply_changes(change_set)
+        elif hasattr(view, "refresh_data"):
+            view.refresh_data()
+
+    # [신규] 오프라인 대기열 변경 (대기 건수 갱신, 반영하지 못한 작업이 있으면 알림)
+    def on_journal_change(self, pending, report):
+        self.offline_status_label.configure(text=f"📴 오프라인 대기 {pending}건" if pending else "")
+        if report:
+            messagebox.showwarning("오프라인 작업 반영", report)
+
+    # [신규] 개발자 모드에서 폴링 상태 표시
+    def update_poll_status(self, scheduler):
+        text = scheduler.status_text() if self.dm.is_dev_mode else ""
+        if self.poll_status_label.cget("text") != text:
+            self.poll_status_label.configure(text=text)
+
+    # [신규] 백그라운드 작업 진행 표시
+    def update_io_indicator(self, busy, label):
+        if busy and label:
+            self.io_status_label.configure(text=f"⏳ {label}")
+        else:
+            self.io_status_label.configure(text="")
+
     def create_content_area(self):
         self.content_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
         self.content_frame.grid(row=0, column=1, sticky="nsew")
@@ -151,15 +329,19 @@ class COXProductionManager(BaseApp):
     def show_gantt_view(self): self.switch_view("📈  간트 차트", self.view_gantt)
 
     def reload_all_data(self):
-        success, msg = self.dm.load_data()
-        if success:
-            messagebox.showinfo("완료", "데이터를 새로고침했습니다.")
-            self.refresh_ui()
-        else:
-            messagebox.showerror("오류", msg)
+        def done(success, msg):
+            if success:
+                messagebox.showinfo("완료", "데이터를 새로고침했습니다.")
+                # [수정] 바뀐 내용은 변경 이벤트로 이미 반영됨
+                self.update_sidebar_theme()
+            else:
+                messagebox.showerror("오류", msg)
+        self.dm.run_async(self.dm.load_data, callback=done, label="데이터 로드 중...")
 
     def load_data_initial(self):
-        self.dm.load_data()
+        # [신규] 로컬 스냅샷이 있으면 바로 표시하고, 원본 변경 여부는 백그라운드에서 확인
+        self.dm.load_snapshot()
+        self.dm.run_async(self.dm.reload_if_changed, label="데이터 로드 중...")
 
     def refresh_ui(self):
         self.update_sidebar_theme()
@@ -197,14 +379,69 @@ class COXProductionManager(BaseApp):
                     self.view_table.close_dropdown()
 
     def on_closing(self):
+        if self._closing:
+            return
+        self._closing = True
         # [핵심 수정] 종료 시 예약된 자동 새로고침 타이머 취소
         if self.refresh_timer:
             self.after_cancel(self.refresh_timer)
             self.refresh_timer = None
+        # [신규] 파일 변경 감시 중지
+        self.scheduler.stop()
+        self.watcher.stop()
+
+        # [수정] 창을 숨기고 남은 저장을 작업자 스레드에서 마친 뒤 종료 (UI 스레드는 네트워크 저장을 기다리지 않음)
+        self.withdraw()
+        self._exit_deadline = time.time() + Config.EXIT_SAVE_WAIT_SEC
+        self._flush_before_exit()
+        self.after(Config.EXIT_POLL_MS, self._poll_exit)
+
+    def _flush_before_exit(self):
+        """모아 두고 아직 저장하지 않은 작업(지연 저장)을 저장 (앞서 제출된 작업이 끝난 뒤 실행됨)"""
+        self._exit_flushed = None
+        def done(success, msg):
+            self._exit_flushed = (success, msg)
+        self.dm.run_async(self.dm.flush_writes, True, callback=done, label="저장 중...")
+
+    def _poll_exit(self):
+        """저장 결과를 기다렸다가 종료 (실패하면 다시 시도할지, 저장하지 않고 종료할지 확인)"""
+        if self._exit_flushed is not None and not self.dm.io.busy:
+            success, msg = self._exit_flushed
+            if success or not self._ask_exit("저장 실패", f"저장하지 못한 작업이 있습니다.\n{msg}\n\n다시 시도하시겠습니까?\n(취소하면 저장하지 않고 종료합니다.)"):
+                self._finish_closing(saved=success)
+                return
+            self._exit_deadline = time.time() + Config.EXIT_SAVE_WAIT_SEC
+            self._flush_before_exit()
+        elif time.time() > self._exit_deadline:
+            if not self._ask_exit("저장 중", "저장이 아직 끝나지 않았습니다.\n계속 기다리시겠습니까?\n(취소하면 저장을 마치지 않고 종료합니다.)"):
+                self._finish_closing(saved=False)
+                return
+            self._exit_deadline = time.time() + Config.EXIT_SAVE_WAIT_SEC
+        self.after(Config.EXIT_POLL_MS, self._poll_exit)
+
+    def _ask_exit(self, title, message):
+        """종료 중 확인 (다시 시도 / 계속 기다림이면 True)"""
+        self.deiconify()
+        answer = messagebox.askretrycancel(title, message, parent=self)
+        if answer:
+            self.withdraw()
+        return answer
+
+    def _finish_closing(self, saved):
+        self.dm.io.detach()
+        # [신규] 마지막 상태를 로컬 스냅샷으로 보관 (다음 실행 시 즉시 표시)
+        # 저장을 마치지 못했으면 메모리에 저장되지 않은 변경이 있을 수 있으므로 보관하지 않음
+        if saved:
+            self.dm.save_snapshot()
+        # [신규] 병렬 로드용 작업 프로세스 종료
+        shutdown_pool()
             
         self.quit()    
         self.destroy() 
 
+
 if __name__ == "__main__":
+    # [신규] PyInstaller 실행 파일에서 병렬 로드 작업 프로세스가 앱을 다시 띄우지 않도록
+    multiprocessing.freeze_support()
     app = COXProductionManager()
     app.mainloop()
\ No newline at end of file
@@ -3,10 +3,12 @@
 from popups import SettingsPopup, SchedulePopup, CompletePopup, ViewPopup
 
 class PopupManager:
-    def __init__(self, parent, data_manager, refresh_callback):
+    def __init__(self, parent, data_manager, refresh_callback, change_callback=None):
         self.parent = parent
         self.dm = data_manager
         self.refresh_callback = refresh_callback
+        # [신규] 데이터 팝업 완료 후 호출 (화면 갱신은 DataManager 변경 이벤트로 처리됨)
+        self.change_callback = change_callback or refresh_callback
 
     def open_settings(self):
         """환경 설정 팝업을 엽니다."""
@@ -15,15 +17,15 @@ class PopupManager:
 
     def open_schedule_popup(self, req_no):
         """생산 일정 수립 팝업을 엽니다."""
-        win = SchedulePopup(self.parent, self.dm, self.refresh_callback, req_no)
+        win = SchedulePopup(self.parent, self.dm, self.change_callback, req_no)
         win.grab_set()
 
     def open_complete_popup(self, req_no):
         """생산 완료 처리 팝업을 엽니다."""
-        win = CompletePopup(self.parent, self.dm, self.refresh_callback, req_no)
+        win = CompletePopup(self.parent, self.dm, self.change_callback, req_no)
         win.grab_set()
 
     def open_completed_view_popup(self, req_no):
         """완료 데이터 상세 조회 팝업을 엽니다."""
-        win = ViewPopup(self.parent, self.dm, self.refresh_callback, req_no)
+        win = ViewPopup(self.parent, self.dm, self.change_callback, req_no)
         win.grab_set()
@@ -12,6 +12,7 @@ except ImportError:
     DND_AVAILABLE = False
     print("Warning: tkinterdnd2 library not found. Drag and drop will not work.")
 
+from frame_schema import display_text
 from styles import COLORS, FONT_FAMILY, FONTS
 
 
@@ -83,12 +84,15 @@ class BasePopup(ctk.CTkToplevel):
         if not getattr(self.dm, 'is_dev_mode', False):
             return
 
-        target_indices = self.dm.df[self.dm.df["번호"].astype(str) == str(self.req_no)].index
+        # [신규] 화면을 연 시점의 값 (저장 시 바꾼 필드만 반영하고 다른 사용자의 수정과 비교)
+        # [수정] 색인과 프레임을 같은 상태에서 함께 읽음 (백그라운드 저장이 그 사이에 상태를 바꿔도 어긋나지 않도록)
+        read_rows = self.dm.get_request_rows(self.req_no).copy()
+        target_indices = read_rows.index
         if len(target_indices) == 0:
             messagebox.showerror("오류", "데이터를 찾을 수 없습니다.", parent=self)
             return
         
-        first_row = self.dm.df.loc[target_indices[0]]
+        first_row = read_rows.loc[target_indices[0]]
 
         edit_win = ctk.CTkToplevel(self)
         edit_win.title(f"[DEV] 데이터 수정 - {self.req_no}")
@@ -119,10 +123,10 @@ class BasePopup(ctk.CTkToplevel):
             if field == "Status":
                 status_options = ["생산 접수", "대기", "생산중", "중지", "완료"]
                 entry = ctk.CTkOptionMenu(row_frame, values=status_options, height=28, fg_color=COLORS["bg_medium"], text_color=COLORS["text"], button_color=COLORS["primary"], button_hover_color=COLORS["primary_hover"])
-                entry.set(str(val))
+                entry.set(display_text(val))
             else:
                 entry = ctk.CTkEntry(row_frame, height=28)
-                entry.insert(0, str(val))
+                entry.insert(0, display_text(val))
             
             entry.pack(side="left", fill="x", expand=True)
             common_entries[field] = entry
@@ -134,7 +138,7 @@ class BasePopup(ctk.CTkToplevel):
         item_entries = []
 
         for idx in target_indices:
-            row_data = self.dm.df.loc[idx]
+            row_data = read_rows.loc[idx]
             
             item_card = ctk.CTkFrame(container, fg_color=COLORS["bg_dark"])
             item_card.pack(fill="x", pady=5, padx=5)
@@ -143,7 +147,7 @@ class BasePopup(ctk.CTkToplevel):
             r1.pack(fill="x", padx=5, pady=2)
             ctk.CTkLabel(r1, text="모델명:", width=60, anchor="w").pack(side="left")
             e_model = ctk.CTkEntry(r1, width=200)
-            e_model.insert(0, str(row_data.get("모델명", "")))
+            e_model.insert(0, display_text(row_data.get("모델명")))
             e_model.pack(side="left", fill="x", expand=True)
             
             r2 = ctk.CTkFrame(item_card, fg_color="transparent")
@@ -151,12 +155,12 @@ class BasePopup(ctk.CTkToplevel):
             
             ctk.CTkLabel(r2, text="상세:", width=60, anchor="w").pack(side="left")
             e_detail = ctk.CTkEntry(r2, width=150)
-            e_detail.insert(0, str(row_data.get("상세", "")))
+            e_detail.insert(0, display_text(row_data.get("상세")))
             e_detail.pack(side="left", fill="x", expand=True, padx=(0, 10))
             
             ctk.CTkLabel(r2, text="수량:", width=40, anchor="w").pack(side="left")
             e_qty = ctk.CTkEntry(r2, width=60)
-            e_qty.insert(0, str(row_data.get("수량", "")))
+            e_qty.insert(0, display_text(row_data.get("수량")))
             e_qty.pack(side="left")
 
             item_entries.append({
@@ -169,36 +173,31 @@ class BasePopup(ctk.CTkToplevel):
         def save_changes():
             new_common_data = {f: e.get() for f, e in common_entries.items()}
             
-            for idx in target_indices:
-                for col, val in new_common_data.items():
-                    self.dm.df.loc[idx, col] = val
-            
+            new_item_data = []
             for item in item_entries:
-                idx = item["index"]
-                self.dm.df.loc[idx, "모델명"] = item["model"].get()
-                self.dm.df.loc[idx, "상세"] = item["detail"].get()
-                
                 qty_val = item["qty"].get()
                 try:
-                    self.dm.df.loc[idx, "수량"] = int(qty_val)
+                    qty_val = int(qty_val)
                 except:
-                    self.dm.df.loc[idx, "수량"] = qty_val
+                    pass
+                new_item_data.append({"모델명": item["model"].get(), "상세": item["detail"].get(), "수량": qty_val})
             
             edit_win.attributes("-topmost", False)
             self.attributes("-topmost", False)
             
-            success, msg = self.dm.save_to_excel()
-            
-            if success:
-                messagebox.showinfo("성공", "데이터가 수정되었습니다.", parent=edit_win)
-                edit_win.destroy()
-                self.destroy()
-                if self.refresh_callback:
-                    self.refresh_callback()
-            else:
-                messagebox.showerror("실패", msg, parent=edit_win)
-                edit_win.attributes("-topmost", True)
-                self.attributes("-topmost", True)
+            def done(success, msg):
+                if success:
+                    messagebox.showinfo("성공", "데이터가 수정되었습니다.", parent=edit_win)
+                    edit_win.destroy()
+                    self.destroy()
+                    if self.refresh_callback:
+                        self.refresh_callback()
+                else:
+                    messagebox.showerror("실패", msg, parent=edit_win)
+                    edit_win.attributes("-topmost", True)
+                    self.attributes("-topmost", True)
+            # [수정] 메모리 프레임을 직접 고쳐 전체 저장하던 방식 → 바꾼 필드만 트랜잭션으로 저장
+            self.dm.run_async(self.dm.update_request_fields, self.req_no, read_rows, new_common_data, new_item_data, callback=done)
 
         ctk.CTkButton(edit_win, text="모든 변경사항 저장", command=save_changes, fg_color=COLORS["primary"], height=40, font=FONTS["main_bold"]).pack(pady=20, padx=20, fill="x")
 
@@ -246,29 +245,26 @@ class BasePopup(ctk.CTkToplevel):
         
         paths = re.findall(r'\{.*?\}|\S+', files)
         
-        success_count = 0
-        error_msg = ""
+        # [수정] 첨부 파일 복사는 백그라운드에서 (파일별로 완료되는 대로 메모 입력란에 추가)
+        def done(saved_path, error, file_path):
+            if saved_path:
+                current_text = self.memo_entry.get("1.0", "end").strip()
+                new_text = f"[파일첨부] {os.path.basename(saved_path)}\n(경로: {saved_path})"
+                
+                if current_text:
+                    self.memo_entry.insert("end", "\n" + new_text)
+                else:
+                    self.memo_entry.insert("1.0", new_text)
+            else:
+                messagebox.showerror("파일 저장 실패", f"{os.path.basename(file_path)}: {error}", parent=self)
 
         for file_path in paths:
             if file_path.startswith('{') and file_path.endswith('}'):
                 file_path = file_path[1:-1]
             
             if os.path.exists(file_path):
-                saved_path, error = self.dm.save_attachment(file_path)
-                if saved_path:
-                    current_text = self.memo_entry.get("1.0", "end").strip()
-                    new_text = f"[파일첨부] {os.path.basename(saved_path)}\n(경로: {saved_path})"
-                    
-                    if current_text:
-                        self.memo_entry.insert("end", "\n" + new_text)
-                    else:
-                        self.memo_entry.insert("1.0", new_text)
-                    success_count += 1
-                else:
-                    error_msg += f"\n{os.path.basename(file_path)}: {error}"
-        
-        if error_msg:
-             messagebox.showerror("일부 파일 저장 실패", error_msg, parent=self)
+                self.dm.run_async(self.dm.save_attachment, file_path,
+                                  callback=lambda saved, error, f=file_path: done(saved, error, f), label="파일 복사 중...")
 
     def _handle_enter_key(self, event):
         if event.state & 0x0001: 
@@ -282,12 +278,13 @@ class BasePopup(ctk.CTkToplevel):
         if not text:
             return
 
-        success, msg = self.dm.add_memo(self.req_no, text)
-        if success:
-            self.memo_entry.delete("1.0", "end")
-            self._refresh_memo_list()
-        else:
-            messagebox.showerror("오류", f"메모 저장 실패: {msg}", parent=self)
+        def done(success, msg):
+            if success:
+                self.memo_entry.delete("1.0", "end")
+                self._refresh_memo_list()
+            else:
+                messagebox.showerror("오류", f"메모 저장 실패: {msg}", parent=self)
+        self.dm.run_async(self.dm.add_memo, self.req_no, text, callback=done)
 
     def _refresh_memo_list(self):
         for widget in self.memo_scroll.winfo_children():
@@ -392,19 +389,21 @@ class BasePopup(ctk.CTkToplevel):
     def _toggle_check(self, btn, memo):
         current_status = str(memo.get('확인', 'N'))
         new_status = 'N' if current_status == 'Y' else 'Y'
-        success, msg = self.dm.update_memo_check(self.req_no, memo['일시'], memo['내용'], new_status)
-        if success:
-            self._refresh_memo_list()
-        else:
-            messagebox.showerror("오류", f"상태 변경 실패: {msg}", parent=self)
-
-    def _delete_memo_confirm(self, memo):
-        if messagebox.askyesno("메모 삭제", "선택한 메모를 삭제하시겠습니까?", parent=self):
-            success, msg = self.dm.delete_memo(self.req_no, memo['일시'], memo['내용'])
+        def done(success, msg):
             if success:
                 self._refresh_memo_list()
             else:
-                messagebox.showerror("오류", msg, parent=self)
+                messagebox.showerror("오류", f"상태 변경 실패: {msg}", parent=self)
+        self.dm.run_async(self.dm.update_memo_check, self.req_no, memo['일시'], memo['내용'], new_status, callback=done)
+
+    def _delete_memo_confirm(self, memo):
+        if messagebox.askyesno("메모 삭제", "선택한 메모를 삭제하시겠습니까?", parent=self):
+            def done(success, msg):
+                if success:
+                    self._refresh_memo_list()
+                else:
+                    messagebox.showerror("오류", msg, parent=self)
+            self.dm.run_async(self.dm.delete_memo, self.req_no, memo['일시'], memo['내용'], callback=done, label="삭제 중...")
 
     def _open_pdf_file(self, path):
         if not path or str(path).strip() == "-" or str(path).strip() == "":
@@ -435,12 +434,13 @@ class BasePopup(ctk.CTkToplevel):
         else:
             def set_hold():
                 if messagebox.askyesno("중지 설정", f"번호 [{req_no}]를 중지 상태로 변경하시겠습니까?", parent=self):
-                    success, msg = self.dm.update_status_to_hold(req_no)
-                    if success:
-                        self.refresh_callback()
-                        self.destroy()
-                    else:
-                        messagebox.showerror("실패", msg, parent=self)
+                    def done(success, msg):
+                        if success:
+                            self.refresh_callback()
+                            self.destroy()
+                        else:
+                            messagebox.showerror("실패", msg, parent=self)
+                    self.dm.run_async(self.dm.update_status_to_hold, req_no, callback=done)
 
             ctk.CTkButton(parent_frame, text="중지", width=80, fg_color=COLORS["danger"], hover_color=COLORS["danger_hover"], 
                           command=set_hold).pack(side="right", padx=(0, 5))
@@ -451,7 +451,7 @@ class BasePopup(ctk.CTkToplevel):
         ctk.CTkLabel(parent, text=label, font=FONTS["main_bold"], text_color=COLORS["primary"]).grid(row=r, column=real_c, padx=10, pady=5, sticky="nw")
         
         # [수정] kwargs로 wraplength 등을 받을 수 있도록 변경
-        ctk.CTkLabel(parent, text=str(value), font=FONTS["main"], text_color=COLORS["text"], **kwargs).grid(row=r, column=real_c+1, padx=10, pady=5, sticky="w")
+        ctk.CTkLabel(parent, text=display_text(value), font=FONTS["main"], text_color=COLORS["text"], **kwargs).grid(row=r, column=real_c+1, padx=10, pady=5, sticky="w")
 
     def _open_change_date_input(self, req_no, current_date, parent=None):
         master = parent if parent else self
@@ -480,14 +480,15 @@ class BasePopup(ctk.CTkToplevel):
             new_date = entry.get()
             if not new_date: return
             
-            success, msg = self.dm.update_expected_date(req_no, new_date)
-            if success:
-                if hasattr(self, 'lbl_expected_date'):
-                    self.lbl_expected_date.configure(text=new_date)
-                self.refresh_callback()
-                win.destroy()
-            else:
-                messagebox.showerror("실패", msg, parent=win)
+            def done(success, msg):
+                if success:
+                    if hasattr(self, 'lbl_expected_date'):
+                        self.lbl_expected_date.configure(text=new_date)
+                    self.refresh_callback()
+                    win.destroy()
+                else:
+                    messagebox.showerror("실패", msg, parent=win)
+            self.dm.run_async(self.dm.update_expected_date, req_no, new_date, callback=done)
             
         ctk.CTkButton(win, text="변경 저장", command=confirm, fg_color=COLORS["primary"], width=100).pack(pady=10)
         win.focus_force() 
@@ -521,14 +522,14 @@ class BasePopup(ctk.CTkToplevel):
         scroll = ctk.CTkScrollableFrame(win, height=150, corner_radius=6, fg_color=COLORS["bg_medium"])
         scroll.pack(fill="both", expand=True, padx=20, pady=(0, 10))
         
-        target_rows = self.dm.df[self.dm.df["번호"].astype(str) == str(req_no)]
+        target_rows = self.dm.get_request_rows(req_no)
         
         for _, row in target_rows.iterrows():
             item_frame = ctk.CTkFrame(scroll, fg_color="transparent")
             item_frame.pack(fill="x", pady=2)
             
             # 모델명 및 수량
-            model_info = f"[{row.get('모델명')}] {row.get('상세')} ({row.get('수량')}개)"
+            model_info = f"[{display_text(row.get('모델명'))}] {row.get('상세')} ({display_text(row.get('수량'))}개)"
             ctk.CTkLabel(item_frame, text=model_info, font=FONTS["main_bold"], anchor="w").pack(fill="x")
             
             # 시리얼 번호
@@ -544,13 +545,14 @@ class BasePopup(ctk.CTkToplevel):
                 messagebox.showwarning("입력 오류", "날짜를 입력해주세요.", parent=win)
                 return
 
-            success, msg = self.dm.update_status_resume(req_no, new_date)
-            if success:
-                self.refresh_callback()
-                win.destroy()
-                self.destroy()
-            else:
-                messagebox.showerror("실패", msg, parent=win)
+            def done(success, msg):
+                if success:
+                    self.refresh_callback()
+                    win.destroy()
+                    self.destroy()
+                else:
+                    messagebox.showerror("실패", msg, parent=win)
+            self.dm.run_async(self.dm.update_status_resume, req_no, new_date, callback=done)
             
         ctk.CTkButton(win, text="저장 및 생산 재개", command=confirm, fg_color=COLORS["primary"], width=150).pack(pady=10)
         win.focus_force() 
@@ -584,15 +586,16 @@ class BasePopup(ctk.CTkToplevel):
                 messagebox.showwarning("경고", "대기 사유를 입력해주세요.", parent=reason_window)
                 return
             
-            success, msg = self.dm.update_status_to_waiting(self.req_no, reason_text)
-            if success:
-                messagebox.showinfo("성공", "상태가 '대기'로 변경되었습니다.", parent=reason_window)
-                reason_window.destroy()
-                self.destroy()
-                if self.refresh_callback:
-                    self.refresh_callback() 
-            else:
-                messagebox.showerror("실패", msg, parent=reason_window)
+            def done(success, msg):
+                if success:
+                    messagebox.showinfo("성공", "상태가 '대기'로 변경되었습니다.", parent=reason_window)
+                    reason_window.destroy()
+                    self.destroy()
+                    if self.refresh_callback:
+                        self.refresh_callback() 
+                else:
+                    messagebox.showerror("실패", msg, parent=reason_window)
+            self.dm.run_async(self.dm.update_status_to_waiting, self.req_no, reason_text, callback=done)
         
         btn_frame = ctk.CTkFrame(reason_window, fg_color="transparent")
         btn_frame.pack(pady=20)
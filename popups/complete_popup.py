@@ -3,6 +3,7 @@ from tkinter import messagebox
 
 import customtkinter as ctk
 
+from frame_schema import display_text
 from styles import COLORS, FONTS
 
 from .base_popup import BasePopup
@@ -12,7 +13,7 @@ from .serial_input_popup import SerialInputPopup
 class CompletePopup(BasePopup):
     def __init__(self, parent, data_manager, refresh_callback, req_no):
         self.req_no = req_no
-        self.target_rows = data_manager.df[data_manager.df["번호"].astype(str) == str(req_no)]
+        self.target_rows = data_manager.get_request_rows(req_no)
 
         if self.target_rows.empty:
             messagebox.showerror("오류", "데이터를 찾을 수 없습니다.")
@@ -22,6 +23,7 @@ class CompletePopup(BasePopup):
         self.current_status = str(self.first_row.get("Status", ""))
         
         super().__init__(parent, data_manager, refresh_callback, title=f"생산 완료 처리 - 번호 [{req_no}]", geometry="850x700", req_no=req_no)
+        self._edited_models = set()  # 이 창에서 시리얼을 새로 입력한 모델
         self.create_widgets()
 
     def create_widgets(self):
@@ -72,7 +74,7 @@ class CompletePopup(BasePopup):
         date_frame = ctk.CTkFrame(grid_frame, fg_color="transparent")
         date_frame.grid(row=1, column=1, padx=10, pady=5, sticky="w")
         
-        self.lbl_expected_date = ctk.CTkLabel(date_frame, text=str(common_info["출고예정일"]), font=FONTS["main"], text_color=COLORS["text"])
+        self.lbl_expected_date = ctk.CTkLabel(date_frame, text=display_text(common_info["출고예정일"]), font=FONTS["main"], text_color=COLORS["text"])
         self.lbl_expected_date.pack(side="left", padx=(0, 5))
         
         ctk.CTkButton(date_frame, text="변경", width=40, height=20, font=FONTS["small"], 
@@ -87,9 +89,9 @@ class CompletePopup(BasePopup):
         scroll_frame.pack(fill="both", expand=True, padx=20, pady=(0, 10))
 
         for idx, row in self.target_rows.iterrows():
-            model = row.get('모델명')
+            model = display_text(row.get('모델명'))
             detail = row.get('상세')
-            qty = row.get('수량', 0)
+            qty = display_text(row.get('수량'))
             
             card = ctk.CTkFrame(scroll_frame, fg_color=COLORS["bg_medium"])
             card.pack(fill="x", pady=5, padx=5)
@@ -115,11 +117,10 @@ class CompletePopup(BasePopup):
             right = ctk.CTkFrame(card, fg_color="transparent")
             right.pack(side="right", padx=10, pady=10)
             
-            # 현재 입력된 개수 확인
-            saved_count = len(self.dm.get_serial_list(self.req_no, model))
-            
-            status_lbl = ctk.CTkLabel(right, text=f"입력됨: {saved_count}/{qty}", font=FONTS["small"], text_color=COLORS["text_dim"])
+            # [수정] 현재 입력된 개수 확인 (Serial_Data를 읽을 수 있으므로 백그라운드에서 조회 후 표시)
+            status_lbl = ctk.CTkLabel(right, text=f"입력됨: -/{qty}", font=FONTS["small"], text_color=COLORS["text_dim"])
             status_lbl.pack(side="left", padx=10)
+            self._load_serial_count(model, qty, status_lbl)
             
             # [수정] open_serial_popup에 serial_lbl 전달
             btn = ctk.CTkButton(right, text="상세 입력", width=100, 
@@ -143,10 +144,43 @@ class CompletePopup(BasePopup):
         self._open_pdf_file(path)
         self.attributes("-topmost", True)
 
+    def _load_serial_count(self, model, qty, status_label):
+        def done(saved_list, *_):
+            # 조회 실패 / 창을 닫음 / 그 사이에 시리얼을 새로 입력한 경우는 무시
+            if not isinstance(saved_list, list) or model in self._edited_models or not status_label.winfo_exists():
+                return
+            status_label.configure(text=f"입력됨: {len(saved_list)}/{qty}")
+        self.dm.run_async(self.dm.get_serial_list, self.req_no, model, callback=done, label="")
+
     def open_serial_popup(self, model, qty, status_label, serial_label=None):
         def on_save_callback(model_name, data_list):
-            # 1. 데이터 업데이트
-            self.dm.update_serial_list(self.req_no, model_name, data_list)
+            self._edited_models.add(model_name)
+            # [신규] 저장 실패 시 되돌릴 라벨 상태
+            prev_color = status_label.cget("text_color")
+            prev_serial = (serial_label.cget("text"), serial_label.winfo_ismapped()) if serial_label else None
+
+            # [수정] 저장 실패 시 오류 표시 후 라벨을 저장된 상태로 되돌림
+            def done(success, msg):
+                if success or not self.winfo_exists():
+                    return
+                self.attributes("-topmost", False)
+                messagebox.showerror("저장 실패", msg, parent=self)
+                self.attributes("-topmost", True)
+                if status_label.winfo_exists():
+                    # 입력 개수는 저장된 시리얼 목록에서 다시 조회
+                    self._edited_models.discard(model_name)
+                    status_label.configure(text=f"입력됨: -/{qty}", text_color=prev_color)
+                    self._load_serial_count(model_name, qty, status_label)
+                if prev_serial and serial_label.winfo_exists():
+                    text, mapped = prev_serial
+                    serial_label.configure(text=text)
+                    if mapped:
+                        serial_label.pack(anchor="w", pady=(5, 0))
+                    else:
+                        serial_label.pack_forget()
+
+            # 1. 데이터 업데이트 (백그라운드 저장)
+            self.dm.run_async(self.dm.update_serial_list, self.req_no, model_name, data_list, callback=done)
             
             # 2. 상태 라벨 업데이트 (입력 개수)
             current_len = len(data_list)
@@ -179,9 +213,7 @@ class CompletePopup(BasePopup):
         self.attributes("-topmost", True)
         
         if answer:
-            try:
-                success, msg = self.dm.finalize_production(self.req_no, self.e_date.get())
-                
+            def done(success, msg):
                 if success:
                     self.attributes("-topmost", False)
                     messagebox.showinfo("성공", "생산 완료 처리되었습니다.", parent=self)
@@ -191,8 +223,5 @@ class CompletePopup(BasePopup):
                     self.attributes("-topmost", False)
                     messagebox.showerror("실패", msg, parent=self)
                     self.attributes("-topmost", True)
-                    
-            except Exception as e:
-                self.attributes("-topmost", False)
-                messagebox.showerror("오류", f"저장 중 오류: {e}", parent=self)
-                self.attributes("-topmost", True)
\ No newline at end of file
+            # 시리얼 저장 등 앞서 제출된 작업이 끝난 뒤 순서대로 실행됨
+            self.dm.run_async(self.dm.finalize_production, self.req_no, self.e_date.get(), callback=done)
\ No newline at end of file
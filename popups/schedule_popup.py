@@ -3,6 +3,7 @@ from tkinter import messagebox
 
 import customtkinter as ctk
 
+from frame_schema import display_text
 from styles import COLORS, FONTS
 
 from .base_popup import BasePopup
@@ -11,7 +12,7 @@ from .base_popup import BasePopup
 class SchedulePopup(BasePopup):
     def __init__(self, parent, data_manager, refresh_callback, req_no):
         self.req_no = req_no
-        self.target_rows = data_manager.df[data_manager.df["번호"].astype(str) == str(req_no)]
+        self.target_rows = data_manager.get_request_rows(req_no)
         
         if self.target_rows.empty:
             messagebox.showerror("오류", "데이터를 찾을 수 없습니다.")
@@ -94,8 +95,8 @@ class SchedulePopup(BasePopup):
             card.pack(fill="x", pady=5, padx=5)
             left = ctk.CTkFrame(card, fg_color="transparent")
             left.pack(side="left", fill="both", expand=True, padx=10, pady=10)
-            ctk.CTkLabel(left, text=f"[{row.get('모델명')}] {row.get('상세')}", font=FONTS["main_bold"]).pack(anchor="w")
-            ctk.CTkLabel(left, text=f"수량: {row.get('수량')}", font=FONTS["main"], text_color=COLORS["warning"]).pack(anchor="w")
+            ctk.CTkLabel(left, text=f"[{display_text(row.get('모델명'))}] {row.get('상세')}", font=FONTS["main_bold"]).pack(anchor="w")
+            ctk.CTkLabel(left, text=f"수량: {display_text(row.get('수량'))}", font=FONTS["main"], text_color=COLORS["warning"]).pack(anchor="w")
 
             # [신규] 시리얼 번호가 있으면 표시
             serials = str(row.get('시리얼번호', '')).strip()
@@ -114,9 +115,9 @@ class SchedulePopup(BasePopup):
         self.date_entry = ctk.CTkEntry(footer, width=200, placeholder_text="yyyy-mm-dd")
         self.date_entry.pack(side="left", padx=(0, 20))
         
-        old_expected = self.first_row.get("출고예정일", "")
-        if old_expected and str(old_expected) != "-" and str(old_expected) != "NaT":
-             self.date_entry.insert(0, str(old_expected))
+        old_expected = display_text(self.first_row.get("출고예정일"))
+        if old_expected != "-":
+             self.date_entry.insert(0, old_expected)
         else:
              self.date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
 
@@ -132,13 +133,14 @@ class SchedulePopup(BasePopup):
 
     def delete_entry(self):
         if messagebox.askyesno("삭제 확인", f"정말로 요청 번호 [{self.req_no}]의 모든 데이터를 삭제하시겠습니까?\n이 작업은 되돌릴 수 없습니다.", parent=self):
-            success, msg = self.dm.delete_request(self.req_no)
-            if success:
-                messagebox.showinfo("삭제 완료", "데이터가 성공적으로 삭제되었습니다.", parent=self.master)
-                self.destroy()
-                self.refresh_callback()
-            else:
-                messagebox.showerror("삭제 실패", msg, parent=self)
+            def done(success, msg):
+                if success:
+                    messagebox.showinfo("삭제 완료", "데이터가 성공적으로 삭제되었습니다.", parent=self.master)
+                    self.destroy()
+                    self.refresh_callback()
+                else:
+                    messagebox.showerror("삭제 실패", msg, parent=self)
+            self.dm.run_async(self.dm.delete_request, self.req_no, callback=done, label="삭제 중...")
 
     def confirm(self):
         date_str = self.date_entry.get()
@@ -146,13 +148,11 @@ class SchedulePopup(BasePopup):
             messagebox.showwarning("경고", "날짜 형식을 확인해주세요 (yyyy-mm-dd)", parent=self)
             return
         
-        try:
-            success, msg = self.dm.update_production_schedule(self.req_no, date_str)
+        def done(success, msg):
             if success:
                 messagebox.showinfo("성공", "생산 일정이 등록/수정 되었습니다.", parent=self)
                 self.destroy()
                 self.refresh_callback() 
             else:
                 messagebox.showerror("실패", msg, parent=self)
-        except Exception as e:
-            messagebox.showerror("오류", f"오류 발생: {e}", parent=self)
\ No newline at end of file
+        self.dm.run_async(self.dm.update_production_schedule, self.req_no, date_str, callback=done)
\ No newline at end of file
@@ -90,13 +90,22 @@ class SerialInputPopup(ctk.CTkToplevel):
         ctk.CTkButton(footer, text="취소", fg_color=COLORS["bg_light"], text_color=COLORS["text"], 
                       command=self.destroy).pack(side="left")
                       
-        ctk.CTkButton(footer, text="입력 완료 (임시 저장)", fg_color=COLORS["primary"], 
-                      command=self.save_temp).pack(side="right")
+        # [수정] 저장된 시리얼을 불러오기 전에는 저장 불가 (불러오기 전 빈 목록으로 덮어쓰지 않도록)
+        self.btn_save = ctk.CTkButton(footer, text="입력 완료 (임시 저장)", fg_color=COLORS["primary"], 
+                                      command=self.save_temp, state="disabled")
+        self.btn_save.pack(side="right")
 
     def load_initial_data(self):
-        # 기존 저장된 데이터 불러오기
-        saved_list = self.dm.get_serial_list(self.req_no, self.model_name)
-        
+        # [수정] 기존 저장된 데이터 불러오기 (Serial_Data를 읽을 수 있으므로 백그라운드에서 조회)
+        self.dm.run_async(self.dm.get_serial_list, self.req_no, self.model_name, callback=self._fill_saved, label="")
+
+    def _fill_saved(self, saved_list, *error):
+        if not self.winfo_exists():
+            return
+        if not isinstance(saved_list, list):
+            messagebox.showerror("오류", error[0] if error else "저장된 시리얼을 불러오지 못했습니다.", parent=self)
+            return
+
         # 순번(seq)을 key로 하는 딕셔너리로 변환
         data_map = {}
         for item in saved_list:
@@ -113,6 +122,7 @@ class SerialInputPopup(ctk.CTkToplevel):
                 row["sn"].insert(0, str(data.get("시리얼번호", "")))
                 row["lens"].insert(0, str(data.get("렌즈업체", "")))
                 row["note"].insert(0, str(data.get("비고", "")))
+        self.btn_save.configure(state="normal")
 
     def open_autofill_dialog(self):
         # 자동 채우기 팝업
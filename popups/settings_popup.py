@@ -3,6 +3,7 @@ from tkinter import filedialog, messagebox, simpledialog
 import customtkinter as ctk
 
 from config import Config
+from storage import READER_CHOICES, available_engines
 from styles import COLORS, FONT_FAMILY, FONTS
 
 from .base_popup import BasePopup
@@ -10,7 +11,7 @@ from .base_popup import BasePopup
 
 class SettingsPopup(BasePopup):
     def __init__(self, parent, data_manager, refresh_callback):
-        super().__init__(parent, data_manager, refresh_callback, title="환경 설정", geometry="500x550")
+        super().__init__(parent, data_manager, refresh_callback, title="환경 설정", geometry="500x690")
         self.create_widgets()
 
     def create_widgets(self):
@@ -68,6 +69,26 @@ class SettingsPopup(BasePopup):
         # 구분선
         ctk.CTkFrame(parent, height=1, fg_color=COLORS["border"]).pack(fill="x", padx=20, pady=20)
 
+        # [신규] 엑셀 읽기 엔진 설정
+        reader_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        reader_frame.pack(fill="x", padx=20)
+
+        ctk.CTkLabel(reader_frame, text="엑셀 읽기 엔진", font=FONTS["main_bold"]).pack(side="left")
+
+        # 설치되지 않은 엔진은 목록에서 제외 (auto는 항상 표시)
+        engines = ["auto"] + [e for e in READER_CHOICES if e in available_engines()]
+        self.reader_var = ctk.StringVar(value=self.dm.excel_reader if self.dm.excel_reader in engines else "auto")
+        ctk.CTkOptionMenu(reader_frame, values=engines, variable=self.reader_var, width=140,
+                          font=(FONT_FAMILY, 12)).pack(side="right")
+
+        # [신규] 병렬 로드 (시트별로 다른 코어에서 파싱)
+        self.parallel_var = ctk.BooleanVar(value=self.dm.parallel_load)
+        ctk.CTkCheckBox(parent, text="병렬 로드 (다중 코어로 전체 시트 읽기)", variable=self.parallel_var,
+                        font=(FONT_FAMILY, 12)).pack(padx=20, pady=(10, 0), anchor="w")
+
+        # 구분선
+        ctk.CTkFrame(parent, height=1, fg_color=COLORS["border"]).pack(fill="x", padx=20, pady=20)
+
         # 4. 개발자 모드 설정
         dev_frame = ctk.CTkFrame(parent, fg_color="transparent")
         dev_frame.pack(fill="x", padx=20)
@@ -138,6 +159,16 @@ class SettingsPopup(BasePopup):
                 
                 ctk.CTkButton(self.dev_tools_frame, text="🧹 로그 정리 (3개월)", width=120, height=30,
                               fg_color=COLORS["warning"], command=self.do_clean_logs).pack(side="left")
+
+                # [신규] 엑셀 저장소 사용 시 직전 저장본으로 되돌리기
+                if self.dm.storage.name == "excel":
+                    ctk.CTkButton(self.dev_tools_frame, text="⏪ 직전 저장본 복원", width=120, height=30,
+                                  fg_color=COLORS["danger"], command=self.do_restore_previous).pack(side="left", padx=(10, 0))
+
+                # [신규] SQLite 저장소 사용 시 엑셀 내보내기
+                if self.dm.storage.name == "sqlite":
+                    ctk.CTkButton(self.dev_tools_frame, text="📤 엑셀 내보내기", width=120, height=30,
+                                  fg_color=COLORS["primary"], command=self.do_export_excel).pack(side="left", padx=(10, 0))
             else:
                 self.dev_var.set(False)
                 messagebox.showerror("인증 실패", "비밀번호가 올바르지 않습니다.", parent=self)
@@ -149,21 +180,45 @@ class SettingsPopup(BasePopup):
     def do_backup(self):
         self.attributes("-topmost", False)
         if messagebox.askyesno("백업", "현재 데이터의 백업본을 생성하시겠습니까?", parent=self):
-            success, msg = self.dm.create_backup()
-            if success:
-                messagebox.showinfo("성공", msg, parent=self)
-            else:
-                messagebox.showerror("실패", msg, parent=self)
+            def done(success, msg):
+                if success:
+                    messagebox.showinfo("성공", msg, parent=self)
+                else:
+                    messagebox.showerror("실패", msg, parent=self)
+            self.dm.run_async(self.dm.create_backup, callback=done, label="백업 중...")
         self.attributes("-topmost", True)
 
     def do_clean_logs(self):
         self.attributes("-topmost", False)
         if messagebox.askyesno("로그 정리", "3개월이 지난 로그 데이터를 삭제하여 파일 크기를 줄이시겠습니까?\n이 작업은 되돌릴 수 없습니다.", parent=self):
-            success, msg = self.dm.clean_old_logs()
-            if success:
-                messagebox.showinfo("성공", msg, parent=self)
-            else:
-                messagebox.showerror("실패", msg, parent=self)
+            def done(success, msg):
+                if success:
+                    messagebox.showinfo("성공", msg, parent=self)
+                else:
+                    messagebox.showerror("실패", msg, parent=self)
+            self.dm.run_async(self.dm.clean_old_logs, callback=done, label="로그 정리 중...")
+        self.attributes("-topmost", True)
+
+    def do_restore_previous(self):
+        self.attributes("-topmost", False)
+        if messagebox.askyesno("직전 저장본 복원", "마지막 저장 직전의 파일로 되돌리시겠습니까?\n마지막 저장 내용은 취소됩니다. (다시 복원하면 되돌릴 수 있습니다)", parent=self):
+            def done(success, msg):
+                if success:
+                    messagebox.showinfo("성공", msg, parent=self)
+                else:
+                    messagebox.showerror("실패", msg, parent=self)
+            self.dm.run_async(self.dm.restore_previous_save, callback=done, label="복원 중...")
+        self.attributes("-topmost", True)
+
+    def do_export_excel(self):
+        self.attributes("-topmost", False)
+        if messagebox.askyesno("엑셀 내보내기", f"현재 DB 내용을 엑셀 파일로 내보내시겠습니까?\n{self.dm.current_excel_path}", parent=self):
+            def done(success, msg):
+                if success:
+                    messagebox.showinfo("성공", msg, parent=self)
+                else:
+                    messagebox.showerror("실패", msg, parent=self)
+            self.dm.run_async(self.dm.export_to_excel, callback=done, label="내보내는 중...")
         self.attributes("-topmost", True)
 
     def save(self):
@@ -173,7 +228,7 @@ class SettingsPopup(BasePopup):
         
         if new_path:
             try:
-                self.dm.save_config(new_path, new_theme, new_attachment_dir)
+                self.dm.save_config(new_path, new_theme, new_attachment_dir, self.reader_var.get(), self.parallel_var.get())
                 
                 self.attributes("-topmost", False)
                 messagebox.showinfo("설정 저장", "설정이 저장되었습니다.", parent=self)
@@ -2,6 +2,7 @@ from tkinter import messagebox
 
 import customtkinter as ctk
 
+from frame_schema import display_text
 from styles import COLORS, FONTS
 
 from .base_popup import BasePopup
@@ -11,7 +12,7 @@ from .serial_input_popup import SerialInputPopup
 class ViewPopup(BasePopup):
     def __init__(self, parent, data_manager, refresh_callback, req_no):
         self.req_no = req_no
-        self.target_rows = data_manager.df[data_manager.df["번호"].astype(str) == str(req_no)]
+        self.target_rows = data_manager.get_request_rows(req_no)
 
         if self.target_rows.empty:
             messagebox.showerror("오류", "데이터를 찾을 수 없습니다.")
@@ -70,7 +71,7 @@ class ViewPopup(BasePopup):
             
             ctk.CTkLabel(
                 grid_frame, 
-                text=str(value), 
+                text=display_text(value), 
                 font=FONTS["main"],
                 text_color=COLORS["text"]
             ).grid(row=r, column=c+1, padx=15, pady=8, sticky="w")
@@ -87,8 +88,8 @@ class ViewPopup(BasePopup):
             content = ctk.CTkFrame(card, fg_color="transparent")
             content.pack(side="left", fill="both", expand=True, padx=15, pady=10)
 
-            model_name = row.get('모델명')
-            qty = row.get('수량')
+            model_name = display_text(row.get('모델명'))
+            qty = display_text(row.get('수량'))
             model_info = f"[{model_name}] {row.get('상세')}"
             ctk.CTkLabel(content, text=model_info, font=FONTS["main_bold"]).pack(anchor="w")
 
@@ -97,7 +98,7 @@ class ViewPopup(BasePopup):
             
             infos_top = [
                 f"수량: {qty}",
-                f"렌즈: {row.get('렌즈업체')}"
+                f"렌즈: {display_text(row.get('렌즈업체'))}"
             ]
             
             for info in infos_top:
@@ -143,13 +144,14 @@ class ViewPopup(BasePopup):
 
     def delete_entry(self):
         if messagebox.askyesno("삭제 확인", f"정말로 요청 번호 [{self.req_no}]의 모든 데이터를 삭제하시겠습니까?\n이 작업은 되돌릴 수 없습니다.", parent=self):
-            success, msg = self.dm.delete_request(self.req_no)
-            if success:
-                messagebox.showinfo("삭제 완료", "데이터가 성공적으로 삭제되었습니다.", parent=self.master)
-                self.destroy()
-                self.refresh_callback()
-            else:
-                messagebox.showerror("삭제 실패", msg, parent=self)
+            def done(success, msg):
+                if success:
+                    messagebox.showinfo("삭제 완료", "데이터가 성공적으로 삭제되었습니다.", parent=self.master)
+                    self.destroy()
+                    self.refresh_callback()
+                else:
+                    messagebox.showerror("삭제 실패", msg, parent=self)
+            self.dm.run_async(self.dm.delete_request, self.req_no, callback=done, label="삭제 중...")
 
     def open_serial_popup(self, model, qty):
         popup = None
@@ -157,18 +159,18 @@ class ViewPopup(BasePopup):
             if popup: popup.attributes("-topmost", False)
             self.attributes("-topmost", False)
 
-            self.dm.update_serial_list(self.req_no, model_name, data_list)
-            success, msg = self.dm.save_to_excel()
-            
-            target_parent = popup if popup else self
-
-            if success:
-                if self.refresh_callback: self.refresh_callback()
-                messagebox.showinfo("저장 완료", "수정된 내용이 저장되었습니다.", parent=target_parent)
-                self.destroy()
-            else:
-                messagebox.showerror("저장 실패", msg, parent=target_parent)
-                if popup: popup.attributes("-topmost", True)
-                self.attributes("-topmost", True)
+            # [수정] update_serial_list가 트랜잭션으로 저장까지 처리 (별도 save_to_excel 불필요)
+            def done(success, msg):
+                target_parent = popup if popup else self
+
+                if success:
+                    if self.refresh_callback: self.refresh_callback()
+                    messagebox.showinfo("저장 완료", "수정된 내용이 저장되었습니다.", parent=target_parent)
+                    self.destroy()
+                else:
+                    messagebox.showerror("저장 실패", msg, parent=target_parent)
+                    if popup: popup.attributes("-topmost", True)
+                    self.attributes("-topmost", True)
+            self.dm.run_async(self.dm.update_serial_list, self.req_no, model_name, data_list, callback=done)
 
         popup = SerialInputPopup(self, self.dm, self.req_no, model, qty, on_save_callback)
\ No newline at end of file
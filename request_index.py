@@ -0,0 +1,72 @@
+from bisect import bisect_left
+
+# ==========================================
+# [RequestIndex] 요청번호 → 행 위치 색인
+# ==========================================
+# 프레임 전체에 astype(str) == req_no 마스크를 만드는 대신
+# 정규화한 요청번호로 행 위치(iloc 기준)를 바로 찾는다.
+# 행 위치 목록은 tuple로 보관하므로 조회 결과를 그대로 돌려줘도 안전하다.
+
+_NO_ROWS = ()
+
+
+def canonical_req_no(value):
+    """요청번호 정규화 (숫자로 읽힌 1234.0 → "1234", 앞뒤 공백 제거)"""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+class RequestIndex:
+    def __init__(self, values=()):
+        rows = {}
+        size = 0
+        for pos, value in enumerate(values):
+            rows.setdefault(canonical_req_no(value), []).append(pos)
+            size += 1
+        self._rows = {key: tuple(positions) for key, positions in rows.items()}
+        self.size = size
+
+    @classmethod
+    def from_frame(cls, frame, column):
+        if column not in frame.columns:
+            return cls([None] * len(frame))
+        return cls(frame[column].tolist())
+
+    def rows(self, req_no):
+        """요청번호의 행 위치 tuple (없으면 빈 tuple)"""
+        return self._rows.get(canonical_req_no(req_no), _NO_ROWS)
+
+    def __contains__(self, req_no):
+        return canonical_req_no(req_no) in self._rows
+
+    def keys(self):
+        return self._rows.keys()
+
+    def copy(self):
+        # 값이 tuple이므로 얕은 복사로 충분 (수정 시 tuple 자체를 교체)
+        new = RequestIndex()
+        new._rows = dict(self._rows)
+        new.size = self.size
+        return new
+
+    def append(self, values):
+        """프레임 끝에 행이 추가된 경우"""
+        for value in values:
+            key = canonical_req_no(value)
+            self._rows[key] = self._rows.get(key, _NO_ROWS) + (self.size,)
+            self.size += 1
+
+    def remove(self, positions):
+        """행이 삭제된 경우 (남은 행의 위치를 앞으로 당김)"""
+        removed = sorted(set(positions))
+        if not removed:
+            return
+        removed_set = set(removed)
+        new_rows = {}
+        for key, rows in self._rows.items():
+            kept = tuple(p - bisect_left(removed, p) for p in rows if p not in removed_set)
+            if kept:
+                new_rows[key] = kept
+        self._rows = new_rows
+        self.size -= len(removed)
@@ -0,0 +1,12 @@
+# storage/__init__.py
+
+from .atomic_save import SaveVerificationError, previous_path, save_atomically, verify_workbook
+from .diff import FrameDiff, diff_frames
+from .excel_readers import READER_CHOICES, available_engines, read_excel_sheets
+from .excel_storage import ExcelStorage, write_excel_file
+from .offline_journal import JournalBusyError, OfflineJournal
+from .parallel_reader import read_sheets_parallel, shutdown_pool
+from .snapshot import load_snapshot, save_snapshot
+from .sqlite_storage import SqliteStorage
+from .write_lease import StorageBusyError, WriteLease
+from .xlsx_patch import PatchNotApplicable, write_patched_workbook
@@ -0,0 +1,133 @@
+import errno
+import os
+import tempfile
+import zipfile
+from contextlib import nullcontext
+
+from .xlsx_reader import sheet_layout
+
+# ==========================================
+# [Atomic Save] 임시 파일 저장 → 검증 → 교체
+# ==========================================
+# 워크북을 원본에 바로 쓰지 않고 같은 폴더의 임시 파일에 쓴 뒤,
+# 다시 열어서 검증하고 os.replace로 한 번에 교체한다.
+# - 저장 도중 프로그램 종료 / 네트워크 끊김이 생겨도 원본은 그대로 남는다 (임시 파일만 버려짐)
+# - 교체 직전 원본을 "<이름>.prev<확장자>"로 보관 (하드 링크 → 복사 비용 없음) → 직전 저장본으로 되돌리기
+# - 같은 폴더에 만들어야 교체가 같은 볼륨 안의 이름 변경(원자적)이 된다
+
+
+class SaveVerificationError(Exception):
+    """임시 파일로 저장한 워크북을 다시 열어 확인했을 때 내용이 올바르지 않은 경우 (원본은 바뀌지 않음)"""
+
+
+def previous_path(path):
+    """직전 저장본 경로 (생산요청.xlsx → 생산요청.prev.xlsx)"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.prev{ext}"
+
+
+def verify_workbook(path, expected):
+    """저장된 xlsx 검증 — zip 전체 CRC 확인 + 시트별 헤더 / 행 수 확인
+
+    expected: {시트 이름: (헤더 컬럼 리스트, 데이터 행 수 또는 None)}
+    """
+    try:
+        with zipfile.ZipFile(path) as zin:
+            bad = zin.testzip()
+    except (zipfile.BadZipFile, OSError) as e:
+        raise SaveVerificationError(f"저장한 파일을 열 수 없습니다: {e}")
+    if bad:
+        raise SaveVerificationError(f"저장한 파일이 손상되었습니다: {bad}")
+
+    for sheet_name, (header, rows) in expected.items():
+        layout = sheet_layout(path, sheet_name)
+        if layout is None:
+            raise SaveVerificationError(f"[{sheet_name}] 시트가 없습니다.")
+        columns, row_count = layout
+        if [str(c) for c in header] != columns[:len(header)]:
+            raise SaveVerificationError(f"[{sheet_name}] 시트의 헤더가 다릅니다.")
+        if rows is not None and rows != row_count:
+            raise SaveVerificationError(f"[{sheet_name}] 시트의 행 수가 다릅니다. ({row_count} / 예상 {rows})")
+
+
+def expected_from_frames(frames):
+    """{시트 이름: DataFrame} → verify_workbook 기대값 (헤더 + 행 수)"""
+    return {name: (list(frame.columns), len(frame)) for name, frame in frames.items()}
+
+
+def expected_from_diffs(sheet_diffs):
+    """{시트 이름: FrameDiff} → verify_workbook 기대값 (행 수는 전체 재작성 / 행 추가 시에만 확인)"""
+    expected = {}
+    for name, diff in sheet_diffs.items():
+        if diff.rewrite:
+            rows = len(diff.rows)
+        elif diff.appended:
+            rows = diff.append_at + len(diff.appended)
+        else:
+            rows = None
+        expected[name] = (diff.columns, rows)
+    return expected
+
+
+# fsync를 지원하지 않는 파일 시스템이 돌려주는 오류 (Windows FlushFileBuffers의 ERROR_INVALID_FUNCTION → EINVAL)
+_FSYNC_UNSUPPORTED = {errno.EINVAL, getattr(errno, "ENOTSUP", errno.EINVAL), getattr(errno, "EOPNOTSUPP", errno.EINVAL)}
+
+
+def _fsync(path):
+    """임시 파일을 디스크에 기록 (Windows는 쓰기 가능한 핸들이어야 FlushFileBuffers가 동작하므로 읽기/쓰기로 엶)"""
+    fd = os.open(path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        if e.errno not in _FSYNC_UNSUPPORTED:
+            raise
+        # 일부 네트워크 파일 시스템은 fsync를 지원하지 않음 → 검증 후 교체는 그대로 진행
+        print(f"저장 파일 디스크 기록(fsync)을 지원하지 않는 위치입니다: {e}")
+    finally:
+        os.close(fd)
+
+
+def _keep_previous(path):
+    """현재 원본을 직전 저장본으로 보관 (하드 링크를 지원하지 않으면 False → 교체 시 이름 변경으로 보관)"""
+    prev = previous_path(path)
+    staged = f"{prev}.{os.getpid()}.tmp"
+    try:
+        os.link(path, staged)
+    except OSError:
+        return False
+    os.replace(staged, prev)
+    return True
+
+
+def save_atomically(path, write_func, expected=None, keep_previous=True, guard=None):
+    """write_func(임시 경로)로 저장 → 검증 → 원본과 교체
+
+    expected: verify_workbook에 넘길 시트별 기대값 (None이면 zip 무결성만 확인)
+    keep_previous: 교체 전 원본을 직전 저장본으로 보관
+    guard: 교체 구간에서만 잡을 컨텍스트 (예: 쓰기 잠금 hold) — 쓰기/검증 동안은 잡지 않음
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    name, ext = os.path.splitext(os.path.basename(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".~{name}", suffix=f".tmp{ext}", dir=directory)
+    os.close(fd)
+    try:
+        write_func(tmp_path)
+        _fsync(tmp_path)
+        verify_workbook(tmp_path, expected or {})
+
+        with guard() if guard else nullcontext():
+            linked = keep_previous and os.path.exists(path) and _keep_previous(path)
+            if keep_previous and not linked and os.path.exists(path):
+                # 하드 링크 불가 → 원본 이름을 바꿔 보관한 뒤 교체 (교체 실패 시 되돌림)
+                prev = previous_path(path)
+                os.replace(path, prev)
+                try:
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    os.replace(prev, path)
+                    raise
+            else:
+                os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
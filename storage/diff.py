@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+
+class FrameDiff:
+    """저장된 프레임(before) 대비 변경 내역
+
+    - columns: 시트 헤더 (컬럼 순서)
+    - cells: {행 위치: {열 위치: 새 값}} (기존 행의 셀 단위 변경)
+    - appended: 끝에 추가된 행들의 값 리스트 (append_at 위치부터)
+    - rows: 행 삭제/재정렬 등으로 시트 전체를 다시 써야 하는 경우 전체 행 값 (아니면 None)
+    """
+
+    def __init__(self, columns, cells=None, appended=None, append_at=0, rows=None):
+        self.columns = list(columns)
+        self.cells = cells or {}
+        self.appended = appended or []
+        self.append_at = append_at
+        self.rows = rows
+
+    @property
+    def rewrite(self):
+        return self.rows is not None
+
+    @property
+    def is_empty(self):
+        return not (self.rewrite or self.cells or self.appended)
+
+    def add_rows(self, rows):
+        """추가 행 덧붙이기 (전체 재작성인 경우 마지막에 이어 붙임)"""
+        if self.rewrite:
+            self.rows.extend(rows)
+        else:
+            self.appended.extend(rows)
+
+    def __repr__(self):
+        if self.rewrite:
+            return f"FrameDiff(rewrite={len(self.rows)} rows)"
+        n_cells = sum(len(c) for c in self.cells.values())
+        return f"FrameDiff(cells={n_cells}, appended={len(self.appended)})"
+
+
+def diff_frames(before, after):
+    """두 프레임을 비교하여 FrameDiff 반환"""
+    if before is None or list(before.columns) != list(after.columns):
+        return FrameDiff(after.columns, rows=after.to_numpy(dtype=object).tolist())
+
+    n = len(before)
+    if len(after) < n or not after.index[:n].equals(before.index):
+        return FrameDiff(after.columns, rows=after.to_numpy(dtype=object).tolist())
+
+    cells = {}
+    if n and after is not before:
+        values = after.iloc[:n].to_numpy(dtype=object)
+        old_values = before.to_numpy(dtype=object)
+        same = (values == old_values) | (pd.isna(values) & pd.isna(old_values))
+        rows, cols = np.nonzero(~same)
+        for r, c in zip(rows.tolist(), cols.tolist()):
+            cells.setdefault(r, {})[c] = values[r, c]
+
+    appended = after.iloc[n:].to_numpy(dtype=object).tolist() if len(after) > n else []
+    return FrameDiff(after.columns, cells=cells, appended=appended, append_at=n)
+
+
+def is_missing(value):
+    """셀 값이 비어있는지 (None / NaN / NaT)"""
+    if value is None:
+        return True
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
@@ -0,0 +1,258 @@
+import html
+import importlib.util
+import re
+import zipfile
+from xml.etree.ElementTree import fromstring
+
+import numpy as np
+import pandas as pd
+from openpyxl.reader.strings import read_string_table
+from openpyxl.styles.stylesheet import Stylesheet
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+
+from .xlsx_patch import PatchNotApplicable, _sheet_parts, col_index
+
+# ==========================================
+# [Excel Readers] xlsx 읽기 엔진
+# ==========================================
+# - calamine : Rust 기반 리더 (python-calamine 설치 시, pandas engine="calamine")
+# - stream   : 시트 XML을 정규식으로 한 번 훑어 값만 추출 (openpyxl 셀 객체를 만들지 않음)
+#              공유 문자열 / 날짜 서식 / 날짜 변환은 openpyxl 함수를 그대로 사용하여 결과를 맞춤
+# - openpyxl : pd.read_excel 기본 엔진 (항상 사용 가능, 최종 대체 수단)
+# "auto"는 사용 가능한 엔진 중 빠른 순서로 시도하고, 실패하면 다음 엔진으로 넘어간다.
+# stream 엔진은 pd.read_excel과 같은 규칙(헤더/빈 행 정리/dtype 추론)으로 DataFrame을 만든다.
+
+ENGINE_ORDER = ("calamine", "stream", "openpyxl")
+READER_CHOICES = ("auto",) + ENGINE_ORDER
+
+# 일반적인 셀 표기 (속성 순서 r → s → t, 값은 <f>/<v> 또는 <is>)를 한 번에 잡는 패턴
+_FAST_CELL_RE = re.compile(
+    r'<c r="([A-Z]+)(\d+)"(?: s="(\d+)")?(?: t="(\w+)")?\s*'
+    r'(?:/>|>(?:<f\b[^>]*?(?:/>|>[^<]*</f>))?(?:<v>([^<]*)</v>|<v/>)?(?:<is>(.*?)</is>)?</c>)',
+    re.S
+)
+_CELL_XML_RE = re.compile(r"<c\b([^>]*?)(?:/>|>(.*?)</c>)", re.S)
+_TEXT_RE = re.compile(r"<t\b[^>]*?(?:/>|>(.*?)</t>)", re.S)
+_PHONETIC_RE = re.compile(r"<rPh\b.*?</rPh>", re.S)
+_DATE1904_RE = re.compile(r'<workbookPr\b[^>]*\bdate1904="(1|true)"')
+
+
+def is_available(engine):
+    if engine == "calamine":
+        return importlib.util.find_spec("python_calamine") is not None
+    return engine in ENGINE_ORDER
+
+
+def available_engines():
+    return [engine for engine in ENGINE_ORDER if is_available(engine)]
+
+
+def _candidates(engine):
+    """시도할 엔진 순서 (지정 엔진 → 기본 엔진)"""
+    if engine == "auto" or engine not in ENGINE_ORDER:
+        return available_engines()
+    if engine == "openpyxl":
+        return ["openpyxl"]
+    return [engine, "openpyxl"]
+
+
+# ---------------------------------------------------------
+# pandas 엔진 (openpyxl / calamine)
+# ---------------------------------------------------------
+def _read_with_pandas(path, sheets, engine):
+    frames = {}
+    with pd.ExcelFile(path, engine=engine) as xls:
+        names = xls.sheet_names
+        for sheet in sheets:
+            if isinstance(sheet, int) or sheet in names:
+                frames[sheet] = pd.read_excel(xls, sheet)
+    return frames
+
+
+# ---------------------------------------------------------
+# stream 엔진 (시트 XML 직접 해석)
+# ---------------------------------------------------------
+class _WorkbookContext:
+    """시트 해석에 필요한 워크북 공통 정보 (공유 문자열 / 날짜 서식 스타일 / 날짜 기준)"""
+
+    def __init__(self, zin):
+        self.zin = zin
+        workbook_xml = zin.read("xl/workbook.xml").decode("utf-8")
+        self.epoch = CALENDAR_MAC_1904 if _DATE1904_RE.search(workbook_xml) else CALENDAR_WINDOWS_1900
+        self.sheet_parts = _sheet_parts(zin)
+        self.sheet_names = list(self.sheet_parts)
+        self._strings = None
+
+        self.date_styles = set()
+        self.timedelta_styles = set()
+        if "xl/styles.xml" in zin.namelist():
+            stylesheet = Stylesheet.from_tree(fromstring(zin.read("xl/styles.xml")))
+            self.date_styles = stylesheet.date_formats
+            self.timedelta_styles = stylesheet.timedelta_formats
+
+    @property
+    def strings(self):
+        if self._strings is None:
+            try:
+                with self.zin.open("xl/sharedStrings.xml") as f:
+                    self._strings = read_string_table(f)
+            except KeyError:
+                self._strings = []
+        return self._strings
+
+
+def _attr(attrs, key):
+    """속성 문자열에서 key(' r="' 형태)의 값 (없으면 None)"""
+    pos = attrs.find(key)
+    if pos < 0:
+        return None
+    pos += len(key)
+    return attrs[pos:attrs.index('"', pos)]
+
+
+def _cell_value(ctx, kind, style, raw, inline):
+    """openpyxl(data_only) 셀 해석 규칙 + pandas 변환 규칙 (빈 셀 "", 오류 NaN, 정수형 숫자 → int)
+
+    raw: <v> 내용, inline: <is> 내용 (없으면 None)
+    """
+    if kind == "inlineStr":
+        if not inline:
+            return ""
+        return html.unescape("".join(t or "" for t in _TEXT_RE.findall(_PHONETIC_RE.sub("", inline))))
+    if not raw:
+        return ""
+
+    if kind == "n":
+        number = float(raw) if ("." in raw or "E" in raw or "e" in raw) else int(raw)
+        if style in ctx.date_styles:
+            try:
+                return from_excel(number, ctx.epoch, timedelta=style in ctx.timedelta_styles)
+            except (OverflowError, ValueError):
+                return np.nan
+        if isinstance(number, float) and number.is_integer():
+            return int(number)
+        return number
+    if kind == "s":
+        return ctx.strings[int(raw)]
+    if kind == "b":
+        return bool(int(raw))
+    if kind == "e":
+        return np.nan
+    if kind == "d":
+        return from_ISO8601(html.unescape(raw))
+    return html.unescape(raw)
+
+
+def _body_parts(body):
+    """<c> 내용 → (<v> 내용, <is> 내용)"""
+    if not body:
+        return None, None
+    raw = inline = None
+    pos = body.find("<v>")
+    if pos >= 0:
+        raw = body[pos + 3:body.find("</v>", pos)]
+    pos = body.find("<is>")
+    if pos >= 0:
+        inline = body[pos + 4:body.rfind("</is>")]
+    return raw, inline
+
+
+def _iter_cells_fast(xml, start, end):
+    """(열 문자, 행 번호 문자열, 스타일, 타입, <v>, <is>) — 표준 속성 순서(r, s, t)의 셀 전용"""
+    for m in _FAST_CELL_RE.finditer(xml, start, end):
+        yield m.groups()
+
+
+def _iter_cells_general(xml, start, end):
+    """속성 순서/추가 속성과 무관하게 셀을 해석 (빠른 패턴으로 모든 셀을 잡지 못한 경우)"""
+    for m in _CELL_XML_RE.finditer(xml, start, end):
+        attrs = m.group(1)
+        ref = _attr(attrs, ' r="')
+        if not ref:
+            raise PatchNotApplicable("셀 위치(r) 속성이 없는 시트입니다.")
+        letters = ref.rstrip("0123456789")
+        raw, inline = _body_parts(m.group(2))
+        yield letters, ref[len(letters):], _attr(attrs, ' s="'), _attr(attrs, ' t="'), raw, inline
+
+
+def _stream_sheet_rows(ctx, xml):
+    """시트 XML → 2차원 리스트 (pd.read_excel처럼 행 끝 빈 셀 / 마지막 빈 행 정리, 폭 맞춤)
+
+    셀 위치는 r 속성(예: "B12")으로 정하므로 행 요소를 따로 해석하지 않는다.
+    """
+    start = xml.find("<sheetData")
+    if start < 0:
+        raise PatchNotApplicable("sheetData 요소를 찾을 수 없습니다.")
+    end = xml.rfind("</sheetData>")
+    if end < 0:
+        end = len(xml)
+
+    cells = list(_iter_cells_fast(xml, start, end))
+    if len(cells) != xml.count("<c ", start, end) + xml.count("<c>", start, end):
+        cells = _iter_cells_general(xml, start, end)
+
+    rows = {}
+    columns = {}
+    for letters, row_no, style, kind, raw, inline in cells:
+        col = columns.get(letters)
+        if col is None:
+            col = columns[letters] = col_index(letters)
+
+        value = _cell_value(ctx, kind or "n", int(style) if style else 0, raw, inline)
+        if value == "":
+            continue
+
+        values = rows.get(row_no)
+        if values is None:
+            values = rows[row_no] = []
+        if col > len(values):
+            values.extend([""] * (col - len(values)))
+        values[col - 1] = value
+
+    if not rows:
+        return []
+    by_number = {int(r): values for r, values in rows.items()}
+    width = max(len(values) for values in by_number.values())
+    return [
+        by_number.get(r, []) + [""] * (width - len(by_number.get(r, [])))
+        for r in range(1, max(by_number) + 1)
+    ]
+
+
+def _rows_to_frame(data):
+    try:
+        return TextParser(data, header=0, skip_blank_lines=False).read()
+    except EmptyDataError:
+        return pd.DataFrame()
+
+
+def _read_with_stream(path, sheets):
+    frames = {}
+    with zipfile.ZipFile(path) as zin:
+        ctx = _WorkbookContext(zin)
+        for sheet in sheets:
+            name = ctx.sheet_names[sheet] if isinstance(sheet, int) else sheet
+            if name not in ctx.sheet_parts:
+                continue
+            xml = zin.read(ctx.sheet_parts[name]).decode("utf-8")
+            frames[sheet] = _rows_to_frame(_stream_sheet_rows(ctx, xml))
+    return frames
+
+
+def read_excel_sheets(path, sheets, engine="auto"):
+    """{시트: DataFrame} (없는 시트는 제외). sheets에는 시트 이름 또는 위치(int)를 지정
+
+    지정한 엔진이 없거나 실패하면 다음 엔진(최종적으로 openpyxl)으로 다시 읽는다.
+    """
+    candidates = _candidates(engine)
+    for i, name in enumerate(candidates):
+        try:
+            if name == "stream":
+                return _read_with_stream(path, sheets)
+            return _read_with_pandas(path, sheets, name)
+        except Exception as e:
+            if i == len(candidates) - 1:
+                raise
+            print(f"엑셀 읽기 엔진 [{name}] 실패, 다음 엔진으로 대체: {e}")
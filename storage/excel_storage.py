@@ -0,0 +1,139 @@
+import os
+import shutil
+import time
+from contextlib import contextmanager
+
+from .atomic_save import (expected_from_diffs, expected_from_frames,
+                          previous_path, save_atomically, verify_workbook)
+from .excel_readers import read_excel_sheets
+from .parallel_reader import read_sheets_parallel
+from .xlsx_patch import PatchNotApplicable, write_patched_workbook
+from .xlsx_reader import read_sheet_tail, sheet_fingerprints, sheet_layout
+from .write_lease import DEFAULT_TTL_SEC, DEFAULT_WAIT_SEC, WriteLease
+from .xlsx_writer import write_workbook
+
+# ==========================================
+# [Excel Storage] 공유 xlsx 파일 백엔드
+# ==========================================
+# 파일 자체가 저장소이므로, 저장 구간은 워크북 옆 잠금 파일(WriteLease)로 클라이언트 간 직렬화한다.
+# [수정] 저장은 항상 임시 파일 → 검증 → 교체 (atomic_save), 직전 저장본은 "<이름>.prev.xlsx"로 보관
+
+
+class ExcelStorage:
+    name = "excel"
+
+    def __init__(self, path, reader="auto", parallel=False, lease_ttl=DEFAULT_TTL_SEC, lease_wait=DEFAULT_WAIT_SEC):
+        self.path = path
+        # [신규] 저장 구간 잠금 (다른 클라이언트는 풀릴 때까지 lease_wait초 대기)
+        self.lease = WriteLease(path, ttl=lease_ttl, wait=lease_wait)
+        # [신규] 읽기 엔진 (auto / calamine / stream / openpyxl)
+        self.reader = reader
+        # [신규] 여러 시트를 작업 프로세스에서 병렬로 파싱 / 마지막 병렬 읽기의 시트별 파싱 시간(초)
+        self.parallel = parallel
+        self.last_read_timings = {}
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def signature(self):
+        """변경 여부 판단용 (mtime, size). 파일이 없으면 None"""
+        try:
+            stat = os.stat(self.path)
+            return (stat.st_mtime, stat.st_size)
+        except OSError:
+            return None
+
+    def watch_paths(self):
+        """변경 감시 대상 파일"""
+        return [self.path]
+
+    def sheet_fingerprints(self, sheet_names):
+        """{시트 이름: 지문} — 시트 XML 파트의 CRC/크기 (내용이 같으면 저장 시각과 무관하게 같음)"""
+        return sheet_fingerprints(self.path, sheet_names)
+
+    @contextmanager
+    def begin(self):
+        """트랜잭션 구간 (잠금 파일을 잡은 상태로 최신 확인 → 저장, 얻지 못하면 StorageBusyError)"""
+        with self.lease.hold():
+            yield self
+
+    def read_sheets(self, sheet_names):
+        """{시트 이름: DataFrame} (없는 시트는 제외)
+
+        첫 번째 이름(Data 시트)이 없으면 워크북의 첫 시트를 대신 읽는다.
+        """
+        if self.parallel and len(sheet_names) > 1:
+            sheets = self._read_sheets_parallel(sheet_names)
+        else:
+            sheets = read_excel_sheets(self.path, list(sheet_names), self.reader)
+        if sheet_names[0] not in sheets:
+            sheets[sheet_names[0]] = read_excel_sheets(self.path, [0], self.reader)[0]
+        return sheets
+
+    def _read_sheets_parallel(self, sheet_names):
+        start = time.perf_counter()
+        sheets, self.last_read_timings = read_sheets_parallel(self.path, list(sheet_names), self.reader)
+        detail = ", ".join(f"{name} {elapsed:.2f}s" for name, elapsed in self.last_read_timings.items())
+        print(f"병렬 읽기 {time.perf_counter() - start:.2f}s ({detail})")
+        return sheets
+
+    def read_sheet(self, sheet_name):
+        """시트 하나만 읽기 (지연 로드용). 시트가 없으면 None"""
+        return read_excel_sheets(self.path, [sheet_name], self.reader).get(sheet_name)
+
+    def read_sheet_tail(self, sheet_name, n):
+        """헤더 + 마지막 n개 행만 읽기. 시트가 없으면 None"""
+        return read_sheet_tail(self.path, sheet_name, n)
+
+    def sheet_layout(self, sheet_name):
+        """(헤더 컬럼 리스트, 데이터 행 수) — 시트를 읽지 않고 행을 덧붙일 때 사용. 시트가 없으면 None"""
+        return sheet_layout(self.path, sheet_name)
+
+    def write(self, sheet_diffs, full_frames):
+        """변경된 셀/추가된 행만 반영 (불가능하면 full_frames()로 전체 저장)
+
+        sheet_diffs: {시트 이름: FrameDiff}
+        full_frames: 전체 저장 시 사용할 {시트 이름: DataFrame}을 돌려주는 함수
+        """
+        sheet_diffs = {name: d for name, d in sheet_diffs.items() if not d.is_empty}
+        if not sheet_diffs:
+            return
+        try:
+            save_atomically(
+                self.path,
+                lambda tmp_path: write_patched_workbook(self.path, tmp_path, sheet_diffs),
+                expected_from_diffs(sheet_diffs)
+            )
+        except PatchNotApplicable as e:
+            print(f"부분 저장 불가, 전체 저장으로 대체: {e}")
+            write_excel_file(self.path, full_frames())
+
+    def backup(self, dest_path):
+        shutil.copy2(self.path, dest_path)
+
+    # ---------------------------------------------------------
+    # [신규] 직전 저장본
+    # ---------------------------------------------------------
+    @property
+    def previous_path(self):
+        return previous_path(self.path)
+
+    def has_previous(self):
+        return os.path.exists(self.previous_path)
+
+    def restore_previous(self):
+        """직전 저장본으로 되돌리기 (현재 파일은 새 직전 저장본이 되므로 다시 되돌릴 수 있음)"""
+        verify_workbook(self.previous_path, {})
+        with self.begin():
+            save_atomically(self.path, lambda tmp_path: shutil.copy2(self.previous_path, tmp_path))
+
+
+def write_excel_file(path, frames, keep_previous=True, guard=None):
+    """{시트 이름: DataFrame}을 하나의 xlsx로 저장
+
+    [수정] 시트 XML을 행 단위로 흘려 쓰는 스트리밍 저장 (xlsx_writer)
+    (셀 객체를 메모리에 모아두지 않으므로 Log가 커져도 메모리 사용량이 일정함)
+    [수정] 임시 파일에 쓰고 다시 열어 검증한 뒤 교체 (guard: 교체 구간에서만 잡을 잠금)
+    """
+    save_atomically(path, lambda tmp_path: write_workbook(tmp_path, frames), expected_from_frames(frames),
+                    keep_previous=keep_previous, guard=guard)
@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+from .write_lease import StorageBusyError, WriteLease
+
+# ==========================================
+# [Offline Journal] 오프라인 작업 대기열 (로컬 파일)
+# ==========================================
+# 공유 폴더에 연결할 수 없을 때 수행한 작업(메서드 이름 + 인자)을 로컬 JSON Lines 파일에 기록해 두고,
+# 연결이 돌아오면 기록한 순서대로 다시 실행한다.
+# - 한 줄 = 작업 하나. 추가할 때마다 flush + fsync (프로그램이 죽어도 남도록)
+# - 저장소 경로별로 구분 (설정에서 다른 파일을 선택해도 섞이지 않음)
+# - 반영이 끝난 작업은 임시 파일에 다시 쓴 뒤 교체하여 제거
+# - 같은 PC에서 프로그램을 여러 개 실행해도 같은 파일을 쓰므로, 기록/제거/반영은 잠금 파일
+#   ("<대기열>.lock", WriteLease)을 잡은 상태에서만 하고 다른 프로세스가 바꾼 내용은 파일에서 다시 읽는다
+
+# 반영 중에는 작업 수만큼 저장이 이어지므로 저장소 잠금보다 길게 잡음
+JOURNAL_LEASE_TTL_SEC = 300.0
+
+
+class JournalBusyError(Exception):
+    """다른 프로세스가 대기열을 사용 중(반영 중)이어서 잠금을 얻지 못한 경우"""
+
+
+def _stat_signature(path):
+    try:
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+
+class OfflineJournal:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._lease = WriteLease(path, ttl=JOURNAL_LEASE_TTL_SEC)
+        self._signature = None
+        self._entries = []
+        self._refresh()
+
+    def _read(self):
+        entries = []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        # 기록 도중 종료되어 잘린 마지막 줄 등
+                        print(f"오프라인 작업 기록 손상, 건너뜀: {line[:80]}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"오프라인 작업 기록 읽기 실패: {e}")
+        return entries
+
+    def _refresh(self, force=False):
+        """파일이 바뀌었으면(다른 프로세스의 기록/제거 포함) 다시 읽기 (self._lock 안에서 호출)"""
+        signature = _stat_signature(self.path)
+        if force or signature != self._signature:
+            self._entries = self._read()
+            self._signature = signature
+
+    @contextmanager
+    def exclusive(self, wait=None):
+        """대기열 독점 구간 (같은 객체 안에서는 중첩 가능) — 시작할 때 파일에서 다시 읽음
+
+        wait: 잠금 대기 시간(초, None이면 기본값). 얻지 못하면 JournalBusyError
+        """
+        acquired = False
+        try:
+            with self._lease.hold(wait):
+                acquired = True
+                with self._lock:
+                    self._refresh(force=True)
+                yield self
+        except StorageBusyError as e:
+            if acquired:
+                raise  # 구간 안에서 난 저장소 잠금 오류는 그대로 전달
+            raise JournalBusyError(str(e)) from e
+
+    def append(self, storage_path, op, args, read=None, label=""):
+        """작업 기록 → 기록 id"""
+        entry = {
+            "id": uuid.uuid4().hex,
+            "storage": storage_path,
+            "op": op,
+            "args": list(args),
+            "read": read or {},
+            "label": label or op,
+            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        line = json.dumps(entry, ensure_ascii=False, default=str)
+        with self.exclusive():
+            with self._lock:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._entries.append(json.loads(line))
+                self._signature = _stat_signature(self.path)
+        return entry["id"]
+
+    def entries(self, storage_path):
+        """저장소의 대기 중인 작업 (기록 순서)"""
+        with self._lock:
+            self._refresh()
+            return [e for e in self._entries if e.get("storage") == storage_path]
+
+    def pending(self, storage_path):
+        """저장소의 대기 중인 작업 수"""
+        with self._lock:
+            self._refresh()
+            return sum(1 for e in self._entries if e.get("storage") == storage_path)
+
+    def remove(self, entry_id):
+        with self.exclusive():
+            with self._lock:
+                self._entries = [e for e in self._entries if e.get("id") != entry_id]
+                self._rewrite()
+                self._signature = _stat_signature(self.path)
+
+    def _rewrite(self):
+        if not self._entries:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in self._entries:
+                f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,87 @@
+import atexit
+import io
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .excel_readers import read_excel_sheets
+
+# ==========================================
+# [Parallel Reader] 시트별 병렬 파싱 (프로세스 풀)
+# ==========================================
+# 워크북 파일은 한 번만 읽고(네트워크 드라이브 접근 1회), 그 바이트를 작업 프로세스들에
+# 나눠 주어 시트마다 다른 코어에서 파싱한다. 결과 DataFrame은 pickle로 UI 프로세스에 돌아온다.
+# - 프로세스 시작 비용이 크므로 풀은 처음 사용할 때 만들고 계속 재사용한다
+# - Windows(PyInstaller 빌드 포함)와 같은 동작을 하도록 spawn 방식으로 통일
+#   → 실행 파일 진입점에서 multiprocessing.freeze_support()가 필요함 (main.py)
+# - 코어가 하나뿐이거나 풀을 쓸 수 없으면(프로세스 생성 실패 등) 현재 프로세스에서 순서대로 읽는다
+
+# 작업 프로세스 수 상한 (워크북 시트 수)
+MAX_WORKERS = 5
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def default_workers():
+    return max(1, min(MAX_WORKERS, os.cpu_count() or 1))
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=default_workers(), mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def shutdown_pool():
+    """작업 프로세스 종료 (프로그램 종료 시)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_pool)
+
+
+def _parse_sheet(data, sheet, engine):
+    """[작업 프로세스] 워크북 바이트에서 시트 하나 파싱 → (DataFrame 또는 None, 파싱 시간)"""
+    start = time.perf_counter()
+    frame = read_excel_sheets(io.BytesIO(data), [sheet], engine).get(sheet)
+    return frame, time.perf_counter() - start
+
+
+def read_sheets_parallel(path, sheets, engine="auto"):
+    """({시트: DataFrame}, {시트: 파싱 시간(초)}) — 없는 시트는 제외
+
+    sheets에는 시트 이름 또는 위치(int)를 지정 (read_excel_sheets와 동일)
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    results = None
+    if default_workers() > 1:
+        try:
+            pool = _get_pool()
+            futures = {sheet: pool.submit(_parse_sheet, data, sheet, engine) for sheet in sheets}
+            results = {sheet: future.result() for sheet, future in futures.items()}
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            # 깨진 풀은 버리고 다음 호출에서 다시 만든다
+            print(f"병렬 읽기 실패, 순차 읽기로 대체: {e}")
+            shutdown_pool()
+    if results is None:
+        results = {sheet: _parse_sheet(data, sheet, engine) for sheet in sheets}
+
+    frames = {}
+    timings = {}
+    for sheet, (frame, elapsed) in results.items():
+        timings[sheet] = elapsed
+        if frame is not None:
+            frames[sheet] = frame
+    return frames, timings
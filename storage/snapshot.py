@@ -0,0 +1,58 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+# ==========================================
+# [Snapshot] 로컬 스냅샷 캐시
+# ==========================================
+# 마지막으로 읽은 프레임들을 로컬 폴더에 pickle로 보관해 두고,
+# 다음 실행 시 네트워크 드라이브를 읽기 전에 바로 화면을 그리는 데 사용한다.
+# 원본 경로 + 시그니처(mtime/size 또는 리비전)를 함께 저장하여 최신 여부를 판단한다.
+# 시트별 지문도 함께 보관하여, 시작 후 다시 읽을 때 바뀐 시트만 읽을 수 있게 한다.
+
+SNAPSHOT_FORMAT = 2
+
+
+def snapshot_path(cache_dir, source_path):
+    """원본 경로별 스냅샷 파일 경로"""
+    key = hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"snapshot_{key}.pkl")
+
+
+def save_snapshot(cache_dir, source_path, signature, frames, fingerprints=None):
+    """frames: {프레임 키: DataFrame}, fingerprints: 시트별 지문 (없으면 None). 임시 파일에 쓴 뒤 교체"""
+    os.makedirs(cache_dir, exist_ok=True)
+    path = snapshot_path(cache_dir, source_path)
+    payload = {
+        "format": SNAPSHOT_FORMAT,
+        "source": os.path.abspath(source_path),
+        "signature": signature,
+        "frames": frames,
+        "fingerprints": fingerprints,
+    }
+    fd, tmp_path = tempfile.mkstemp(prefix=".snapshot_", suffix=".tmp", dir=cache_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_snapshot(cache_dir, source_path):
+    """(signature, frames, fingerprints). 스냅샷이 없거나 형식이 다르면 None"""
+    path = snapshot_path(cache_dir, source_path)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except Exception as e:
+        print(f"스냅샷 읽기 실패: {e}")
+        return None
+    if payload.get("format") != SNAPSHOT_FORMAT or payload.get("source") != os.path.abspath(source_path):
+        return None
+    return payload["signature"], payload["frames"], payload.get("fingerprints")
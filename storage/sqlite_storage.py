@@ -0,0 +1,298 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from .diff import FrameDiff, is_missing
+from .write_lease import StorageBusyError
+
+# ==========================================
+# [SQLite Storage] 내장 DB 백엔드
+# ==========================================
+# 시트 하나 = 테이블 하나. 행 순서는 "_row"(0-base 위치) 컬럼으로 유지하여
+# 엑셀 백엔드와 동일한 FrameDiff(위치 기반 변경 내역)를 그대로 적용한다.
+# 쓰기는 BEGIN IMMEDIATE 트랜잭션 안에서만 이루어지므로
+# "읽기 → 수정 → 저장" 사이에 다른 사용자의 저장이 끼어들 수 없다.
+
+_ROW_COL = "_row"
+_META_TABLE = "_meta"
+
+
+# [신규] WAL은 공유 메모리(-shm)를 쓰므로 네트워크 공유 폴더에서는 안전하지 않음 → 로컬 DB에서만 허용
+JOURNAL_MODES = ("DELETE", "WAL")
+
+
+def is_network_path(path):
+    """UNC 경로(\\\\서버\\공유) 또는 네트워크 드라이브에 있는 경로인지 확인"""
+    path = os.path.abspath(path)
+    if path.startswith(("\\\\", "//")):
+        return True
+    drive = os.path.splitdrive(path)[0]
+    if os.name == "nt" and drive:
+        try:
+            import ctypes
+            DRIVE_REMOTE = 4
+            return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == DRIVE_REMOTE
+        except Exception:
+            return False
+    return False
+
+
+def safe_journal_mode(path, journal_mode):
+    """DB 경로에 사용할 저널 모드 (알 수 없는 값이거나 네트워크 경로의 WAL이면 DELETE)"""
+    mode = str(journal_mode or "").upper()
+    if mode not in JOURNAL_MODES:
+        print(f"알 수 없는 SQLite 저널 모드: {journal_mode} → DELETE 사용")
+        return "DELETE"
+    if mode == "WAL" and is_network_path(path):
+        print(f"네트워크 경로의 DB는 WAL을 사용할 수 없습니다: {path} → DELETE 사용")
+        return "DELETE"
+    return mode
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def sql_value(value):
+    """프레임 값 → SQLite 저장 값 (빈 값/빈 문자열은 NULL → 엑셀의 빈 셀과 동일하게 취급)"""
+    if is_missing(value):
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, str):
+        return value if value != "" else None
+    if isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d") if value.time() == datetime.min.time() else value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+
+def _to_frame(rows, columns):
+    frame = pd.DataFrame.from_records(rows, columns=columns).infer_objects()
+    return frame.mask(frame.isna(), np.nan)
+
+
+class SqliteStorage:
+    name = "sqlite"
+
+    def __init__(self, path, index_columns=(), journal_mode="DELETE", busy_timeout=10.0):
+        self.path = path
+        self.index_columns = set(index_columns)
+        # [수정] 네트워크 경로에서는 WAL 대신 DELETE 사용
+        self.journal_mode = safe_journal_mode(path, journal_mode)
+        self.busy_timeout = busy_timeout
+        # 트랜잭션 연결은 스레드별로 관리 (작업자 스레드가 쓰는 동안 UI 스레드가 지연 로드 시트를 읽을 수 있음)
+        self._local = threading.local()
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    @property
+    def _txn(self):
+        return getattr(self._local, "txn", None)
+
+    @_txn.setter
+    def _txn(self, conn):
+        self._local.txn = conn
+
+    # ---------------------------------------------------------
+    # 연결 관리
+    # ---------------------------------------------------------
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+        conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {_META_TABLE} (key TEXT PRIMARY KEY, value)")
+        conn.execute(f"INSERT OR IGNORE INTO {_META_TABLE} (key, value) VALUES ('revision', 0)")
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        """진행 중인 트랜잭션이 있으면 그 연결을, 없으면 임시 연결을 사용"""
+        if self._txn is not None:
+            yield self._txn
+            return
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def begin(self):
+        """쓰기 트랜잭션 (BEGIN IMMEDIATE → 다른 쓰기는 끝날 때까지 대기)"""
+        if self._txn is not None:
+            yield self
+            return
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.OperationalError as e:
+            conn.close()
+            raise StorageBusyError(str(e))
+
+        self._txn = conn
+        try:
+            yield self
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            self._txn = None
+            conn.close()
+
+    # ---------------------------------------------------------
+    # 읽기
+    # ---------------------------------------------------------
+    def signature(self):
+        """변경 여부 판단용 리비전 (커밋마다 1씩 증가). DB가 없으면 None"""
+        if not self.exists():
+            return None
+        with self._connection() as conn:
+            row = conn.execute(f"SELECT value FROM {_META_TABLE} WHERE key = 'revision'").fetchone()
+        return (row[0],) if row else None
+
+    def watch_paths(self):
+        """변경 감시 대상 파일 (WAL 모드에서는 커밋이 -wal 파일에 먼저 기록됨)"""
+        return [self.path, f"{self.path}-wal"]
+
+    def sheet_fingerprints(self, sheet_names):
+        """{시트 이름: 지문} — 테이블별로 마지막으로 바뀐 리비전 (기록이 없으면 0)"""
+        with self._connection() as conn:
+            rows = dict(conn.execute(f"SELECT key, value FROM {_META_TABLE} WHERE key LIKE 'revision:%'").fetchall())
+        return {name: rows.get(f"revision:{name}", 0) for name in sheet_names}
+
+    def _table_columns(self, conn, table):
+        rows = conn.execute(f"PRAGMA table_info({_quote(table)})").fetchall()
+        return [r[1] for r in sorted(rows, key=lambda r: r[0]) if r[1] != _ROW_COL]
+
+    def read_sheets(self, sheet_names):
+        """{시트 이름: DataFrame} (테이블이 없는 시트는 제외)"""
+        sheets = {}
+        with self._connection() as conn:
+            for sheet_name in sheet_names:
+                columns = self._table_columns(conn, sheet_name)
+                if not columns:
+                    continue
+                select = ", ".join(_quote(c) for c in columns)
+                rows = conn.execute(f"SELECT {select} FROM {_quote(sheet_name)} ORDER BY {_ROW_COL}").fetchall()
+                sheets[sheet_name] = _to_frame(rows, columns)
+        return sheets
+
+    def read_sheet(self, sheet_name):
+        """테이블 하나만 읽기 (지연 로드용). 테이블이 없으면 None"""
+        return self.read_sheets([sheet_name]).get(sheet_name)
+
+    def read_sheet_tail(self, sheet_name, n):
+        """마지막 n개 행만 읽기. 테이블이 없으면 None"""
+        with self._connection() as conn:
+            columns = self._table_columns(conn, sheet_name)
+            if not columns:
+                return None
+            select = ", ".join(_quote(c) for c in columns)
+            rows = conn.execute(
+                f"SELECT {select} FROM {_quote(sheet_name)} ORDER BY {_ROW_COL} DESC LIMIT ?", (max(n, 0),)
+            ).fetchall()
+        return _to_frame(rows[::-1], columns)
+
+    def sheet_layout(self, sheet_name):
+        """(컬럼 리스트, 행 수). 테이블이 없으면 None"""
+        with self._connection() as conn:
+            columns = self._table_columns(conn, sheet_name)
+            if not columns:
+                return None
+            count = conn.execute(f"SELECT COUNT(*) FROM {_quote(sheet_name)}").fetchone()[0]
+        return columns, count
+
+    # ---------------------------------------------------------
+    # 쓰기
+    # ---------------------------------------------------------
+    def _create_table(self, conn, table, columns):
+        conn.execute(f"DROP TABLE IF EXISTS {_quote(table)}")
+        body = ", ".join([f"{_ROW_COL} INTEGER PRIMARY KEY"] + [_quote(c) for c in columns])
+        conn.execute(f"CREATE TABLE {_quote(table)} ({body})")
+        for column in columns:
+            if column in self.index_columns:
+                index_name = f"idx_{table}_{column}"
+                conn.execute(f"CREATE INDEX {_quote(index_name)} ON {_quote(table)} ({_quote(column)})")
+
+    def _insert_rows(self, conn, table, columns, rows, start):
+        names = ", ".join([_ROW_COL] + [_quote(c) for c in columns])
+        marks = ", ".join(["?"] * (len(columns) + 1))
+        conn.executemany(
+            f"INSERT INTO {_quote(table)} ({names}) VALUES ({marks})",
+            ([start + i] + [sql_value(v) for v in values] for i, values in enumerate(rows))
+        )
+
+    def _apply_diff(self, conn, table, diff):
+        columns = [str(c) for c in diff.columns]
+        existing = self._table_columns(conn, table)
+        if diff.rewrite or not existing:
+            self._create_table(conn, table, columns)
+            if diff.rewrite:
+                self._insert_rows(conn, table, columns, diff.rows, 0)
+            else:
+                self._insert_rows(conn, table, columns, diff.appended, diff.append_at)
+            return
+        if existing != columns:
+            # [신규] 뒤에 컬럼이 추가된 경우 (예: 버전 컬럼) 테이블에 컬럼만 추가
+            if columns[:len(existing)] != existing:
+                raise ValueError(f"[{table}] 테이블 구조가 달라 부분 저장할 수 없습니다.")
+            for column in columns[len(existing):]:
+                conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(column)}")
+
+        for pos, cells in diff.cells.items():
+            assignments = ", ".join(f"{_quote(columns[c])} = ?" for c in cells)
+            conn.execute(
+                f"UPDATE {_quote(table)} SET {assignments} WHERE {_ROW_COL} = ?",
+                [sql_value(v) for v in cells.values()] + [pos]
+            )
+        if diff.appended:
+            self._insert_rows(conn, table, columns, diff.appended, diff.append_at)
+
+    def write(self, sheet_diffs, full_frames=None):
+        """시트별 FrameDiff를 테이블에 반영하고 리비전 증가
+
+        sheet_diffs: {시트 이름: FrameDiff}
+        full_frames: 엑셀 백엔드와의 호환용 (부분 저장이 항상 가능하므로 사용하지 않음)
+        """
+        sheet_diffs = {name: d for name, d in sheet_diffs.items() if not d.is_empty}
+        if not sheet_diffs:
+            return
+
+        with self.begin():
+            conn = self._txn
+            for sheet_name, diff in sheet_diffs.items():
+                self._apply_diff(conn, sheet_name, diff)
+            conn.execute(f"UPDATE {_META_TABLE} SET value = value + 1 WHERE key = 'revision'")
+            # [신규] 바뀐 테이블에 현재 리비전 기록 (다른 사용자는 바뀐 테이블만 다시 읽음)
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {_META_TABLE} (key, value) "
+                f"SELECT ?, value FROM {_META_TABLE} WHERE key = 'revision'",
+                [(f"revision:{name}",) for name in sheet_diffs]
+            )
+
+    def import_frames(self, frames):
+        """{시트 이름: DataFrame}으로 테이블 전체를 교체 (엑셀 → DB 최초 이관용)"""
+        self.write({
+            name: FrameDiff(frame.columns, rows=frame.to_numpy(dtype=object).tolist())
+            for name, frame in frames.items()
+        })
+
+    def backup(self, dest_path):
+        with self._connection() as conn:
+            dest = sqlite3.connect(dest_path)
+            try:
+                conn.backup(dest)
+            finally:
+                dest.close()
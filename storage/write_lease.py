@@ -0,0 +1,178 @@
+import getpass
+import json
+import os
+import platform
+import random
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+# ==========================================
+# [Write Lease] 공유 폴더 쓰기 임대 (잠금 파일)
+# ==========================================
+# 워크북 옆에 "<파일명>.lock"을 O_EXCL로 만들어 한 번에 한 클라이언트만 저장하도록 한다.
+# - 잠금 파일에는 소유자(PC/사용자/PID)와 만료 시각을 기록한다
+# - 다른 클라이언트는 잠금이 풀릴 때까지 짧은 간격(점점 늘어남 + 무작위 지연)으로 다시 시도하고,
+#   제한 시간 안에 얻지 못하면 StorageBusyError
+# - 만료 시각이 지난 잠금(저장 중 프로그램이 죽은 경우 등)은 회수하고 새로 잡는다
+# 저장 구간(최신 확인 → 쓰기)에만 잡으므로 보통 수 초 안에 풀린다.
+
+DEFAULT_TTL_SEC = 60.0
+DEFAULT_WAIT_SEC = 20.0
+_RETRY_MIN_SEC = 0.05
+_RETRY_MAX_SEC = 1.0
+
+
+class StorageBusyError(Exception):
+    """다른 사용자가 저장 중이어서 제한 시간 안에 쓰기 잠금을 얻지 못한 경우"""
+
+
+def lease_owner():
+    """현재 클라이언트 식별 정보 {host, user, pid}"""
+    try: host = platform.node()
+    except Exception: host = "Unknown"
+    try: user = getpass.getuser()
+    except Exception: user = "Unknown"
+    return {"host": host, "user": user, "pid": os.getpid()}
+
+
+def describe_owner(info):
+    """잠금 정보 → '사용자@PC' (알 수 없으면 빈 문자열)"""
+    if not info:
+        return ""
+    return f"{info.get('user', '?')}@{info.get('host', '?')}"
+
+
+class WriteLease:
+    def __init__(self, path, ttl=DEFAULT_TTL_SEC, wait=DEFAULT_WAIT_SEC):
+        """path: 보호할 파일 (잠금 파일은 path + '.lock')"""
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self.ttl = ttl
+        self.wait = wait
+        self._token = None
+        self._depth = 0
+
+    @property
+    def held(self):
+        return self._token is not None
+
+    @contextmanager
+    def hold(self, wait=None):
+        """쓰기 구간 (같은 객체 안에서는 중첩 가능). wait: 이번 획득의 대기 시간(초, None이면 기본값)"""
+        if self._depth == 0:
+            self.acquire(wait)
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.release()
+
+    # ---------------------------------------------------------
+    # 획득 / 해제
+    # ---------------------------------------------------------
+    def acquire(self, wait=None):
+        deadline = time.monotonic() + (self.wait if wait is None else wait)
+        delay = _RETRY_MIN_SEC
+        holder = None
+        while True:
+            if self._try_create():
+                return
+            holder = self.read_holder()
+            if self._is_stale(holder) and self._break_stale(holder):
+                continue
+            if time.monotonic() >= deadline:
+                raise StorageBusyError(describe_owner(holder) or "잠금 파일 사용 중")
+            # 여러 클라이언트가 동시에 재시도하지 않도록 무작위 지연
+            time.sleep(min(delay * random.uniform(0.5, 1.5), max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 2, _RETRY_MAX_SEC)
+
+    def release(self):
+        token, self._token = self._token, None
+        if token is None:
+            return
+        # 만료로 회수되어 다른 클라이언트가 잡은 잠금은 지우지 않음
+        holder = self.read_holder()
+        if holder and holder.get("token") not in (None, token):
+            print(f"쓰기 잠금이 만료되어 다른 사용자({describe_owner(holder)})에게 넘어갔습니다.")
+            return
+        try:
+            os.remove(self.lock_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"잠금 파일 삭제 실패: {e}")
+
+    def read_holder(self):
+        """현재 잠금 정보 (없으면 None, 읽을 수 없으면 {})"""
+        try:
+            with open(self.lock_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # 만드는 도중이거나 손상된 잠금 → 파일 수정 시각으로 만료 판단
+            return {}
+
+    # ---------------------------------------------------------
+    # 내부
+    # ---------------------------------------------------------
+    def _try_create(self):
+        token = uuid.uuid4().hex
+        info = dict(lease_owner(), token=token,
+                    acquired=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    expires=time.time() + self.ttl)
+        try:
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(info, f, ensure_ascii=False)
+        self._token = token
+        return True
+
+    def _is_stale(self, holder):
+        if holder is None:
+            return False
+        expires = holder.get("expires")
+        if expires is None:
+            try:
+                expires = os.path.getmtime(self.lock_path) + self.ttl
+            except OSError:
+                return False
+        return time.time() > expires
+
+    def _break_stale(self, holder):
+        """만료된 잠금 회수 (다른 이름으로 옮긴 뒤 확인하여, 그 사이 새로 잡힌 잠금은 되돌림)
+
+        잠금 파일이 더 이상 만료된 잠금이 아니게 되었으면(없어졌거나 되돌렸으면) 그래도 True → 바로 다시 시도
+        """
+        aside = f"{self.lock_path}.{uuid.uuid4().hex}.stale"
+        try:
+            os.rename(self.lock_path, aside)
+        except FileNotFoundError:
+            return True
+        except OSError:
+            return False
+        try:
+            with open(aside, "r", encoding="utf-8") as f:
+                moved = json.load(f)
+        except (OSError, ValueError):
+            moved = {}
+        if holder and moved.get("token") != holder.get("token"):
+            # 다른 클라이언트가 먼저 회수하고 새로 잡은 잠금을 옮겨버린 경우 → 되돌림
+            try:
+                os.rename(aside, self.lock_path)
+                return True
+            except OSError:
+                pass
+        else:
+            print(f"만료된 쓰기 잠금 회수: {describe_owner(moved)}")
+        try:
+            os.remove(aside)
+        except OSError:
+            pass
+        return True
@@ -0,0 +1,287 @@
+import math
+import posixpath
+import re
+import zipfile
+from datetime import date, datetime
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+from .diff import is_missing
+
+# ==========================================
+# [Patch Writer] xlsx 셀 단위 부분 저장
+# ==========================================
+# xlsx는 zip 안의 시트별 XML 파트로 구성되어 있으므로,
+# 변경된 시트의 XML만 문자열 단위로 수정하고 나머지 파트는 그대로 복사한다.
+# (openpyxl로 전체 워크북을 파싱/직렬화하지 않음)
+
+_NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_DOC_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_ROW_RE = re.compile(r'<row\b[^>]*?\br="(\d+)"[^>]*?(?:/>|>.*?</row>)', re.S)
+_CELL_RE = re.compile(r'<c\b[^>]*?\br="([A-Z]+)(\d+)"[^>]*?(?:/>|>.*?</c>)', re.S)
+# [신규] 위치(r) 속성 유무와 상관없는 여는 태그 (r을 생략한 행/셀 검출용)
+_ROW_TAG_RE = re.compile(r"<row\b[^>]*>")
+_CELL_TAG_RE = re.compile(r"<c\b[^>]*>")
+_STYLE_RE = re.compile(r'\bs="(\d+)"')
+_SPANS_RE = re.compile(r'\s+spans="[^"]*"')
+_DIMENSION_RE = re.compile(r'<dimension ref="([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?"\s*/>')
+_ILLEGAL_XML_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+class PatchNotApplicable(Exception):
+    """부분 저장이 불가능한 경우 (시트 없음, 비표준 XML 등) → 호출 측에서 전체 저장으로 대체"""
+
+
+def col_letter(idx):
+    """1 → A, 27 → AA"""
+    letters = ""
+    while idx > 0:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def col_index(letters):
+    """A → 1, AA → 27"""
+    idx = 0
+    for ch in letters:
+        idx = idx * 26 + (ord(ch) - 64)
+    return idx
+
+
+def cell_xml(ref, value, style=None):
+    """값 하나를 <c> 요소로 직렬화 (문자열은 inlineStr 사용 → sharedStrings 수정 불필요)"""
+    s_attr = f' s="{style}"' if style else ""
+    if is_missing(value):
+        return f'<c r="{ref}"{s_attr}/>' if style else ""
+
+    kind = getattr(getattr(value, "dtype", None), "kind", "")
+    if isinstance(value, bool) or kind == "b":
+        return f'<c r="{ref}"{s_attr} t="b"><v>{int(bool(value))}</v></c>'
+
+    if kind == "M":
+        value = value.astype("datetime64[s]").item()
+    elif isinstance(value, (int, float)) or kind in ("i", "u", "f"):
+        num = float(value)
+        if math.isfinite(num):
+            text = str(int(num)) if num.is_integer() and abs(num) < 1e15 else repr(num)
+            return f'<c r="{ref}"{s_attr}><v>{text}</v></c>'
+        value = str(value)
+
+    if isinstance(value, datetime):
+        value = value.strftime("%Y-%m-%d") if value.time() == datetime.min.time() else value.strftime("%Y-%m-%d %H:%M:%S")
+    elif isinstance(value, date):
+        value = value.strftime("%Y-%m-%d")
+
+    text = _ILLEGAL_XML_RE.sub("", str(value))
+    space = ' xml:space="preserve"' if text != text.strip() or "\n" in text else ""
+    return f'<c r="{ref}"{s_attr} t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>'
+
+
+def row_xml(row_no, cells):
+    """cells: {열 번호(1-base): 값}"""
+    body = "".join(cell_xml(f"{col_letter(c)}{row_no}", v) for c, v in sorted(cells.items()))
+    return f'<row r="{row_no}">{body}</row>'
+
+
+def _positioned(pattern, tag_pattern, xml, what):
+    """r 속성이 있는 요소 목록. r을 생략한 요소(앞 요소 다음 위치로 해석됨)가 있으면 부분 저장 불가"""
+    matches = list(pattern.finditer(xml))
+    if len(matches) != len(tag_pattern.findall(xml)):
+        raise PatchNotApplicable(f"위치(r) 속성이 없는 {what}이 있습니다.")
+    return matches
+
+
+def _row_cells(row_text):
+    return _positioned(_CELL_RE, _CELL_TAG_RE, row_text, "셀")
+
+
+def _patch_row(row_text, row_no, updates):
+    """기존 <row> 요소에 셀 변경 사항을 병합"""
+    if row_text.endswith("/>"):
+        open_tag, inner = row_text[:-2].rstrip() + ">", ""
+    else:
+        close = row_text.index(">") + 1
+        open_tag, inner = row_text[:close], row_text[close:-len("</row>")]
+    open_tag = _SPANS_RE.sub("", open_tag)
+
+    merged = {}
+    for m in _row_cells(inner):
+        merged[col_index(m.group(1))] = m.group(0)
+
+    for c, value in updates.items():
+        old = merged.get(c)
+        style = None
+        if old:
+            style_m = _STYLE_RE.search(old[:old.index(">")])
+            style = style_m.group(1) if style_m else None
+        merged[c] = cell_xml(f"{col_letter(c)}{row_no}", value, style)
+
+    return open_tag + "".join(merged[c] for c in sorted(merged)) + "</row>"
+
+
+def _split_sheet_data(xml):
+    """(sheetData 앞, sheetData 내용, sheetData 뒤)로 분리"""
+    empty_tag = "<sheetData/>"
+    pos = xml.find(empty_tag)
+    if pos >= 0:
+        return xml[:pos] + "<sheetData>", "", "</sheetData>" + xml[pos + len(empty_tag):]
+
+    start = xml.find("<sheetData>")
+    end = xml.rfind("</sheetData>")
+    if start < 0 or end < 0:
+        raise PatchNotApplicable("sheetData 요소를 찾을 수 없습니다.")
+    start += len("<sheetData>")
+    return xml[:start], xml[start:end], xml[end:]
+
+
+def _update_dimension(xml, max_row, max_col):
+    m = _DIMENSION_RE.search(xml)
+    if not m:
+        return xml
+    old_col = col_index(m.group(3) or m.group(1))
+    old_row = int(m.group(4) or m.group(2))
+    new_ref = f"A1:{col_letter(max(old_col, max_col))}{max(old_row, max_row)}"
+    return xml[:m.start()] + f'<dimension ref="{new_ref}"/>' + xml[m.end():]
+
+
+def patch_sheet_xml(xml, header, row_updates):
+    """시트 XML에 행 단위 변경 사항 적용
+
+    row_updates: {엑셀 행 번호: {열 번호: 값}} (없는 행은 새로 삽입)
+    header: 컬럼명 리스트. 1행에 없는 헤더 셀은 함께 추가한다.
+    """
+    head, inner, tail = _split_sheet_data(xml)
+    if not row_updates:
+        return xml
+
+    used_cols = {c for cells in row_updates.values() for c in cells}
+    max_col = max(used_cols) if used_cols else 1
+
+    # 빠른 경로: 모든 변경이 마지막 행 뒤에 추가되는 경우 (로그 append)
+    last_pos = inner.rfind("<row")
+    last_row = 0
+    if last_pos >= 0:
+        m = _ROW_RE.match(inner, last_pos)
+        if not m:
+            raise PatchNotApplicable("행 구조를 해석할 수 없습니다.")
+        last_row = int(m.group(1))
+
+    # 추가되는 열이 1행(헤더)에 없으면 느린 경로에서 헤더 셀도 함께 추가
+    header_complete = False
+    first_pos = inner.find("<row")
+    if first_pos >= 0:
+        m = _ROW_RE.match(inner, first_pos)
+        if m and m.group(1) == "1":
+            existing = {col_index(c.group(1)) for c in _row_cells(m.group(0))}
+            header_complete = used_cols <= existing
+
+    if min(row_updates) > last_row and header_complete:
+        new_inner = inner + "".join(row_xml(r, row_updates[r]) for r in sorted(row_updates))
+    else:
+        updates = dict(row_updates)
+        header_cells = {c: header[c - 1] for c in used_cols if c - 1 < len(header)}
+        parts = []
+        pending = sorted(updates)
+        idx = 0
+        seen_header = False
+        for m in _positioned(_ROW_RE, _ROW_TAG_RE, inner, "행"):
+            r = int(m.group(1))
+            while idx < len(pending) and pending[idx] < r:
+                parts.append(row_xml(pending[idx], updates[pending[idx]]))
+                idx += 1
+            if r == 1:
+                seen_header = True
+                existing = {col_index(c.group(1)) for c in _row_cells(m.group(0))}
+                missing = {c: v for c, v in header_cells.items() if c not in existing}
+                if missing:
+                    updates[1] = {**missing, **updates.get(1, {})}
+            if r in updates:
+                parts.append(_patch_row(m.group(0), r, updates[r]))
+                if idx < len(pending) and pending[idx] == r:
+                    idx += 1
+            else:
+                parts.append(m.group(0))
+        parts.extend(row_xml(r, updates[r]) for r in pending[idx:])
+        if not seen_header and header_cells:
+            parts.insert(0, row_xml(1, header_cells))
+        new_inner = "".join(parts)
+
+    max_row = max(max(row_updates), last_row)
+    return _update_dimension(head, max_row, max_col) + new_inner + tail
+
+
+def rewrite_sheet_xml(xml, header, rows):
+    """sheetData 전체를 교체 (행 삭제/재정렬 시). 시트 서식 등 나머지 XML은 유지"""
+    head, _inner, tail = _split_sheet_data(xml)
+    parts = [row_xml(1, {i + 1: v for i, v in enumerate(header)})]
+    for i, values in enumerate(rows):
+        parts.append(row_xml(i + 2, {c + 1: v for c, v in enumerate(values)}))
+    head = _DIMENSION_RE.sub(f'<dimension ref="A1:{col_letter(max(len(header), 1))}{len(rows) + 1}"/>', head)
+    return head + "".join(parts) + tail
+
+
+def _sheet_parts(zin):
+    """시트 이름 → zip 내부 XML 파트 경로"""
+    try:
+        workbook = ElementTree.fromstring(zin.read("xl/workbook.xml"))
+        rels = ElementTree.fromstring(zin.read("xl/_rels/workbook.xml.rels"))
+    except (KeyError, ElementTree.ParseError) as e:
+        raise PatchNotApplicable(f"워크북 구조를 읽을 수 없습니다: {e}")
+
+    targets = {}
+    for rel in rels.iter(f"{{{_NS_PKG_REL}}}Relationship"):
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            path = target.lstrip("/")
+        else:
+            path = posixpath.normpath(posixpath.join("xl", target))
+        targets[rel.get("Id")] = path
+
+    parts = {}
+    for sheet in workbook.iter(f"{{{_NS_MAIN}}}sheet"):
+        rid = sheet.get(f"{{{_NS_DOC_REL}}}id")
+        if rid in targets:
+            parts[sheet.get("name")] = targets[rid]
+    return parts
+
+
+def sheet_updates_from_diff(diff):
+    """FrameDiff(0-base 위치) → {엑셀 행: {엑셀 열: 값}} (1행은 헤더)"""
+    updates = {}
+    for pos, cells in diff.cells.items():
+        updates[pos + 2] = {c + 1: v for c, v in cells.items()}
+    for i, values in enumerate(diff.appended):
+        updates[diff.append_at + i + 2] = {c + 1: v for c, v in enumerate(values)}
+    return updates
+
+
+def write_patched_workbook(src_path, dest_path, sheet_diffs):
+    """src_path 워크북에 sheet_diffs를 반영한 새 워크북을 dest_path에 저장 (원본은 수정하지 않음)"""
+    try:
+        zin = zipfile.ZipFile(src_path)
+    except zipfile.BadZipFile as e:
+        raise PatchNotApplicable(f"xlsx 형식이 아닙니다: {e}")
+
+    with zin, zipfile.ZipFile(dest_path, "w", zipfile.ZIP_DEFLATED) as zout:
+        parts = _sheet_parts(zin)
+        missing = [name for name in sheet_diffs if name not in parts]
+        if missing:
+            raise PatchNotApplicable(f"시트가 없습니다: {', '.join(missing)}")
+        part_to_sheet = {parts[name]: name for name in sheet_diffs}
+
+        for info in zin.infolist():
+            data = zin.read(info.filename)
+            sheet_name = part_to_sheet.get(info.filename)
+            if sheet_name:
+                diff = sheet_diffs[sheet_name]
+                xml = data.decode("utf-8")
+                header = [str(c) for c in diff.columns]
+                if diff.rewrite:
+                    xml = rewrite_sheet_xml(xml, header, diff.rows)
+                else:
+                    xml = patch_sheet_xml(xml, header, sheet_updates_from_diff(diff))
+                data = xml.encode("utf-8")
+            zout.writestr(info, data)
@@ -0,0 +1,178 @@
+import html
+import re
+import zipfile
+from xml.etree import ElementTree
+
+import pandas as pd
+
+from .xlsx_patch import _CELL_RE, _NS_MAIN, _ROW_RE, _sheet_parts, col_index
+
+# ==========================================
+# [Tail Reader] xlsx 시트 끝부분만 읽기
+# ==========================================
+# 로그처럼 끝에만 추가되는 시트에서 최근 몇 행만 필요할 때,
+# 시트 전체를 파싱하지 않고 XML 문자열 끝에서부터 <row> 요소만 잘라 해석한다.
+# (공유 문자열은 필요한 번호까지만 읽음. 날짜 서식 숫자는 변환하지 않음 → 앱이 쓰는 날짜는 모두 문자열)
+
+_TYPE_RE = re.compile(r'\bt="(\w+)"')
+_VALUE_RE = re.compile(r"<v>(.*?)</v>", re.S)
+_TEXT_RE = re.compile(r"<t\b[^>]*?(?:/>|>(.*?)</t>)", re.S)
+
+
+def _read_sheet_xml(zin, sheet_name):
+    parts = _sheet_parts(zin)
+    if sheet_name not in parts:
+        return None
+    return zin.read(parts[sheet_name]).decode("utf-8")
+
+
+def _last_row_elements(xml, n):
+    """시트 XML 끝에서부터 <row> 요소 n개 (앞에서부터의 순서로)"""
+    if n <= 0:
+        return []
+    end = xml.rfind("</sheetData>")
+    pos = end if end >= 0 else len(xml)
+    for _ in range(n):
+        found = xml.rfind("<row ", 0, pos)
+        if found < 0:
+            break
+        pos = found
+    return [m.group(0) for m in _ROW_RE.finditer(xml, pos, end if end >= 0 else len(xml))]
+
+
+def _row_no(row_text):
+    m = _ROW_RE.match(row_text)
+    return int(m.group(1)) if m else 0
+
+
+def _header_row(xml):
+    """1행(헤더) <row> 요소. 없으면 None"""
+    first = xml.find("<row ")
+    m = _ROW_RE.match(xml, first) if first >= 0 else None
+    return m.group(0) if m and m.group(1) == "1" else None
+
+
+def _raw_cells(row_text):
+    """<row> 요소 → [(열 번호, 타입, 내용)]"""
+    cells = []
+    for m in _CELL_RE.finditer(row_text):
+        text = m.group(0)
+        close = text.index(">")
+        type_m = _TYPE_RE.search(text[:close])
+        cells.append((col_index(m.group(1)), type_m.group(1) if type_m else "n", text))
+    return cells
+
+
+def _shared_strings(zin, needed):
+    """공유 문자열 번호 → 문자열 (needed 중 가장 큰 번호까지만 읽음)"""
+    if not needed:
+        return {}
+    try:
+        stream = zin.open("xl/sharedStrings.xml")
+    except KeyError:
+        return {}
+
+    last = max(needed)
+    strings = {}
+    idx = 0
+    with stream:
+        for _event, elem in ElementTree.iterparse(stream):
+            if elem.tag != f"{{{_NS_MAIN}}}si":
+                continue
+            if idx in needed:
+                strings[idx] = "".join(t.text or "" for t in elem.iter(f"{{{_NS_MAIN}}}t"))
+            elem.clear()
+            if idx >= last:
+                break
+            idx += 1
+    return strings
+
+
+def _cell_value(kind, text, strings):
+    if kind == "inlineStr":
+        return html.unescape("".join(t or "" for t in _TEXT_RE.findall(text)))
+
+    value_m = _VALUE_RE.search(text)
+    if not value_m:
+        return None
+    raw = html.unescape(value_m.group(1))
+    if kind == "s":
+        return strings.get(int(raw))
+    if kind == "b":
+        return raw == "1"
+    if kind in ("str", "e"):
+        return raw
+    try:
+        num = float(raw)
+    except ValueError:
+        return raw
+    return int(num) if num.is_integer() else num
+
+
+def _rows_to_frame(zin, header_row, data_rows):
+    header_cells = _raw_cells(header_row) if header_row else []
+    data_cells = [_raw_cells(r) for r in data_rows]
+
+    needed = {int(_VALUE_RE.search(t).group(1)) for cells in [header_cells] + data_cells
+              for _c, kind, t in cells if kind == "s" and _VALUE_RE.search(t)}
+    strings = _shared_strings(zin, needed)
+
+    header = {c: _cell_value(kind, t, strings) for c, kind, t in header_cells}
+    width = max([max(header, default=0)] + [max((c for c, _k, _t in cells), default=0) for cells in data_cells])
+    columns = [header.get(c, f"Unnamed: {c - 1}") for c in range(1, width + 1)]
+
+    records = []
+    for cells in data_cells:
+        values = [None] * width
+        for c, kind, t in cells:
+            values[c - 1] = _cell_value(kind, t, strings)
+        records.append(values)
+    return pd.DataFrame(records, columns=columns)
+
+
+def read_sheet_tail(path, sheet_name, n):
+    """시트의 헤더 + 마지막 n개 행 DataFrame. 시트가 없으면 None"""
+    with zipfile.ZipFile(path) as zin:
+        xml = _read_sheet_xml(zin, sheet_name)
+        if xml is None:
+            return None
+        header_row = _header_row(xml)
+        data_rows = [r for r in _last_row_elements(xml, n) if _row_no(r) > 1]
+        return _rows_to_frame(zin, header_row, data_rows)
+
+
+def sheet_layout(path, sheet_name):
+    """(헤더 컬럼 리스트, 데이터 행 수). 시트가 없으면 None
+
+    행 수는 마지막 <row> 요소의 행 번호 기준 (새 행을 덧붙일 위치 계산용)
+    """
+    with zipfile.ZipFile(path) as zin:
+        xml = _read_sheet_xml(zin, sheet_name)
+        if xml is None:
+            return None
+        last = _last_row_elements(xml, 1)
+        row_count = max(_row_no(last[0]) - 1, 0) if last else 0
+        header_row = _header_row(xml)
+        if header_row is None:
+            return [], row_count
+        return list(_rows_to_frame(zin, header_row, []).columns), row_count
+
+
+def sheet_fingerprints(path, sheet_names):
+    """{시트 이름: 지문} — zip 목록(central directory)의 CRC/크기만 사용하므로 시트를 압축 해제하지 않음
+
+    공유 문자열 / 스타일 파트가 바뀌면 모든 시트의 값 해석이 달라질 수 있으므로 지문에 함께 포함한다.
+    없는 시트는 None
+    """
+    with zipfile.ZipFile(path) as zin:
+        parts = _sheet_parts(zin)
+        infos = {info.filename: info for info in zin.infolist()}
+        shared = tuple(
+            (infos[name].CRC, infos[name].file_size) if name in infos else None
+            for name in ("xl/sharedStrings.xml", "xl/styles.xml")
+        )
+        fingerprints = {}
+        for sheet_name in sheet_names:
+            info = infos.get(parts.get(sheet_name))
+            fingerprints[sheet_name] = (info.CRC, info.file_size) + shared if info else None
+    return fingerprints
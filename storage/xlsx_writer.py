@@ -0,0 +1,127 @@
+import zipfile
+from xml.sax.saxutils import quoteattr
+
+from .xlsx_patch import cell_xml, col_letter, row_xml
+
+# ==========================================
+# [Stream Writer] xlsx 전체 저장 (스트리밍)
+# ==========================================
+# 워크북 구성 파트(XML)를 직접 만들고, 시트 행은 일정 개수씩 문자열로 만들어
+# zip 항목에 바로 흘려 쓴다. 셀 객체를 메모리에 모아두지 않으므로
+# Log 시트가 커져도 메모리 사용량이 일정하다.
+# (셀 직렬화는 부분 저장(xlsx_patch)과 동일: 문자열은 inlineStr, 날짜는 문자열)
+
+ROWS_PER_CHUNK = 1000
+
+_NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_TYPE_BASE = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+_REL_BASE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+_XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+# 0: 기본 / 1: 헤더 (굵게)
+_STYLES_XML = (
+    _XML_DECL
+    + f'<styleSheet xmlns="{_NS_MAIN}">'
+    '<fonts count="2"><font><sz val="11"/><name val="맑은 고딕"/><family val="3"/></font>'
+    '<font><b/><sz val="11"/><name val="맑은 고딕"/><family val="3"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+_HEADER_STYLE = 1
+
+
+def _content_types_xml(n_sheets):
+    overrides = "".join(
+        f'<Override PartName="/xl/worksheets/sheet{i}.xml" ContentType="{_TYPE_BASE}.worksheet+xml"/>'
+        for i in range(1, n_sheets + 1)
+    )
+    return (
+        _XML_DECL
+        + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        f'<Override PartName="/xl/workbook.xml" ContentType="{_TYPE_BASE}.sheet.main+xml"/>'
+        f'<Override PartName="/xl/styles.xml" ContentType="{_TYPE_BASE}.styles+xml"/>'
+        + overrides
+        + "</Types>"
+    )
+
+
+def _root_rels_xml():
+    return (
+        _XML_DECL
+        + f'<Relationships xmlns="{_NS_PKG_REL}">'
+        f'<Relationship Id="rId1" Type="{_REL_BASE}/officeDocument" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    )
+
+
+def _workbook_xml(sheet_names):
+    sheets = "".join(
+        f'<sheet name={quoteattr(name)} sheetId="{i}" r:id="rId{i}"/>'
+        for i, name in enumerate(sheet_names, start=1)
+    )
+    return (
+        _XML_DECL
+        + f'<workbook xmlns="{_NS_MAIN}" xmlns:r="{_NS_REL}">'
+        f"<sheets>{sheets}</sheets></workbook>"
+    )
+
+
+def _workbook_rels_xml(n_sheets):
+    rels = "".join(
+        f'<Relationship Id="rId{i}" Type="{_REL_BASE}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+        for i in range(1, n_sheets + 1)
+    )
+    styles_id = n_sheets + 1
+    return (
+        _XML_DECL
+        + f'<Relationships xmlns="{_NS_PKG_REL}">'
+        + rels
+        + f'<Relationship Id="rId{styles_id}" Type="{_REL_BASE}/styles" Target="styles.xml"/>'
+        "</Relationships>"
+    )
+
+
+def _write_sheet(stream, frame):
+    """시트 XML을 ROWS_PER_CHUNK 행씩 만들어 stream에 기록"""
+    columns = [str(c) for c in frame.columns]
+    last_ref = f"{col_letter(max(len(columns), 1))}{len(frame) + 1}"
+    header = "".join(cell_xml(f"{col_letter(i + 1)}1", name, _HEADER_STYLE) for i, name in enumerate(columns))
+    stream.write((
+        _XML_DECL
+        + f'<worksheet xmlns="{_NS_MAIN}"><dimension ref="A1:{last_ref}"/>'
+        f'<sheetData><row r="1">{header}</row>'
+    ).encode("utf-8"))
+
+    chunk = []
+    for i, values in enumerate(frame.itertuples(index=False, name=None)):
+        chunk.append(row_xml(i + 2, {c + 1: v for c, v in enumerate(values)}))
+        if len(chunk) >= ROWS_PER_CHUNK:
+            stream.write("".join(chunk).encode("utf-8"))
+            chunk = []
+    if chunk:
+        stream.write("".join(chunk).encode("utf-8"))
+    stream.write(b"</sheetData></worksheet>")
+
+
+def write_workbook(path, frames):
+    """{시트 이름: DataFrame}을 하나의 xlsx로 저장 (시트 순서 = frames 순서)"""
+    sheet_names = list(frames)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zout:
+        zout.writestr("[Content_Types].xml", _content_types_xml(len(sheet_names)))
+        zout.writestr("_rels/.rels", _root_rels_xml())
+        zout.writestr("xl/workbook.xml", _workbook_xml(sheet_names))
+        zout.writestr("xl/_rels/workbook.xml.rels", _workbook_rels_xml(len(sheet_names)))
+        zout.writestr("xl/styles.xml", _STYLES_XML)
+        for i, name in enumerate(sheet_names, start=1):
+            with zout.open(f"xl/worksheets/sheet{i}.xml", "w", force_zip64=True) as stream:
+                _write_sheet(stream, frames[name])
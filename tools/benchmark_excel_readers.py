@@ -0,0 +1,150 @@
+"""엑셀 읽기 엔진 벤치마크
+
+사용법:
+    python tools/benchmark_excel_readers.py                 # 우리 워크북 구조로 만든 임시 파일 (Data 10,000행)
+    python tools/benchmark_excel_readers.py 생산요청.xlsx     # 실제 파일
+    python tools/benchmark_excel_readers.py --rows 20000 --repeat 5
+    python tools/benchmark_excel_readers.py --parallel      # 병렬 로드(시트별 프로세스)도 측정
+
+사용 가능한 엔진마다 전체 시트를 읽는 시간을 재고,
+결과가 기본 엔진(openpyxl)과 완전히 같은지(값 / dtype / 컬럼) 확인한다.
+--parallel: 기본 엔진(auto)으로 병렬 로드 시간과 시트별 파싱 시간을 함께 출력
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from storage import available_engines, read_excel_sheets, read_sheets_parallel, shutdown_pool, write_excel_file
+from storage.parallel_reader import default_workers
+
+
+def make_workbook(path, rows):
+    """Data 시트 rows행 + 로그/메모/시리얼 시트를 가진 테스트 워크북 생성"""
+    rng = random.Random(0)
+    base = datetime(2025, 1, 1)
+    statuses = ["생산 접수", "생산중", "대기", "중지", "완료"]
+
+    data = []
+    for i in range(rows):
+        req_date = base + timedelta(days=rng.randint(0, 365))
+        data.append({
+            "번호": f"EX{2500 + i // 50}-{i % 50:03d}",
+            "업체명": f"업체{rng.randint(1, 300)}",
+            "모델명": f"CG{rng.randint(100, 999)}IP",
+            "상세": "상세 설명" if rng.random() < 0.7 else None,
+            "수량": rng.randint(1, 20) if rng.random() < 0.95 else None,
+            "기타요청사항": "요청" if rng.random() < 0.3 else None,
+            "업체별 특이사항": None,
+            "출고요청일": req_date,
+            "출고예정일": (req_date + timedelta(days=3)).strftime("%Y-%m-%d") if rng.random() < 0.6 else None,
+            "출고일": None,
+            "시리얼번호": f"N{rng.randint(10**9, 10**10)}" if rng.random() < 0.4 else None,
+            "렌즈업체": None,
+            "생산팀 메모": None,
+            "Status": rng.choice(statuses),
+            "파일경로": rf"C:\PDF\요청서_{i}.pdf",
+            "대기사유": None,
+        })
+    data_df = pd.DataFrame(data, columns=Config.COLUMNS)
+
+    log_df = pd.DataFrame(
+        [[(base + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S"), "user", "일정 변경", f"번호[{i}] 변경"]
+         for i in range(rows * 2)],
+        columns=Config.LOG_COLUMNS
+    )
+    frames = {
+        Config.SHEET_DATA: data_df,
+        Config.SHEET_LOG: log_df,
+        Config.SHEET_MEMO: pd.DataFrame(columns=Config.MEMO_COLUMNS),
+        Config.SHEET_MEMO_LOG: pd.DataFrame(columns=Config.MEMO_LOG_COLUMNS),
+        Config.SHEET_SERIAL: pd.DataFrame(columns=Config.SERIAL_COLUMNS),
+    }
+    write_excel_file(path, frames)
+
+
+def same_frame(a, b):
+    return list(a.columns) == list(b.columns) and a.dtypes.equals(b.dtypes) and a.equals(b)
+
+
+def benchmark_parallel(path, sheets, repeat, results):
+    """병렬 로드 (auto 엔진) — 풀 시작 비용을 빼기 위해 한 번 먼저 실행한 뒤 측정"""
+    read_sheets_parallel(path, sheets)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        frames, timings = read_sheets_parallel(path, sheets)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best[0]:
+            best = (elapsed, frames, timings)
+    shutdown_pool()
+
+    elapsed, frames, timings = best
+    sequential = results[available_engines()[0]]
+    same = all((name in frames) == (name in sequential) and (name not in frames or same_frame(frames[name], sequential[name]))
+               for name in sheets)
+    print(f"\n병렬 로드 (작업 프로세스 {default_workers()}개): {elapsed:.3f}초  결과 일치 {'O' if same else 'X'}")
+    for name, sheet_elapsed in sorted(timings.items(), key=lambda item: -item[1]):
+        print(f"  {name:<14}{sheet_elapsed:>8.3f}초")
+    print(f"  가장 큰 시트 대비 {elapsed / max(timings.values()):.2f}배")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엑셀 읽기 엔진 벤치마크")
+    parser.add_argument("path", nargs="?", help="측정할 xlsx 파일 (없으면 임시 파일 생성)")
+    parser.add_argument("--rows", type=int, default=10000, help="임시 파일의 Data 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="엔진별 반복 횟수 (최소 시간 사용)")
+    parser.add_argument("--parallel", action="store_true", help="병렬 로드도 측정")
+    args = parser.parse_args()
+
+    path = args.path
+    tmp_dir = None
+    if not path:
+        tmp_dir = tempfile.mkdtemp(prefix="reader_bench_")
+        path = os.path.join(tmp_dir, "bench.xlsx")
+        print(f"테스트 워크북 생성 중... (Data {args.rows}행)")
+        make_workbook(path, args.rows)
+
+    sheets = list(Config.SHEET_KEYS.values())
+    results = {}
+    timings = {}
+    for engine in available_engines():
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            frames = read_excel_sheets(path, sheets, engine)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[engine] = frames
+        timings[engine] = best
+
+    baseline = results["openpyxl"]
+    print(f"\n파일: {path}")
+    print(f"{'엔진':<12}{'시간(초)':>10}{'배속':>8}  결과 일치")
+    for engine, elapsed in timings.items():
+        frames = results[engine]
+        same = all(
+            (name in frames) == (name in baseline) and (name not in frames or same_frame(frames[name], baseline[name]))
+            for name in sheets
+        )
+        speedup = timings["openpyxl"] / elapsed if elapsed else float("inf")
+        print(f"{engine:<12}{elapsed:>10.3f}{speedup:>7.1f}x  {'O' if same else 'X'}")
+
+    if args.parallel:
+        benchmark_parallel(path, sheets, args.repeat, results)
+
+    if tmp_dir:
+        os.remove(path)
+        os.rmdir(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
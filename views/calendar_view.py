@@ -1,10 +1,12 @@
 import tkinter as tk
 from datetime import datetime, timedelta
-from tkinter import messagebox
+from tkinter import messagebox, simpledialog
 
 import customtkinter as ctk
 import pandas as pd
 
+from frame_schema import DATE_FORMAT, display_text
+from request_index import canonical_req_no
 # [수정] FONT_FAMILY 추가
 from styles import COLORS, FONT_FAMILY, FONTS
 
@@ -17,6 +19,11 @@ class CalendarView(ctk.CTkFrame):
 
         self.base_date = datetime.now()
 
+        # [신규] 변경 이벤트에서 영향받은 칸만 다시 그리기 위한 참조
+        self.day_cells = {}        # { 'YYYY-MM-DD': cell_frame }
+        self.day_req_nos = {}      # { 'YYYY-MM-DD': {정규화된 번호} }
+        self.sidebar_req_nos = set()
+
         self.drag_data = {
             "item": None, "req_no": None, "text": None, "window": None, "origin_date": None
         }
@@ -92,15 +99,17 @@ class CalendarView(ctk.CTkFrame):
     def update_sidebar(self):
         for widget in self.hold_scroll.winfo_children(): widget.destroy()
         for widget in self.waiting_scroll.winfo_children(): widget.destroy()
+        self.sidebar_req_nos = set()
 
         df = self.dm.df
         if df.empty: return
 
-        status_series = df['Status'].fillna('').astype(str).str.strip()
+        status_series = df['Status']
         hold_df = df[status_series.isin(['Hold', '중지'])].copy()
         self._fill_sidebar_list(self.hold_scroll, hold_df)
         waiting_df = df[status_series == '대기'].copy()
         self._fill_sidebar_list(self.waiting_scroll, waiting_df)
+        self.sidebar_req_nos = set(pd.concat([hold_df['번호'], waiting_df['번호']]).map(canonical_req_no))
 
     def _fill_sidebar_list(self, parent_frame, target_df):
         if target_df.empty:
@@ -112,9 +121,9 @@ class CalendarView(ctk.CTkFrame):
 
         for _, row in target_df.iterrows():
             req_no = row.get("번호")
-            curr_company = str(row.get('업체명', '-'))
-            model = str(row.get('모델명', '-'))
-            qty = str(row.get('수량', '0'))
+            curr_company = display_text(row.get('업체명'))
+            model = display_text(row.get('모델명'))
+            qty = display_text(row.get('수량'))
             
             if curr_company != last_company:
                 if last_company is not None:
@@ -129,13 +138,34 @@ class CalendarView(ctk.CTkFrame):
 
             self._bind_item_events(item_label, req_no, None, item_text, is_header=False)
 
+    def _visible_days(self):
+        """현재 화면의 28일 (일요일 시작)"""
+        offset = (self.base_date.weekday() + 1) % 7
+        start_date = self.base_date - timedelta(days=offset)
+        return [start_date + timedelta(days=i) for i in range(28)]
+
+    def _collect_events(self, calendar_days):
+        """{ 'YYYY-MM-DD': [레코드] } — 기간 내 출고예정 (중지/대기/완료 제외)"""
+        df = self.dm.df
+        events = {}
+        if not df.empty and '출고예정일' in df.columns:
+            # [수정] 출고예정일은 datetime64 → 문자열 변환 없이 기간 비교, 기간 안의 행만 날짜 문자열로
+            start = pd.Timestamp(calendar_days[0].date())
+            end = pd.Timestamp(calendar_days[-1].date())
+            mask = df['출고예정일'].between(start, end) & (~df['Status'].isin(['Hold', '중지', '대기', '완료']))
+            df_filtered = df.loc[mask]
+            if not df_filtered.empty:
+                keys = df_filtered['출고예정일'].dt.strftime(DATE_FORMAT)
+                events = {date: group.to_dict('records') for date, group in df_filtered.groupby(keys)}
+        return events
+
     def update_calendar(self):
         for widget in self.calendar_frame.winfo_children(): widget.destroy()
+        self.day_cells = {}
+        self.day_req_nos = {}
 
-        offset = (self.base_date.weekday() + 1) % 7
-        start_date = self.base_date - timedelta(days=offset)
-        calendar_days = [start_date + timedelta(days=i) for i in range(28)]
-        end_date = calendar_days[-1]
+        calendar_days = self._visible_days()
+        start_date, end_date = calendar_days[0], calendar_days[-1]
 
         self.period_label.configure(text=f"{start_date.strftime('%Y.%m.%d')} ~ {end_date.strftime('%Y.%m.%d')}")
 
@@ -147,17 +177,18 @@ class CalendarView(ctk.CTkFrame):
             ctk.CTkLabel(self.calendar_frame, text=day, font=FONTS["main_bold"], text_color=text_color).grid(row=0, column=i, padx=5, pady=5, sticky="nsew")
 
         for i in range(7): self.calendar_frame.grid_columnconfigure(i, weight=1, uniform="days")
+        self.calendar_frame.grid_columnconfigure(7, weight=0)
 
-        df = self.dm.df
-        events = {}
-        if not df.empty and '출고예정일' in df.columns:
-            s_date_str = start_date.strftime("%Y-%m-%d")
-            e_date_str = end_date.strftime("%Y-%m-%d")
-            status_series = df['Status'].fillna('').astype(str).str.strip()
-            mask = (df['출고예정일'] >= s_date_str) & (df['출고예정일'] <= e_date_str) & (~status_series.isin(['Hold', '중지', '대기', '완료']))
-            df_filtered = df.loc[mask].copy()
-            if not df_filtered.empty:
-                events = {date: group.to_dict('records') for date, group in df_filtered.groupby('출고예정일')}
+        # [신규] 주 단위 일정 일괄 이동 버튼 (각 주 오른쪽)
+        for week in range(4):
+            week_dates = [d.strftime("%Y-%m-%d") for d in calendar_days[week * 7:(week + 1) * 7]]
+            ctk.CTkButton(
+                self.calendar_frame, text="⇥", width=24, height=24,
+                fg_color=COLORS["bg_medium"], hover_color=COLORS["primary_hover"], text_color=COLORS["text"],
+                font=FONTS["small"], command=lambda dates=week_dates: self.shift_week(dates)
+            ).grid(row=week + 1, column=7, padx=(2, 4))
+
+        events = self._collect_events(calendar_days)
 
         for i, current_day_date in enumerate(calendar_days):
             r, c = (i // 7) + 1, i % 7
@@ -168,6 +199,7 @@ class CalendarView(ctk.CTkFrame):
             
             date_str = current_day_date.strftime("%Y-%m-%d")
             cell_frame.target_date = date_str 
+            cell_frame.event_frame = None
             
             if date_str == datetime.now().strftime("%Y-%m-%d"):
                 cell_frame.configure(fg_color=COLORS["bg_medium"], border_color=COLORS["success"], border_width=2)
@@ -180,49 +212,107 @@ class CalendarView(ctk.CTkFrame):
             if c == 0: day_color = COLORS["danger"] 
             elif c == 6: day_color = COLORS["primary"] 
             
-            display_text = str(day_num)
-            if day_num == 1 or i == 0: display_text = f"{current_day_date.month}/{current_day_date.day}"
+            day_text = str(day_num)
+            if day_num == 1 or i == 0: day_text = f"{current_day_date.month}/{current_day_date.day}"
             
             # [수정] 폰트 적용
-            ctk.CTkLabel(cell_frame, text=display_text, font=FONTS["small"], text_color=day_color).grid(row=0, column=0, sticky="nw", padx=5, pady=(2, 0))
+            ctk.CTkLabel(cell_frame, text=day_text, font=FONTS["small"], text_color=day_color).grid(row=0, column=0, sticky="nw", padx=5, pady=(2, 0))
+
+            self.day_cells[date_str] = cell_frame
+            self._fill_day(date_str, events.get(date_str, []))
+
+    # [신규] 한 주의 출고예정 일정을 한 번에 이동 (한 번의 저장)
+    def shift_week(self, week_dates):
+        req_nos = []
+        for date_str in week_dates:
+            for req_no in sorted(self.day_req_nos.get(date_str, ())):
+                if req_no not in req_nos: req_nos.append(req_no)
+        if not req_nos:
+            messagebox.showinfo("주간 일정 이동", "이 주에는 출고예정 일정이 없습니다.")
+            return
+
+        days = simpledialog.askinteger(
+            "주간 일정 이동",
+            f"{week_dates[0]} ~ {week_dates[-1]} 일정 {len(req_nos)}건을 며칠 미룰까요?\n(음수를 입력하면 앞당김)",
+            initialvalue=7, parent=self
+        )
+        if not days: return
+
+        def done(success, msg):
+            if not success: messagebox.showerror("주간 일정 이동", msg)
+        self.dm.run_async(self.dm.shift_expected_dates, req_nos, days, callback=done, label="일괄 저장 중...")
+
+    def _fill_day(self, date_str, day_records):
+        """날짜 칸의 일정 목록을 (다시) 그림"""
+        cell_frame = self.day_cells[date_str]
+        if cell_frame.event_frame is not None:
+            cell_frame.event_frame.destroy()
+            cell_frame.event_frame = None
+        self.day_req_nos[date_str] = {canonical_req_no(rec.get("번호")) for rec in day_records}
+        if not day_records: return
+
+        event_scroll_frame = ctk.CTkScrollableFrame(cell_frame, fg_color="transparent")
+        event_scroll_frame.grid(row=1, column=0, sticky='nsew', padx=1, pady=(0, 2))
+        event_scroll_frame._scrollbar.grid_forget() 
+        cell_frame.event_frame = event_scroll_frame
+        
+        grouped_events = {}
+        for rec in day_records:
+            r_no = rec.get("번호")
+            if r_no not in grouped_events: grouped_events[r_no] = []
+            grouped_events[r_no].append(rec)
+        
+        sorted_req_nos = sorted(grouped_events.keys(), key=lambda r: display_text(grouped_events[r][0]['업체명']))
+        
+        for r_no in sorted_req_nos:
+            group = grouped_events[r_no]
+            first_item = group[0]
+            comp_name = display_text(first_item['업체명'])
+            origin_date = date_str
+            
+            header_text = f"• [{comp_name}]"
+            # [수정] 폰트 적용
+            header_label = ctk.CTkLabel(event_scroll_frame, text=header_text, font=(FONT_FAMILY, 10, "bold"), anchor="w", height=14, text_color=COLORS["primary"], fg_color="transparent")
+            header_label.pack(fill="x", pady=(2, 0), padx=1)
             
-            if date_str in events:
-                event_scroll_frame = ctk.CTkScrollableFrame(cell_frame, fg_color="transparent")
-                event_scroll_frame.grid(row=1, column=0, sticky='nsew', padx=1, pady=(0, 2))
-                event_scroll_frame._scrollbar.grid_forget() 
-                
-                day_records = events[date_str]
-                grouped_events = {}
-                for rec in day_records:
-                    r_no = rec.get("번호")
-                    if r_no not in grouped_events: grouped_events[r_no] = []
-                    grouped_events[r_no].append(rec)
-                
-                sorted_req_nos = sorted(grouped_events.keys(), key=lambda r: str(grouped_events[r][0]['업체명']))
-                
-                for r_no in sorted_req_nos:
-                    group = grouped_events[r_no]
-                    first_item = group[0]
-                    comp_name = str(first_item['업체명'])
-                    origin_date = first_item.get("출고예정일")
-                    
-                    header_text = f"• [{comp_name}]"
-                    # [수정] 폰트 적용
-                    header_label = ctk.CTkLabel(event_scroll_frame, text=header_text, font=(FONT_FAMILY, 10, "bold"), anchor="w", height=14, text_color=COLORS["primary"], fg_color="transparent")
-                    header_label.pack(fill="x", pady=(2, 0), padx=1)
-                    
-                    drag_text_header = f"[{r_no}] {comp_name} ({len(group)} items)"
-                    self._bind_item_events(header_label, r_no, origin_date, drag_text_header, is_header=True)
-                    
-                    for item in group:
-                        model_name = str(item['모델명'])
-                        qty = item['수량']
-                        item_text = f"   - {model_name} ({qty})"
-                        # [수정] 폰트 적용
-                        item_label = ctk.CTkLabel(event_scroll_frame, text=item_text, font=(FONT_FAMILY, 9), anchor="w", height=12, text_color=COLORS["text"], fg_color="transparent")
-                        item_label.pack(fill="x", pady=0, padx=1)
-                        drag_text_item = f"[{r_no}] {comp_name} - {model_name}"
-                        self._bind_item_events(item_label, r_no, origin_date, drag_text_item, is_header=False)
+            drag_text_header = f"[{r_no}] {comp_name} ({len(group)} items)"
+            self._bind_item_events(header_label, r_no, origin_date, drag_text_header, is_header=True)
+            
+            for item in group:
+                model_name = display_text(item['모델명'])
+                qty = display_text(item['수량'])
+                item_text = f"   - {model_name} ({qty})"
+                # [수정] 폰트 적용
+                item_label = ctk.CTkLabel(event_scroll_frame, text=item_text, font=(FONT_FAMILY, 9), anchor="w", height=12, text_color=COLORS["text"], fg_color="transparent")
+                item_label.pack(fill="x", pady=0, padx=1)
+                drag_text_item = f"[{r_no}] {comp_name} - {model_name}"
+                self._bind_item_events(item_label, r_no, origin_date, drag_text_item, is_header=False)
+
+    # [신규] 변경 이벤트 반영
+    # 바뀐 요청이 이전에 있던 날짜 칸과 지금 속한 날짜 칸만 다시 그리고,
+    # 중지/대기 목록은 바뀐 요청이 목록에 있었거나 새로 들어갈 때만 다시 그린다.
+    def apply_changes(self, change_set):
+        if change_set.full or not self.day_cells:
+            self.update_view()
+            return
+        affected = change_set.requests
+        if not affected: return
+
+        events = self._collect_events(self._visible_days())
+        for date_str in self.day_cells:
+            day_records = events.get(date_str, [])
+            was_here = bool(self.day_req_nos.get(date_str, set()) & affected)
+            is_here = any(canonical_req_no(rec.get("번호")) in affected for rec in day_records)
+            if was_here or is_here:
+                self._fill_day(date_str, day_records)
+
+        df = self.dm.df
+        if self.sidebar_req_nos & affected:
+            self.update_sidebar()
+        elif not df.empty:
+            in_sidebar = df.loc[df['Status'].isin(['Hold', '중지', '대기']), '번호'].map(canonical_req_no)
+            if not set(in_sidebar).isdisjoint(affected):
+                self.update_sidebar()
 
     def _bind_item_events(self, widget, req_no, origin_date, drag_text, is_header):
         widget.bind("<Button-1>", lambda e, r=req_no, d=origin_date, t=drag_text, w=widget: self.start_drag(e, r, d, t, w))
@@ -281,18 +371,19 @@ class CalendarView(ctk.CTkFrame):
             req_no = self.drag_data["req_no"]
             origin_date = self.drag_data["origin_date"]
 
+            # [수정] 화면에 먼저 반영하고 연속 이동은 모아서 한 번에 저장 (write_behind)
+            # 성공 시 화면 갱신은 변경 이벤트(apply_changes)로 처리, 콜백은 저장 실패만 알림
+            def done(success, msg):
+                if not success: messagebox.showerror("이동 실패", msg)
+
             if origin_date is None: 
                 if target_date and req_no:
-                    success, msg = self.dm.update_production_schedule(req_no, target_date)
-                    if success: self.update_view()
-                    else: messagebox.showerror("이동 실패", msg)
+                    self.dm.write_behind(self.dm.update_production_schedule, req_no, target_date, callback=done)
             else: 
                 if is_hold_list and req_no:
-                    success, msg = self.dm.update_status_to_hold(req_no)
-                    if success: self.update_view()
+                    self.dm.write_behind(self.dm.update_status_to_hold, req_no, callback=done)
                 elif is_waiting_list and req_no:
-                    success, msg = self.dm.update_status_to_waiting(req_no)
-                    if success: self.update_view()
+                    self.dm.write_behind(self.dm.update_status_to_waiting, req_no, callback=done)
                 else:
                     new_date = None
                     if target_date: new_date = target_date
@@ -305,11 +396,10 @@ class CalendarView(ctk.CTkFrame):
                         except: pass
 
                     if new_date and req_no and new_date != origin_date:
-                        success, msg = self.dm.update_expected_date(req_no, new_date)
-                        if success:
-                            if is_next_btn: self.next_weeks()
-                            elif is_prev_btn: self.prev_weeks()
-                            else: self.update_view()
+                        self.dm.write_behind(self.dm.update_expected_date, req_no, new_date, callback=done)
+                        # 메모리에는 바로 반영되므로 저장을 기다리지 않고 이동한 주로 넘김
+                        if is_next_btn: self.next_weeks()
+                        elif is_prev_btn: self.prev_weeks()
         
         self.drag_data = {"item": None, "req_no": None, "origin_date": None, "text": None, "window": None}
         self.drag_started = False
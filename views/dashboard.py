@@ -8,6 +8,7 @@ import pandas as pd
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from config import Config
+from frame_schema import display_text
 from styles import COLORS, FONT_FAMILY, FONTS, get_color_str
 
 
@@ -235,7 +236,7 @@ class DashboardView(ctk.CTkFrame):
         self.today_count_lbl.configure(text="0건")
 
     def _update_summary_cards(self, df):
-        status_series = df["Status"].fillna("").astype(str).str.strip()
+        status_series = df["Status"]
 
         # 1. 진행 중 (대기, 생산중)
         active_count = len(df[status_series.isin(["생산중", "생산 접수"])])
@@ -249,13 +250,11 @@ class DashboardView(ctk.CTkFrame):
         # 4. 이번달 완료
         completed_count = 0
         if "출고일" in df.columns:
-            try:
-                dates = pd.to_datetime(df["출고일"], errors="coerce", format="mixed")
-                now = datetime.now()
-                mask = (dates.dt.year == now.year) & (dates.dt.month == now.month) & (status_series == "완료")
-                completed_count = len(df[mask])
-            except Exception:
-                pass
+            # 출고일은 datetime64 (메모리 스키마) → 다시 파싱하지 않음
+            dates = df["출고일"]
+            now = datetime.now()
+            mask = (dates.dt.year == now.year) & (dates.dt.month == now.month) & (status_series == "완료")
+            completed_count = int(mask.sum())
 
         counts = [active_count, waiting_count, hold_count, completed_count]
         for lbl, val in zip(self.card_widgets, counts):
@@ -266,9 +265,10 @@ class DashboardView(ctk.CTkFrame):
             self.canvas.get_tk_widget().destroy()
             self.canvas = None
 
-        status_series = df["Status"].fillna("").astype(str).str.strip()
-        filtered_df = df[status_series != "완료"]
+        filtered_df = df[df["Status"] != "완료"]
         status_counts = filtered_df["Status"].value_counts()
+        # 범주형은 값이 없는 범주도 0건으로 나오므로 제외
+        status_counts = status_counts[status_counts > 0]
 
         if status_counts.empty:
             return
@@ -323,10 +323,8 @@ class DashboardView(ctk.CTkFrame):
             self.today_count_lbl.configure(text="0건")
             return
 
-        today_str = datetime.now().strftime("%Y-%m-%d")
-
-        status_series = df["Status"].fillna("").astype(str).str.strip()
-        mask = (df["출고예정일"].astype(str) == today_str) & (~status_series.isin(["완료", "중지"]))
+        today = pd.Timestamp(datetime.now().date())
+        mask = (df["출고예정일"] == today) & (~df["Status"].isin(["완료", "중지"]))
         today_df = df[mask]
 
         self.today_count_lbl.configure(text=f"{len(today_df)}건")
@@ -347,7 +345,8 @@ class DashboardView(ctk.CTkFrame):
         for widget in self.log_scroll.winfo_children():
             widget.destroy()
 
-        if not hasattr(self.dm, "memo_log_df") or self.dm.memo_log_df.empty:
+        logs = self.dm.get_recent_memo_logs(10)
+        if logs.empty:
             ctk.CTkLabel(
                 self.log_scroll,
                 text="최근 활동 없음",
@@ -356,8 +355,6 @@ class DashboardView(ctk.CTkFrame):
             ).pack(pady=20)
             return
 
-        logs = self.dm.memo_log_df.sort_values(by="일시", ascending=False).head(10)
-
         for _, row in logs.iterrows():
             self._create_list_item(self.log_scroll, row, is_log=True)
 
@@ -404,9 +401,9 @@ class DashboardView(ctk.CTkFrame):
             ).pack(side="right", padx=10)
 
         else:
-            comp = row_data.get("업체명", "-")
-            model = row_data.get("모델명", "-")
-            qty = row_data.get("수량", "-")
+            comp = display_text(row_data.get("업체명"))
+            model = display_text(row_data.get("모델명"))
+            qty = display_text(row_data.get("수량"))
 
             ctk.CTkLabel(
                 card,
@@ -80,26 +80,21 @@ class GanttView(ctk.CTkFrame):
 
     def _process_data_for_gantt(self, df):
         """간트 차트용 데이터 가공"""
-        # 1. 사본 생성
-        temp_df = df.copy()
-        
-        # 2. 날짜 형식 변환 (errors='coerce' -> 실패시 NaT)
-        temp_df['start_date'] = pd.to_datetime(temp_df['출고요청일'], errors='coerce')
-        temp_df['end_date'] = pd.to_datetime(temp_df['출고예정일'], errors='coerce')
-        
-        # 3. 필터링
-        temp_df['Status'] = temp_df['Status'].astype(str).str.strip()
-        
+        # 1. 필터링 (Status는 범주형, 날짜는 datetime64 → 변환 없이 바로 비교)
         # 생산중인 항목만 표시 (조건 완화 가능)
-        mask_producing = temp_df['Status'] == '생산중'
+        mask_producing = df['Status'] == '생산중'
         # 날짜가 있는 항목만 (시작일 필수)
-        mask_dates = temp_df['start_date'].notna()
+        mask_dates = df['출고요청일'].notna()
         
-        active_df = temp_df[mask_producing & mask_dates].copy()
+        # 2. 대상 행만 사본 생성
+        active_df = df[mask_producing & mask_dates].copy()
         
         if active_df.empty:
             return active_df
 
+        active_df['start_date'] = active_df['출고요청일']
+        active_df['end_date'] = active_df['출고예정일']
+
         # 종료일이 없으면 시작일로 채움 (최소 1일 표시를 위해)
         mask_no_end = active_df['end_date'].isna()
         active_df.loc[mask_no_end, 'end_date'] = active_df.loc[mask_no_end, 'start_date']
@@ -120,7 +115,7 @@ class GanttView(ctk.CTkFrame):
         }
         
         # 그룹화 수행
-        grouped_df = active_df.groupby(group_cols, as_index=False).agg(agg_dict)
+        grouped_df = active_df.groupby(group_cols, as_index=False, observed=True).agg(agg_dict)
         
         # 4. 기간 계산 (matplotlib barh용 width)
         grouped_df['duration'] = (grouped_df['end_date'] - grouped_df['start_date']).dt.days
@@ -133,7 +128,7 @@ class GanttView(ctk.CTkFrame):
         try:
             grouped_df['sort_helper'] = pd.to_numeric(grouped_df['번호'])
         except:
-            grouped_df['sort_helper'] = grouped_df['번호'].astype(str)
+            grouped_df['sort_helper'] = grouped_df['번호']
             
         grouped_df = grouped_df.sort_values(by='sort_helper', ascending=False)
         
@@ -5,6 +5,8 @@ from tkinter import messagebox
 import customtkinter as ctk
 import pandas as pd
 
+from frame_schema import display_text
+from request_index import canonical_req_no
 from styles import COLORS, FONT_FAMILY, FONTS
 
 
@@ -25,7 +27,7 @@ class KanbanView(ctk.CTkFrame):
         
         # UI 요소 저장소
         self.column_frames = {}  # { "상태명": scrollable_frame }
-        self.cards = {}          # { req_no: card_widget }
+        self.cards = {}          # { 정규화된 번호: (상태, card_widget) }
 
         # 드래그 앤 드롭 상태
         self.drag_data = {
@@ -77,6 +79,14 @@ class KanbanView(ctk.CTkFrame):
             
             count_badge = ctk.CTkLabel(header, text="0", width=24, height=24, fg_color=COLORS["bg_medium"], corner_radius=12, font=(FONT_FAMILY, 10, "bold"), text_color=COLORS["text"])
             count_badge.pack(side="right")
+
+            # [신규] 열 전체 일괄 중지 (한 번의 저장)
+            if status in ("대기", "생산중"):
+                ctk.CTkButton(
+                    header, text="⏸", width=24, height=24, corner_radius=12,
+                    fg_color=COLORS["bg_medium"], hover_color=COLORS["danger_hover"], text_color=COLORS["text"],
+                    font=(FONT_FAMILY, 10), command=lambda s=status: self.hold_column(s)
+                ).pack(side="right", padx=(0, 5))
             
             scroll_frame = ctk.CTkScrollableFrame(col_container, fg_color="transparent")
             scroll_frame.pack(fill="both", expand=True, padx=5, pady=5)
@@ -91,46 +101,100 @@ class KanbanView(ctk.CTkFrame):
         df = self.dm.df
         if df.empty: return
 
-        for status in self.column_frames:
-            for widget in self.column_frames[status]["frame"].winfo_children():
-                widget.destroy()
-
-        status_series = df['Status'].fillna('').astype(str).str.strip()
-        
+        status_series = df['Status']
         for status in self.columns.keys():
-            target_df = pd.DataFrame()
-            if status == "중지":
-                target_df = df[status_series.isin(['Hold','중지'])].copy()
+            self._rebuild_column(status, df, status_series)
+
+    def _column_df(self, status, df, status_series):
+        """열(상태)에 표시할 행 (번호 내림차순, 완료는 최근 10건)"""
+        target_df = pd.DataFrame()
+        if status == "중지":
+            target_df = df[status_series.isin(['Hold','중지'])].copy()
+        else:
+            target_df = df[status_series == status].copy()
+        
+        if not target_df.empty:
+            # 기본적으로 번호 내림차순(최신순) 정렬
+            if "번호" in target_df.columns:
+                # 번호 컬럼을 숫자로 변환하여 정렬
+                target_df["_sort_helper"] = pd.to_numeric(target_df["번호"], errors='coerce')
+                target_df = target_df.sort_values(by="_sort_helper", ascending=False)
+                
+                # [핵심 수정] "완료" 상태인 경우 상위 10건만 유지
+                if status == "완료":
+                    # 중복된 번호를 제거한 후 상위 10개 번호 추출
+                    unique_nos = target_df["번호"].unique()
+                    if len(unique_nos) > 10:
+                        top_10_nos = unique_nos[:10]
+                        target_df = target_df[target_df["번호"].isin(top_10_nos)]
+        return target_df
+
+    def _rebuild_column(self, status, df, status_series):
+        """열 하나를 다시 그림"""
+        for widget in self.column_frames[status]["frame"].winfo_children():
+            widget.destroy()
+        self.cards = {req_no: entry for req_no, entry in self.cards.items() if entry[0] != status}
+
+        target_df = self._column_df(status, df, status_series)
+        unique_groups = target_df['번호'].unique() if "번호" in target_df.columns else []
+        count = len(unique_groups)
+        
+        # 배지에 개수 표시 (완료인 경우 '10+' 등으로 표시할 수도 있음)
+        badge_text = str(count)
+        if status == "완료" and count == 10: # 정확히 10개라면 실제로는 더 있을 수 있음
+             # 전체 완료 건수를 따로 계산해서 보여줄 수도 있지만, 여기선 화면 표시 개수로 통일
+             pass
+
+        self.column_frames[status]["badge"].configure(text=badge_text)
+
+        self.create_cards(status, target_df)
+
+    def _column_of(self, status):
+        """Status 값 → 칸반 열 이름 (표시하지 않는 상태면 None)"""
+        status = str(status).strip()
+        if status == "Hold": status = "중지"
+        return status if status in self.columns else None
+
+    # [신규] 변경 이벤트 반영
+    # 상태가 그대로인 요청은 카드만 새로 만들어 같은 자리에 끼워 넣고,
+    # 상태가 바뀌었거나 추가/삭제된 요청은 이전/새 상태의 열만 다시 그린다.
+    def apply_changes(self, change_set):
+        df = self.dm.df
+        if change_set.full or df.empty:
+            self.refresh_data()
+            return
+        affected = change_set.requests | change_set.memos
+        if not affected: return
+
+        req_keys = df['번호'].map(canonical_req_no)
+        groups = {req_no: group for req_no, group in df[req_keys.isin(affected)].groupby(req_keys[req_keys.isin(affected)], sort=False)}
+
+        dirty_columns = set()
+        patches = []
+        for req_no in affected:
+            old_status, old_card = self.cards.get(req_no, (None, None))
+            group_df = groups.get(req_no)
+            new_status = self._column_of(group_df.iloc[0]['Status']) if group_df is not None else None
+
+            if old_status == new_status:
+                if old_card is not None:
+                    patches.append((req_no, new_status, group_df, old_card))
             else:
-                target_df = df[status_series == status].copy()
-            
-            if not target_df.empty:
-                # 기본적으로 번호 내림차순(최신순) 정렬
-                if "번호" in target_df.columns:
-                    # 번호 컬럼을 숫자로 변환하여 정렬
-                    target_df["_sort_helper"] = pd.to_numeric(target_df["번호"], errors='coerce')
-                    target_df = target_df.sort_values(by="_sort_helper", ascending=False)
-                    
-                    # [핵심 수정] "완료" 상태인 경우 상위 10건만 유지
-                    if status == "완료":
-                        # 중복된 번호를 제거한 후 상위 10개 번호 추출
-                        unique_nos = target_df["번호"].unique()
-                        if len(unique_nos) > 10:
-                            top_10_nos = unique_nos[:10]
-                            target_df = target_df[target_df["번호"].isin(top_10_nos)]
-
-            unique_groups = target_df['번호'].unique() if "번호" in target_df.columns else []
-            count = len(unique_groups)
-            
-            # 배지에 개수 표시 (완료인 경우 '10+' 등으로 표시할 수도 있음)
-            badge_text = str(count)
-            if status == "완료" and count == 10: # 정확히 10개라면 실제로는 더 있을 수 있음
-                 # 전체 완료 건수를 따로 계산해서 보여줄 수도 있지만, 여기선 화면 표시 개수로 통일
-                 pass
-
-            self.column_frames[status]["badge"].configure(text=badge_text)
-
-            self.create_cards(status, target_df)
+                dirty_columns.update(s for s in (old_status, new_status) if s is not None)
+
+        if dirty_columns:
+            status_series = df['Status']
+            for status in self.columns.keys():
+                if status in dirty_columns:
+                    self._rebuild_column(status, df, status_series)
+
+        memo_counts = self.dm.get_unchecked_memo_counts()
+        for req_no, status, group_df, old_card in patches:
+            if status in dirty_columns: continue
+            parent = self.column_frames[status]["frame"]
+            card = self._create_card(parent, status, group_df.iloc[0]['번호'], group_df, memo_counts, before=old_card)
+            old_card.destroy()
+            self.cards[req_no] = (status, card)
 
     def create_cards(self, status, df):
         parent = self.column_frames[status]["frame"]
@@ -138,54 +202,68 @@ class KanbanView(ctk.CTkFrame):
 
         # df는 이미 정렬된 상태임 (refresh_data에서 처리)
         unique_req_nos = df['번호'].unique() # pandas unique는 출현 순서 유지
+        memo_counts = self.dm.get_unchecked_memo_counts()
 
         for req_no in unique_req_nos:
             group_df = df[df['번호'] == req_no]
             if group_df.empty: continue
-
-            first_row = group_df.iloc[0]
-            comp = str(first_row['업체명'])
-            date = str(first_row['출고예정일']) if pd.notna(first_row['출고예정일']) else "-"
-            if status == "생산 접수": date = str(first_row['출고요청일'])
-            if status == "완료": date = str(first_row['출고일']) # 완료일 경우 출고일 표시
-
-            card = ctk.CTkFrame(parent, fg_color=COLORS["bg_medium"], corner_radius=6, border_width=1, border_color=COLORS["border"])
+            card = self._create_card(parent, status, req_no, group_df, memo_counts)
+            # [신규] 변경 이벤트에서 카드만 교체할 수 있도록 보관
+            self.cards[canonical_req_no(req_no)] = (status, card)
+
+    def _create_card(self, parent, status, req_no, group_df, memo_counts, before=None):
+        first_row = group_df.iloc[0]
+        comp = display_text(first_row['업체명'])
+        date = display_text(first_row['출고예정일'])
+        if status == "생산 접수": date = display_text(first_row['출고요청일'])
+        if status == "완료": date = display_text(first_row['출고일']) # 완료일 경우 출고일 표시
+
+        card = ctk.CTkFrame(parent, fg_color=COLORS["bg_medium"], corner_radius=6, border_width=1, border_color=COLORS["border"])
+        if before is not None:
+            card.pack(fill="x", pady=4, padx=2, before=before)
+        else:
             card.pack(fill="x", pady=4, padx=2)
-            
-            top_row = ctk.CTkFrame(card, fg_color="transparent", height=20)
-            top_row.pack(fill="x", padx=8, pady=(8, 2))
-            
-            ctk.CTkLabel(top_row, text=comp, font=(FONT_FAMILY, 11, "bold"), text_color=COLORS["primary"]).pack(side="left")
-            
-            item_count = len(group_df)
-            count_text = f"{item_count}종" if item_count > 1 else "1종"
-            ctk.CTkLabel(top_row, text=count_text, font=(FONT_FAMILY, 10), text_color=COLORS["text_dim"]).pack(side="right")
-            
-            mid_row = ctk.CTkFrame(card, fg_color="transparent")
-            mid_row.pack(fill="x", padx=8, pady=2)
-            
-            for _, row in group_df.iterrows():
-                model = str(row['모델명'])
-                qty = str(row['수량'])
-                item_text = f"• {model} ({qty})"
-                ctk.CTkLabel(mid_row, text=item_text, font=(FONT_FAMILY, 11), text_color=COLORS["text"], wraplength=180, justify="left", anchor="w").pack(fill="x", anchor="w")
-            
-            bot_row = ctk.CTkFrame(card, fg_color="transparent")
-            bot_row.pack(fill="x", padx=8, pady=(5, 8))
-            ctk.CTkLabel(bot_row, text=f"No.{req_no}", font=(FONT_FAMILY, 10), text_color=COLORS["text_dim"]).pack(side="left")
-            
-            date_color = COLORS["text_dim"]
-            if status == "생산중": date_color = COLORS["success"]
-            ctk.CTkLabel(bot_row, text=date, font=(FONT_FAMILY, 10), text_color=date_color).pack(side="right")
+        
+        top_row = ctk.CTkFrame(card, fg_color="transparent", height=20)
+        top_row.pack(fill="x", padx=8, pady=(8, 2))
+        
+        ctk.CTkLabel(top_row, text=comp, font=(FONT_FAMILY, 11, "bold"), text_color=COLORS["primary"]).pack(side="left")
+        
+        item_count = len(group_df)
+        count_text = f"{item_count}종" if item_count > 1 else "1종"
+        ctk.CTkLabel(top_row, text=count_text, font=(FONT_FAMILY, 10), text_color=COLORS["text_dim"]).pack(side="right")
+        
+        mid_row = ctk.CTkFrame(card, fg_color="transparent")
+        mid_row.pack(fill="x", padx=8, pady=2)
+        
+        for _, row in group_df.iterrows():
+            model = display_text(row['모델명'])
+            qty = display_text(row['수량'])
+            item_text = f"• {model} ({qty})"
+            ctk.CTkLabel(mid_row, text=item_text, font=(FONT_FAMILY, 11), text_color=COLORS["text"], wraplength=180, justify="left", anchor="w").pack(fill="x", anchor="w")
+        
+        bot_row = ctk.CTkFrame(card, fg_color="transparent")
+        bot_row.pack(fill="x", padx=8, pady=(5, 8))
+        ctk.CTkLabel(bot_row, text=f"No.{req_no}", font=(FONT_FAMILY, 10), text_color=COLORS["text_dim"]).pack(side="left")
+
+        # [신규] 미확인 메모 수 표시
+        unchecked_count = memo_counts.get(canonical_req_no(req_no), 0)
+        if unchecked_count > 0:
+            ctk.CTkLabel(bot_row, text=f"💬{unchecked_count}", font=(FONT_FAMILY, 10, "bold"), text_color=COLORS["warning"]).pack(side="left", padx=(5, 0))
+        
+        date_color = COLORS["text_dim"]
+        if status == "생산중": date_color = COLORS["success"]
+        ctk.CTkLabel(bot_row, text=date, font=(FONT_FAMILY, 10), text_color=date_color).pack(side="right")
 
-            drag_text = f"[{req_no}] {comp} ({item_count}종)"
-            widgets_to_bind = [card, top_row, mid_row, bot_row] + top_row.winfo_children() + mid_row.winfo_children() + bot_row.winfo_children()
-            
-            for w in widgets_to_bind:
-                w.bind("<Button-1>", lambda e, r=req_no, s=status, t=drag_text, w_item=card: self.start_drag(e, r, s, t, w_item))
-                w.bind("<B1-Motion>", self.do_drag)
-                w.bind("<ButtonRelease-1>", self.stop_drag)
-                w.bind("<Double-1>", lambda e, r=req_no: self.on_card_double_click(r))
+        drag_text = f"[{req_no}] {comp} ({item_count}종)"
+        widgets_to_bind = [card, top_row, mid_row, bot_row] + top_row.winfo_children() + mid_row.winfo_children() + bot_row.winfo_children()
+        
+        for w in widgets_to_bind:
+            w.bind("<Button-1>", lambda e, r=req_no, s=status, t=drag_text, w_item=card: self.start_drag(e, r, s, t, w_item))
+            w.bind("<B1-Motion>", self.do_drag)
+            w.bind("<ButtonRelease-1>", self.stop_drag)
+            w.bind("<Double-1>", lambda e, r=req_no: self.on_card_double_click(r))
+        return card
 
     def on_card_double_click(self, req_no):
         status = self.dm.get_status_by_req_no(req_no)
@@ -249,22 +327,30 @@ class KanbanView(ctk.CTkFrame):
             except: break
         return None
 
+    # [신규] 열의 모든 요청을 한 번에 중지
+    def hold_column(self, status):
+        req_nos = [req_no for req_no, (card_status, _) in self.cards.items() if card_status == status]
+        if not req_nos: return
+        if not messagebox.askyesno("일괄 중지", f"[{status}] {len(req_nos)}건을 모두 중지 상태로 변경하시겠습니까?"): return
+
+        def done(success, msg):
+            if not success: messagebox.showerror("일괄 중지", msg)
+        self.dm.run_async(self.dm.hold_requests, req_nos, callback=done, label="일괄 저장 중...")
+
     def handle_status_change(self, req_no, from_status, to_status):
-        success = False
-        msg = ""
+        # [수정] 성공 시 화면 갱신은 변경 이벤트(apply_changes)로 처리
+        def done(success, msg):
+            if not success and msg: messagebox.showerror("실패", msg)
+
+        # [수정] 화면에 먼저 반영하고 연속 이동은 모아서 한 번에 저장 (write_behind)
         if to_status == "완료":
             self.pm.open_complete_popup(req_no)
-            return
         elif to_status == "생산중":
             today = datetime.now().strftime("%Y-%m-%d")
-            success, msg = self.dm.update_production_schedule(req_no, today)
+            self.dm.write_behind(self.dm.update_production_schedule, req_no, today, callback=done)
         elif to_status == "중지":
-            success, msg = self.dm.update_status_to_hold(req_no)
+            self.dm.write_behind(self.dm.update_status_to_hold, req_no, callback=done)
         elif to_status == "대기":
-            success, msg = self.dm.update_status_to_waiting(req_no, reason="칸반 보드 이동")
+            self.dm.write_behind(self.dm.update_status_to_waiting, req_no, "칸반 보드 이동", callback=done)
         elif to_status == "생산 접수":
-            messagebox.showwarning("알림", "생산 접수 상태로 되돌릴 수 없습니다.")
-            return
-
-        if success: self.refresh_data()
-        elif msg: messagebox.showerror("실패", msg)
\ No newline at end of file
+            messagebox.showwarning("알림", "생산 접수 상태로 되돌릴 수 없습니다.")
\ No newline at end of file
@@ -1,14 +1,20 @@
 import tkinter as tk
 from datetime import datetime
-from tkinter import Menu, messagebox, ttk
+from tkinter import Menu, messagebox, simpledialog, ttk
 
 import customtkinter as ctk
 
 from config import Config
+from frame_schema import display_text
 from styles import COLORS, FONT_FAMILY, FONTS, get_color_str
 
 
 class TableView(ctk.CTkFrame):
+    # [신규] 가상 스크롤 설정 (style_treeview의 rowheight와 동일하게 유지)
+    ROW_HEIGHT = 38
+    HEADER_HEIGHT = 40
+    WHEEL_STEP = 3
+
     def __init__(self, parent, data_manager, popup_manager):
         super().__init__(parent, fg_color="transparent")
         self.dm = data_manager
@@ -24,12 +30,23 @@ class TableView(ctk.CTkFrame):
         }
         self.filter_check_vars = {}
 
+        # [신규] 가상 스크롤 상태 (필터 결과 전체 중 view_offset부터 한 화면 분량만 Treeview에 생성)
+        self.view_df = None
+        self.view_keys = []
+        self.view_offset = 0
+        self.header_height = self.HEADER_HEIGHT
+
+        # [신규] 변경분만 갱신하기 위한 상태 (Treeview item id = 행 키 "번호#순서")
+        self.row_hashes = {}
+        self.offscreen_selection = set()
+
         self.create_widgets()
         self.style_treeview()
         
         self.tree.bind("<Double-1>", self.on_double_click)
         # [신규] 우클릭 이벤트 바인딩
         self.tree.bind("<Button-3>", self.on_right_click)
+        self._bind_virtual_scroll()
         
         self.refresh_data()
 
@@ -82,10 +99,10 @@ class TableView(ctk.CTkFrame):
         self.tree_frame = ctk.CTkFrame(self.tree_bg_frame, fg_color="transparent")
         self.tree_frame.pack(fill="both", expand=True, padx=2, pady=2)
 
-        scroll_y = ctk.CTkScrollbar(self.tree_frame, orientation="vertical")
-        self.tree = ttk.Treeview(self.tree_frame, columns=Config.DISPLAY_COLUMNS, show="headings", yscrollcommand=scroll_y.set)
-        scroll_y.configure(command=self.tree.yview)
-        scroll_y.pack(side="right", fill="y", padx=(0, 5), pady=5)
+        # [수정] 스크롤바는 Treeview가 아니라 필터 결과 전체 기준 위치(view_offset)를 제어
+        self.scroll_y = ctk.CTkScrollbar(self.tree_frame, orientation="vertical", command=self._on_scrollbar)
+        self.tree = ttk.Treeview(self.tree_frame, columns=Config.DISPLAY_COLUMNS, show="headings")
+        self.scroll_y.pack(side="right", fill="y", padx=(0, 5), pady=5)
         self.tree.pack(fill="both", expand=True, padx=5, pady=5)
 
         for col in Config.DISPLAY_COLUMNS:
@@ -108,7 +125,18 @@ class TableView(ctk.CTkFrame):
 
     def refresh_data(self):
         self.style_treeview()
-
+        self._reload_rows()
+
+    # [신규] 변경 이벤트 반영 (화면에 영향을 주는 변경이 있을 때만 다시 필터링, 행은 바뀐 것만 갱신)
+    def apply_changes(self, change_set):
+        if not (change_set.full or change_set.added or change_set.removed or change_set.memos):
+            # 표시/검색/정렬/색상에 쓰지 않는 컬럼만 바뀌었으면 그대로 둠
+            used = set(Config.DISPLAY_COLUMNS) | set(Config.SEARCH_TARGET_COLS) | {"Status", "출고요청일", self.sort_col}
+            if not (change_set.columns & used):
+                return
+        self._reload_rows()
+
+    def _reload_rows(self):
         selected_statuses = [s for s, active in self.filter_states.items() if active]
         keyword = self.search_entry.get().strip()
         
@@ -117,33 +145,163 @@ class TableView(ctk.CTkFrame):
             sort_by=self.sort_col, ascending=not self.sort_desc
         )
         
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        today_str = datetime.now().strftime("%Y-%m-%d")
-
-        if filtered_df is not None and not filtered_df.empty:
-            for _, row in filtered_df.iterrows():
-                values = list(row[col] for col in Config.DISPLAY_COLUMNS)
-                status = row['Status']
-                req_date = str(row['출고요청일'])
-                req_no = row['번호'] 
-                
-                all_memos = self.dm.get_memos(req_no)
-                unchecked_count = sum(1 for m in all_memos if str(m.get('확인', 'N')) != 'Y')
-                
-                if unchecked_count > 0:
-                    values[0] = f"{values[0]} ({unchecked_count})"
-
-                row_tags = [status]
-                
-                if req_date == today_str:
-                    row_tags.append("today")
-                
-                self.tree.insert("", "end", values=values, tags=tuple(row_tags))
+        # [수정] 전체를 다시 넣지 않고 필터 결과만 보관 → 화면에 보이는 행만 생성
+        top_key = self.view_keys[self.view_offset] if self.view_offset < len(self.view_keys) else None
+        self.view_df = filtered_df
+        self.view_keys = self._row_keys(filtered_df)
+
+        # 맨 위에 보이던 행이 그대로 있으면 그 행 기준으로 스크롤 위치 유지
+        if top_key is not None:
+            try: self.view_offset = self.view_keys.index(top_key)
+            except ValueError: pass
+        self._scroll_to(self.view_offset, force=True)
         
         self.update_dashboard(filtered_df)
 
+    # ---------------------------------------------------------
+    # [신규] 가상 스크롤
+    # ---------------------------------------------------------
+    def _bind_virtual_scroll(self):
+        self.tree.bind("<Configure>", lambda e: self._scroll_to(self.view_offset, force=True))
+        self.tree.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-self.WHEEL_STEP))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(self.WHEEL_STEP))
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self._move_selection(-self._page_size()))
+        self.tree.bind("<Next>", lambda e: self._move_selection(self._page_size()))
+        self.tree.bind("<Home>", lambda e: self._move_selection(-self._total_rows()))
+        self.tree.bind("<End>", lambda e: self._move_selection(self._total_rows()))
+
+    def _total_rows(self):
+        return 0 if self.view_df is None else len(self.view_df)
+
+    def _page_size(self):
+        """Treeview 높이에 완전히 들어가는 행 수"""
+        height = self.tree.winfo_height()
+        children = self.tree.get_children()
+        if children:
+            bbox = self.tree.bbox(children[0])
+            if bbox: self.header_height = bbox[1]
+        return max(1, (height - self.header_height) // self.ROW_HEIGHT)
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self._scroll_to(int(round(float(value) * self._total_rows())))
+        elif action == "scroll":
+            step = self._page_size() if unit == "pages" else 1
+            self._scroll_by(int(value) * step)
+
+    def _on_mouse_wheel(self, event):
+        direction = -1 if event.delta > 0 else 1
+        return self._scroll_by(direction * self.WHEEL_STEP)
+
+    def _scroll_by(self, delta):
+        self._scroll_to(self.view_offset + delta)
+        return "break"
+
+    def _scroll_to(self, offset, force=False):
+        max_offset = max(0, self._total_rows() - self._page_size())
+        offset = min(max(0, offset), max_offset)
+        if offset == self.view_offset and not force:
+            return
+        self.view_offset = offset
+        self._render_window()
+
+    def _row_keys(self, df):
+        """행 키 목록 "번호#순서" (같은 번호의 품목은 원래 행 순서대로 1, 2, ...)"""
+        if df is None or df.empty:
+            return []
+        req_nos = df["번호"]  # 메모리 스키마에서 이미 정규화된 문자열
+        ordinals = df.index.to_series().groupby(req_nos.values).rank(method="first").astype(int)
+        return (req_nos + "#" + ordinals.astype(str)).tolist()
+
+    def _render_window(self):
+        """view_offset부터 한 화면 분량의 행을 표시 (값/태그가 바뀐 행만 갱신)"""
+        total = self._total_rows()
+        start = self.view_offset
+        end = min(total, start + self._page_size())
+        window_keys = self.view_keys[start:end]
+
+        # 화면 밖으로 스크롤된 선택 행도 기억해 두었다가 다시 보이면 선택 복원
+        selected = set(self.tree.selection()) | self.offscreen_selection
+        self.offscreen_selection = selected - set(window_keys)
+
+        window_set = set(window_keys)
+        stale = [item for item in self.tree.get_children() if item not in window_set]
+        if stale:
+            self.tree.delete(*stale)
+            for item in stale: self.row_hashes.pop(item, None)
+
+        if window_keys:
+            today_str = datetime.now().strftime("%Y-%m-%d")
+            # 행마다 메모를 조회하지 않고 미리 계산된 미확인 메모 수 사용
+            memo_counts = self.dm.get_unchecked_memo_counts()
+
+            window = self.view_df.iloc[start:end]
+            for index, (key, row) in enumerate(zip(window_keys, window.to_dict("records"))):
+                values, row_tags = self._row_display(row, memo_counts, today_str)
+                row_hash = hash((tuple(str(v) for v in values), row_tags))
+
+                if key not in self.row_hashes:
+                    self.tree.insert("", index, iid=key, values=values, tags=row_tags)
+                else:
+                    if self.row_hashes[key] != row_hash:
+                        self.tree.item(key, values=values, tags=row_tags)
+                    if self.tree.index(key) != index:
+                        self.tree.move(key, "", index)
+                self.row_hashes[key] = row_hash
+
+            restore = [key for key in window_keys if key in selected]
+            if restore and set(restore) != set(self.tree.selection()):
+                self.tree.selection_set(restore)
+
+        if total:
+            self.scroll_y.set(start / total, end / total)
+        else:
+            self.scroll_y.set(0, 1)
+
+    def _row_display(self, row, memo_counts, today_str):
+        """행 하나의 표시 값과 태그 (상태 색상 / 오늘 요청 / 미확인 메모 수)"""
+        # [수정] 표시 형식(날짜 'YYYY-MM-DD', 빈 값 '-')은 여기서만 적용
+        values = [display_text(row[col]) for col in Config.DISPLAY_COLUMNS]
+        status = str(row['Status'])
+        req_date = display_text(row['출고요청일'])
+        req_no = row['번호'] 
+        
+        unchecked_count = memo_counts.get(req_no, 0)
+        
+        if unchecked_count > 0:
+            values[0] = f"{values[0]} ({unchecked_count})"
+
+        row_tags = [status]
+        
+        if req_date == today_str:
+            row_tags.append("today")
+        return values, tuple(row_tags)
+
+    def _move_selection(self, delta):
+        """키보드 이동 (화면 밖으로 나가면 창을 함께 이동)"""
+        total = self._total_rows()
+        if not total: return "break"
+        items = self.tree.get_children()
+        selected = self.tree.selection()
+        current = self.view_offset + (items.index(selected[0]) if selected and selected[0] in items else 0)
+        target = min(max(0, current + delta), total - 1)
+
+        page = self._page_size()
+        if target < self.view_offset:
+            self._scroll_to(target)
+        elif target >= self.view_offset + page:
+            self._scroll_to(target - page + 1)
+
+        items = self.tree.get_children()
+        index = target - self.view_offset
+        if 0 <= index < len(items):
+            self.tree.selection_set(items[index])
+            self.tree.focus(items[index])
+        return "break"
+
     def update_dashboard(self, df):
         if df is None or df.empty or 'Status' not in df.columns:
             total, waiting, hold = 0, 0, 0
@@ -178,11 +336,21 @@ class TableView(ctk.CTkFrame):
     def on_right_click(self, event):
         item = self.tree.identify_row(event.y)
         if item:
-            self.tree.selection_set(item)
+            # [수정] 여러 행을 선택한 상태에서 선택된 행을 누르면 선택 유지 (일괄 처리용)
+            if item not in self.tree.selection():
+                self.tree.selection_set(item)
+                self.offscreen_selection = set()
             
             # 메뉴 구성 동적 변경 (개발자 모드 여부에 따라)
             self.context_menu.delete(0, "end")
             self.context_menu.add_command(label="상세 보기", command=self.open_detail_from_menu)
+
+            # [신규] 선택한 요청 일괄 처리 (한 번의 저장)
+            count = len(self._selected_req_nos())
+            self.context_menu.add_separator()
+            self.context_menu.add_command(label=f"⛔ 선택 {count}건 중지", command=self.hold_selected)
+            self.context_menu.add_command(label=f"⏳ 선택 {count}건 대기", command=self.wait_selected)
+            self.context_menu.add_command(label=f"📅 선택 {count}건 출고예정일 이동...", command=self.shift_selected)
             
             if self.dm.is_dev_mode:
                 self.context_menu.add_separator()
@@ -190,6 +358,44 @@ class TableView(ctk.CTkFrame):
                 
             self.context_menu.post(event.x_root, event.y_root)
 
+    # [신규] 선택 행 일괄 처리
+    def _selected_req_nos(self):
+        """선택한 행(화면 밖으로 스크롤된 선택 포함)의 요청번호 (중복 제거, 화면 순서)"""
+        selected = set(self.tree.selection()) | self.offscreen_selection
+        req_nos = []
+        for key in self.view_keys:
+            if key in selected:
+                req_no = key.rsplit("#", 1)[0]
+                if req_no not in req_nos: req_nos.append(req_no)
+        return req_nos
+
+    def _run_batch(self, func, *args, title="일괄 처리"):
+        def done(success, msg):
+            if success:
+                messagebox.showinfo(title, msg, parent=self)
+            else:
+                messagebox.showerror(title, msg, parent=self)
+        self.dm.run_async(func, *args, callback=done, label="일괄 저장 중...")
+
+    def hold_selected(self):
+        req_nos = self._selected_req_nos()
+        if req_nos and messagebox.askyesno("일괄 중지", f"선택한 {len(req_nos)}건을 중지 상태로 변경하시겠습니까?", parent=self):
+            self._run_batch(self.dm.hold_requests, req_nos, title="일괄 중지")
+
+    def wait_selected(self):
+        req_nos = self._selected_req_nos()
+        if not req_nos: return
+        reason = simpledialog.askstring("일괄 대기", f"선택한 {len(req_nos)}건의 대기 사유를 입력하세요:", parent=self)
+        if reason is None: return
+        self._run_batch(self.dm.set_requests_waiting, req_nos, reason.strip() or "일괄 대기", title="일괄 대기")
+
+    def shift_selected(self):
+        req_nos = self._selected_req_nos()
+        if not req_nos: return
+        days = simpledialog.askinteger("출고예정일 이동", f"선택한 {len(req_nos)}건의 출고예정일을 며칠 미룰까요?\n(음수를 입력하면 앞당김)", parent=self)
+        if not days: return
+        self._run_batch(self.dm.shift_expected_dates, req_nos, days, title="출고예정일 이동")
+
     def open_detail_from_menu(self):
         selected = self.tree.selection()
         if selected:
@@ -208,12 +414,13 @@ class TableView(ctk.CTkFrame):
                                f"정말로 번호 [{req_no}]의 데이터를 영구 삭제하시겠습니까?\n"
                                f"연관된 모든 데이터(Data, Serial, Memo)가 즉시 삭제됩니다.",
                                parent=self):
-            success, msg = self.dm.hard_delete_request(req_no)
-            if success:
-                messagebox.showinfo("성공", "데이터가 영구 삭제되었습니다.", parent=self)
-                self.refresh_data()
-            else:
-                messagebox.showerror("실패", msg, parent=self)
+            def done(success, msg):
+                if success:
+                    # 화면 갱신은 변경 이벤트로 처리됨
+                    messagebox.showinfo("성공", "데이터가 영구 삭제되었습니다.", parent=self)
+                else:
+                    messagebox.showerror("실패", msg, parent=self)
+            self.dm.run_async(self.dm.hard_delete_request, req_no, callback=done, label="삭제 중...")
 
     def open_detail_logic(self, item):
         values = self.tree.item(item, "values")